@@ -2351,6 +2351,12 @@ def _apply_config_mutation(*, target: str, operation: str, arguments: dict) -> d
                 requested = arguments.get("value", arguments.get("enabled", True))
                 value = "true" if bool(requested) else "false"
             os.environ[env_var] = value
+            # Drop cached provider instances too: they may hold a client built with the old value.
+            try:
+                from providers.factory import ProviderFactory
+                ProviderFactory.reset_cache()
+            except Exception as cache_err:
+                logger.warning(f"⚠️ Failed resetting provider cache after setting update: {cache_err}")
             return {"executed": True, "env_var": env_var, "previous": previous, "current": value}
         raise ValueError(f"unsupported setting operation: {operation}")
 
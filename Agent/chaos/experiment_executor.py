@@ -24,9 +24,8 @@ async def reset_environment():
     """Reset environment for a fresh experiment."""
     # Reset telemetry
     monitor = get_session_monitor()
-    monitor.metrics_history = []
-    monitor.consecutive_healthy_turns = 0
-    monitor.in_recovery = False
+    await monitor.flush()
+    monitor.reset()
     
     # Reset guardrails
     reset_chaos_guardrails()
@@ -73,8 +72,10 @@ async def run_turns(router, script, turns, phase, experiment):
         # Check kill switch
         if guardrails.should_stop():
             logger.error(f"🛑 Kill switch triggered during {phase} phase at turn {i+1}")
+            await monitor.flush()
             return False
     
+    await monitor.flush()
     return True
 
 async def run_experiment(router, experiment: Dict) -> Dict:
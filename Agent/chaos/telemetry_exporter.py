@@ -5,6 +5,7 @@ Exports chaos experiment telemetry to JSON reports.
 """
 
 import json
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
@@ -37,15 +38,15 @@ def export_session_metrics(metrics_history: List, experiment_id: str, experiment
         'phases': {
             'baseline': {
                 'turn_count': len(baseline_metrics),
-                'metrics': [vars(m) for m in baseline_metrics]
+                'metrics': [asdict(m) for m in baseline_metrics]
             },
             'chaos': {
                 'turn_count': len(chaos_metrics),
-                'metrics': [vars(m) for m in chaos_metrics]
+                'metrics': [asdict(m) for m in chaos_metrics]
             },
             'recovery': {
                 'turn_count': len(recovery_metrics),
-                'metrics': [vars(m) for m in recovery_metrics]
+                'metrics': [asdict(m) for m in recovery_metrics]
             }
         },
         'analysis': _analyze_degradation(baseline_metrics, chaos_metrics, recovery_metrics)
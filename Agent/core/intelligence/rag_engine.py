@@ -1,5 +1,6 @@
 import logging
 import asyncio
+import threading
 from typing import List, Dict, Any, Optional
 
 print("🔍 DEBUG: RAGEngine - Importing SupabaseManager...")
@@ -63,6 +64,45 @@ class RAGEngine:
             logger.error(f"❌ Failed to add document to RAG: {e}")
             return False
 
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate vector embeddings for several texts in one model call."""
+        if not self.model:
+            logger.warning("⚠️ Embeddings requested but model not loaded. Returning dummy vectors.")
+            return [[0.0] * 384 for _ in texts]
+        return self.model.encode(texts).tolist()
+
+    async def add_documents(self, documents: List[Dict[str, Any]]) -> bool:
+        """
+        Add several document sections with one batched embedding call and one insert.
+        Each item is a dict with "content" and optional "metadata".
+        """
+        if not documents:
+            return True
+        if not self.db.client:
+            return False
+
+        # encode() is CPU-bound; run it off the loop so concurrent batches overlap
+        embeddings = await asyncio.to_thread(
+            self.generate_embeddings, [doc["content"] for doc in documents]
+        )
+        rows = [
+            {
+                "content": doc["content"],
+                "metadata": doc.get("metadata") or {},
+                "embedding": embedding
+            }
+            for doc, embedding in zip(documents, embeddings)
+        ]
+
+        try:
+            result = await asyncio.to_thread(
+                lambda: self.db.client.table("document_sections").insert(rows).execute()
+            )
+            return bool(result)
+        except Exception as e:
+            logger.error(f"❌ Failed to add {len(rows)} documents to RAG: {e}")
+            return False
+
     async def search(self, query: str, threshold: float = 0.5, count: int = 5) -> List[Dict[str, Any]]:
         """Search for relevant documents using semantic similarity."""
         if not self.db.client:
@@ -93,12 +133,16 @@ class RAGEngine:
         context_parts = [r['content'] for r in results]
         return "\n---\n".join(context_parts)
 
-# Singleton instance
+# Singleton instance; the lock keeps a background prefetch thread and the
+# event loop from loading the embedding model twice.
 _rag_engine = None
+_rag_engine_lock = threading.Lock()
 
 def get_rag_engine() -> RAGEngine:
     """Get or initialize the global RAG Engine instance lazily."""
     global _rag_engine
     if _rag_engine is None:
-        _rag_engine = RAGEngine()
+        with _rag_engine_lock:
+            if _rag_engine is None:
+                _rag_engine = RAGEngine()
     return _rag_engine
@@ -1,18 +1,95 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import re
+import time
 
-from tools.system.pc_control import run_shell_command
-
-from core.media.media_models import MediaCommand, MediaResult
+from core.media.media_models import MediaCommand, MediaResult, MediaTrack
 from core.media.providers.base_provider import BaseMediaProvider
 
 logger = logging.getLogger(__name__)
 
+PLAYERCTL_TIMEOUT_S = 30
+
+
+async def _exec_playerctl(*args: str) -> tuple[int, str]:
+    """Run playerctl directly (no shell) without blocking the loop; stderr is appended like run_shell_command."""
+    proc = await asyncio.create_subprocess_exec(
+        "playerctl",
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=PLAYERCTL_TIMEOUT_S)
+    finally:
+        # Timed out or the caller was cancelled: don't leave playerctl running unreaped.
+        if proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+    output = stdout.decode(errors="replace")
+    if stderr:
+        output += f"\nSTDERR:\n{stderr.decode(errors='replace')}"
+    return proc.returncode, output.strip()
+
+
+async def _run_playerctl(*args: str) -> str:
+    """Run playerctl and return its output, ignoring the exit code."""
+    return (await _exec_playerctl(*args))[1]
+
+
+# action -> playerctl argv (after the executable)
+_PLAYERCTL_ARGS: dict[str, tuple[str, ...]] = {
+    "play": ("play",),
+    "pause": ("pause",),
+    "resume": ("play",),
+    "stop": ("stop",),
+    "next": ("next",),
+    "previous": ("previous",),
+    "status": ("status",),
+    "current": ("metadata", "--format", "{{ title }}\t{{ artist }}"),
+}
+# Read-only queries whose output is reused for QUERY_CACHE_TTL_S seconds.
+_QUERY_ACTIONS = frozenset({"status", "current"})
+QUERY_CACHE_TTL_S = 0.5
+# Status playerctl reports after a successful command; seeded into the query
+# cache so a follow-up "status" needs no extra spawn.
+_EXPECTED_STATUS = {"play": "Playing", "resume": "Playing", "pause": "Paused", "stop": "Stopped"}
+# Everything `playerctl status` can print; other command output (warnings,
+# stderr) means the resulting state is unknown and nothing is seeded.
+_PLAYER_STATUSES = frozenset({"Playing", "Paused", "Stopped"})
+
+
+def _parse_current(output: str) -> tuple[str, str]:
+    """Split `metadata --format` output into (title, artist) in one pass."""
+    title, _, artist = output.partition("\n")[0].partition("\t")
+    return title.strip(), artist.strip()
+
+
+# playerctl's reply when no MPRIS player is running (matched without lowercasing the output)
+_NO_PLAYER_RE = re.compile(r"no player could handle this command", re.IGNORECASE)
+
 
 class PlayerctlProvider(BaseMediaProvider):
     name = "playerctl"
 
+    def __init__(self) -> None:
+        # action -> (monotonic timestamp, playerctl output)
+        self._query_cache: dict[str, tuple[float, str]] = {}
+
+    async def _query(self, action: str, args: tuple[str, ...]) -> str:
+        """Run a read-only query, reusing output younger than QUERY_CACHE_TTL_S."""
+        now = time.monotonic()
+        cached = self._query_cache.get(action)
+        if cached is not None and now - cached[0] < QUERY_CACHE_TTL_S:
+            return cached[1]
+        output = await _run_playerctl(*args)
+        self._query_cache[action] = (now, output)
+        return output
+
     async def can_handle(self, command: MediaCommand, user_id: str) -> bool:  # noqa: ARG002
         return command.action in {
             "play",
@@ -29,21 +106,13 @@ class PlayerctlProvider(BaseMediaProvider):
         }
 
     async def execute(self, command: MediaCommand, user_id: str) -> MediaResult:  # noqa: ARG002
-        mapping = {
-            "play": "playerctl play",
-            "pause": "playerctl pause",
-            "resume": "playerctl play",
-            "stop": "playerctl stop",
-            "next": "playerctl next",
-            "previous": "playerctl previous",
-            "status": "playerctl status",
-            "current": "playerctl metadata --format '{{ title }} - {{ artist }}'",
-        }
-        shell_cmd = mapping.get(command.action)
-        if not shell_cmd:
-            fallback_cmd = "playerctl play"
+        playerctl_args = _PLAYERCTL_ARGS.get(command.action)
+        if command.action not in _QUERY_ACTIONS:
+            # The command changes player state, so cached status/metadata are stale.
+            self._query_cache.clear()
+        if not playerctl_args:
             try:
-                output = await run_shell_command(None, fallback_cmd)
+                output = await _run_playerctl("play")
                 return MediaResult(
                     success=True,
                     action=command.action,
@@ -60,15 +129,35 @@ class PlayerctlProvider(BaseMediaProvider):
                 )
 
         try:
-            output = await run_shell_command(None, shell_cmd)
+            returncode = None
+            if command.action in _QUERY_ACTIONS:
+                output = await self._query(command.action, playerctl_args)
+            else:
+                returncode, output = await _exec_playerctl(*playerctl_args)
             output_text = str(output or "").strip()
-            if "no player could handle this command" in output_text.lower():
+            if _NO_PLAYER_RE.search(output_text):
                 return MediaResult(
                     success=False,
                     action=command.action,
                     provider=self.name,
                     message="No active media player was detected.",
                 )
+            if command.action == "current" and output_text:
+                title, artist = _parse_current(output_text)
+                return MediaResult(
+                    success=True,
+                    action=command.action,
+                    provider=self.name,
+                    message=f"{title} - {artist}" if artist else title,
+                    track=MediaTrack(title=title, artist=artist, provider=self.name),
+                )
+            expected_status = _EXPECTED_STATUS.get(command.action)
+            if (
+                expected_status is not None
+                and returncode == 0
+                and (not output_text or output_text in _PLAYER_STATUSES)
+            ):
+                self._query_cache["status"] = (time.monotonic(), expected_status)
             return MediaResult(
                 success=True,
                 action=command.action,
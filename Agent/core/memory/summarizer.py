@@ -1,4 +1,5 @@
 
+import functools
 import logging
 import os
 from datetime import datetime
@@ -9,6 +10,14 @@ from llama_index.core.llms import ChatMessage, MessageRole
 
 logger = logging.getLogger(__name__)
 
+SUMMARIZER_MODEL = "llama-3.1-8b-instant"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_groq_llm(api_key: str) -> Groq:
+    """One Groq client (and its HTTP connection pool) per key, shared by every Summarizer."""
+    return Groq(model=SUMMARIZER_MODEL, api_key=api_key)
+
 class Summarizer:
     """
     Summarizes conversation history to maintain manageable context windows.
@@ -21,7 +30,7 @@ class Summarizer:
             self.llm = None
         else:
             try:
-                self.llm = Groq(model="llama-3.1-8b-instant", api_key=self.api_key)
+                self.llm = _get_groq_llm(self.api_key)
                 logger.info("✅ Summarizer initialized with Groq (Llama 3.1)")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize Summarizer LLM: {e}")
@@ -0,0 +1,46 @@
+"""
+Text log formatter that keeps `extra=` fields visible.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict
+
+try:
+    import orjson
+
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return orjson.dumps(payload, default=str).decode()
+except ImportError:  # pragma: no cover - orjson is pinned in requirements
+    import json
+
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, default=str, separators=(",", ":"))
+
+
+# Attributes every LogRecord carries, plus the fields the trace filter injects
+_RESERVED = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "trace_id",
+    "session_id",
+    "user_id",
+    "task_id",
+}
+
+
+def record_extras(record: logging.LogRecord) -> Dict[str, Any]:
+    """Fields passed via `extra=` on the logging call."""
+    return {k: v for k, v in vars(record).items() if k not in _RESERVED}
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formats like logging.Formatter, then appends `extra=` fields as one JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extras = record_extras(record)
+        if not extras:
+            return line
+        return f"{line} {_dumps(extras)}"
@@ -9,6 +9,8 @@ import logging
 import uuid
 from typing import Any, Dict, Optional
 
+from core.observability.structured_logging import StructuredFormatter
+
 _TRACE_CONTEXT: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
     "trace_context",
     default={},
@@ -104,6 +106,6 @@ def enable_trace_logging() -> None:
             new_fmt = f"{fmt} trace_id=%(trace_id)s"
         else:
             new_fmt = "%(levelname)s:%(name)s:%(message)s trace_id=%(trace_id)s"
-        handler.setFormatter(logging.Formatter(new_fmt))
+        handler.setFormatter(StructuredFormatter(new_fmt))
 
     _TRACE_LOGGING_ENABLED = True
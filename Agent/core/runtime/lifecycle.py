@@ -163,6 +163,20 @@ class RuntimeLifecycleManager:
         if self.provider_supervisor:
             await self.provider_supervisor.stop()
 
+        try:
+            from telemetry.session_monitor import get_session_monitor
+            monitor = get_session_monitor()
+            await monitor.flush()
+            monitor.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Session monitor close error (non-fatal): {e}")
+
+        try:
+            from providers.llmprovider import aclose_shared_http_pool
+            await aclose_shared_http_pool()
+        except Exception as e:
+            logger.warning(f"⚠️ LLM HTTP pool close error (non-fatal): {e}")
+
         logger.info("🏁 Shutdown completed")
         
     def _start_background_task(self, coro):
@@ -529,8 +543,8 @@ class RuntimeLifecycleManager:
 
     async def _start_evaluation_loop(self):
         """Background task for system health monitoring."""
-        from telemetry.session_monitor import SessionMonitor
-        session_monitor = SessionMonitor()
+        from telemetry.session_monitor import get_session_monitor
+        session_monitor = get_session_monitor()
         logger.info("✅ Evaluation loop started")
         
         while True:
@@ -2,12 +2,55 @@ import os
 import asyncio
 import logging
 from typing import List, Dict, Optional, Any
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
+from cachetools import TTLCache
+import httpx
 import time
-from functools import wraps
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 
 logger = logging.getLogger(__name__)
 
+# Blocking Supabase REST calls run on their own bounded pool instead of the
+# default executor, so a burst of DB work can't starve other to_thread users.
+SUPABASE_MAX_WORKERS = max(1, int(os.getenv("SUPABASE_MAX_WORKERS", "8")))
+_db_executor = ThreadPoolExecutor(max_workers=SUPABASE_MAX_WORKERS, thread_name_prefix="supabase")
+# The local JSON fallback stores do read-modify-write on whole files; one
+# worker keeps those off the event loop while still running them in order.
+_local_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="local-store")
+# Timeout for the shared httpx client. Passing our own client replaces the one
+# postgrest would build, so default to postgrest's own 120 s rather than
+# silently cutting long queries short.
+SUPABASE_HTTP_TIMEOUT_S = float(os.getenv("SUPABASE_HTTP_TIMEOUT_S", "120"))
+
+# Read-through cache for the per-user dashboard selects (Supabase path only).
+# Entries are invalidated by this process's own writes; rows written by other
+# processes (another worker, the web dashboard) can stay hidden for up to one
+# TTL, so keep it short. SUPABASE_READ_CACHE_TTL_S=0 disables the cache.
+READ_CACHE_TTL_S = max(0.0, float(os.getenv("SUPABASE_READ_CACHE_TTL_S", "10")))
+READ_CACHE_MAX_USERS = 1024
+
+
+def _copy_rows(rows: List[Dict]) -> List[Dict]:
+    """Per-row copies, so callers can't mutate what the read cache holds."""
+    return [dict(row) for row in rows]
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """
+    One pooled httpx client for every Supabase client in the process, so the
+    DB pool threads reuse warm connections (HTTP/2 when h2 is installed).
+    """
+    http2 = importlib.util.find_spec("h2") is not None
+    transport = httpx.HTTPTransport(
+        retries=2,
+        http2=http2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+    return httpx.Client(transport=transport, timeout=SUPABASE_HTTP_TIMEOUT_S)
+
 def retry_with_backoff(max_retries=3, base_delay=1.0):
     """Decorator for retry logic with exponential backoff."""
     def decorator(func):
@@ -47,14 +90,18 @@ class LocalNoteStore:
         self.path.write_text(json.dumps(notes, indent=2))
 
     def create_note(self, user_id, title, content):
+        return self.create_notes_bulk([{"user_id": user_id, "title": title, "content": content}])
+
+    def create_notes_bulk(self, rows):
         notes = self._load()
-        note = {
-            "user_id": user_id,
-            "title": title,
-            "content": content,
-            "updated_at": time.time()
-        }
-        notes.append(note)
+        now = time.time()
+        for row in rows:
+            notes.append({
+                "user_id": row["user_id"],
+                "title": row["title"],
+                "content": row["content"],
+                "updated_at": now
+            })
         self._save(notes)
         return True
 
@@ -88,19 +135,24 @@ class LocalTaskStore:
         self.path.write_text(json.dumps(data, indent=2))
 
     def create_alarm(self, user_id: str, alarm_time: str, label: str = "Alarm") -> bool:
+        return self.create_alarms_bulk([{"user_id": user_id, "alarm_time": alarm_time, "label": label}])
+
+    def create_alarms_bulk(self, rows: List[Dict[str, Any]]) -> bool:
         data = self._load()
         alarms = data["alarms"]
         next_id = (max([int(a.get("id", 0)) for a in alarms], default=0) + 1) if alarms else 1
-        alarms.append(
-            {
-                "id": next_id,
-                "user_id": user_id,
-                "alarm_time": alarm_time,
-                "label": label,
-                "is_active": True,
-                "created_at": time.time(),
-            }
-        )
+        now = time.time()
+        for offset, row in enumerate(rows):
+            alarms.append(
+                {
+                    "id": next_id + offset,
+                    "user_id": row["user_id"],
+                    "alarm_time": row["alarm_time"],
+                    "label": row.get("label", "Alarm"),
+                    "is_active": True,
+                    "created_at": now,
+                }
+            )
         self._save(data)
         return True
 
@@ -121,19 +173,24 @@ class LocalTaskStore:
         return len(data["alarms"]) != original
 
     def create_reminder(self, user_id: str, text: str, remind_at: str) -> bool:
+        return self.create_reminders_bulk([{"user_id": user_id, "text": text, "remind_at": remind_at}])
+
+    def create_reminders_bulk(self, rows: List[Dict[str, Any]]) -> bool:
         data = self._load()
         reminders = data["reminders"]
         next_id = (max([int(r.get("id", 0)) for r in reminders], default=0) + 1) if reminders else 1
-        reminders.append(
-            {
-                "id": next_id,
-                "user_id": user_id,
-                "text": text,
-                "remind_at": remind_at,
-                "is_completed": False,
-                "created_at": time.time(),
-            }
-        )
+        now = time.time()
+        for offset, row in enumerate(rows):
+            reminders.append(
+                {
+                    "id": next_id + offset,
+                    "user_id": row["user_id"],
+                    "text": row["text"],
+                    "remind_at": row["remind_at"],
+                    "is_completed": False,
+                    "created_at": now,
+                }
+            )
         self._save(data)
         return True
 
@@ -159,13 +216,17 @@ class LocalTaskStore:
 
 class SupabaseManager:
     """
-    Manages asynchronous interactions with Supabase using asyncio.to_thread
-    to avoid blocking the main event loop.
+    Manages asynchronous interactions with Supabase by running the blocking
+    client on a bounded thread pool to avoid blocking the main event loop.
     """
     def __init__(self):
         self.client: Optional[Client] = None
         self.local_store = LocalNoteStore()
         self.local_tasks = LocalTaskStore()
+        # user_id -> rows; notes are keyed (user_id, limit)
+        self._alarms_cache = TTLCache(maxsize=READ_CACHE_MAX_USERS, ttl=READ_CACHE_TTL_S)
+        self._reminders_cache = TTLCache(maxsize=READ_CACHE_MAX_USERS, ttl=READ_CACHE_TTL_S)
+        self._notes_cache = TTLCache(maxsize=READ_CACHE_MAX_USERS, ttl=READ_CACHE_TTL_S)
         self._init_client()
 
     def _init_client(self):
@@ -183,40 +244,62 @@ class SupabaseManager:
             return
 
         try:
-            self.client = create_client(url, key)
+            self.client = create_client(url, key, options=ClientOptions(httpx_client=_shared_http_client()))
             logger.info("✅ Supabase Client Initialized")
         except Exception as e:
             logger.error(f"❌ Failed to initialize Supabase client: {e}")
 
     @retry_with_backoff(max_retries=3, base_delay=0.5)
     async def _execute(self, query_func) -> Any:
-        """Helper to run synchronous Supabase calls in a thread with retry."""
-        if not self.client:
+        """Helper to run synchronous Supabase calls on the DB pool with retry."""
+        if self.client is None:
             return None
         try:
-            return await asyncio.to_thread(query_func)
+            return await asyncio.get_running_loop().run_in_executor(_db_executor, query_func)
         except Exception as e:
             logger.error(f"❌ Supabase Query Error: {e}")
             raise  # Re-raise for retry decorator
 
+    async def _local(self, func, *args) -> Any:
+        """Run a local-store call (blocking file I/O) on the serial local-store worker."""
+        return await asyncio.get_running_loop().run_in_executor(_local_io_executor, func, *args)
+
+    def _forget_notes(self, user_id: str) -> None:
+        for key in [key for key in self._notes_cache if key[0] == user_id]:
+            self._notes_cache.pop(key, None)
+
     # --- Alarms ---
     async def create_alarm(self, user_id: str, alarm_time: str, label: str = "Alarm") -> bool:
-        if not self.client:
-            return self.local_tasks.create_alarm(user_id, alarm_time, label)
-        def _query():
-            return self.client.table("user_alarms").insert({
-                "user_id": user_id,
-                "alarm_time": alarm_time,
-                "label": label,
+        return await self.create_alarms_bulk([{"user_id": user_id, "alarm_time": alarm_time, "label": label}])
+
+    async def create_alarms_bulk(self, rows: List[Dict[str, Any]]) -> bool:
+        """Create several alarms ({user_id, alarm_time, label}) in one request."""
+        if not rows:
+            return True
+        if self.client is None:
+            return await self._local(self.local_tasks.create_alarms_bulk, rows)
+        payload = [
+            {
+                "user_id": row["user_id"],
+                "alarm_time": row["alarm_time"],
+                "label": row.get("label", "Alarm"),
                 "is_active": True
-            }).execute()
+            }
+            for row in rows
+        ]
+        def _query():
+            return self.client.table("user_alarms").insert(payload).execute()
         
         result = await self._execute(_query)
+        for row in rows:
+            self._alarms_cache.pop(row["user_id"], None)
         return bool(result and result.data)
 
     async def get_active_alarms(self, user_id: str) -> List[Dict]:
-        if not self.client:
-            return self.local_tasks.get_active_alarms(user_id)
+        if self.client is None:
+            return await self._local(self.local_tasks.get_active_alarms, user_id)
+        if (rows := self._alarms_cache.get(user_id)) is not None:
+            return _copy_rows(rows)
         def _query():
             return self.client.table("user_alarms").select("*")\
                 .eq("user_id", user_id)\
@@ -225,11 +308,15 @@ class SupabaseManager:
                 .execute()
         
         result = await self._execute(_query)
-        return result.data if result else []
+        if not result:
+            return []
+        if READ_CACHE_TTL_S:
+            self._alarms_cache[user_id] = _copy_rows(result.data)
+        return result.data
 
     async def delete_alarm(self, user_id: str, alarm_id: int) -> bool:
-        if not self.client:
-            return self.local_tasks.delete_alarm(user_id, alarm_id)
+        if self.client is None:
+            return await self._local(self.local_tasks.delete_alarm, user_id, alarm_id)
         def _query():
             return self.client.table("user_alarms").delete()\
                 .eq("user_id", user_id)\
@@ -237,26 +324,41 @@ class SupabaseManager:
                 .execute()
         
         result = await self._execute(_query)
+        self._alarms_cache.pop(user_id, None)
         return bool(result and result.data)
 
     # --- Reminders ---
     async def create_reminder(self, user_id: str, text: str, remind_at: str) -> bool:
-        if not self.client:
-            return self.local_tasks.create_reminder(user_id, text, remind_at)
-        def _query():
-            return self.client.table("user_reminders").insert({
-                "user_id": user_id,
-                "text": text,
-                "remind_at": remind_at,
+        return await self.create_reminders_bulk([{"user_id": user_id, "text": text, "remind_at": remind_at}])
+
+    async def create_reminders_bulk(self, rows: List[Dict[str, Any]]) -> bool:
+        """Create several reminders ({user_id, text, remind_at}) in one request."""
+        if not rows:
+            return True
+        if self.client is None:
+            return await self._local(self.local_tasks.create_reminders_bulk, rows)
+        payload = [
+            {
+                "user_id": row["user_id"],
+                "text": row["text"],
+                "remind_at": row["remind_at"],
                 "is_completed": False
-            }).execute()
+            }
+            for row in rows
+        ]
+        def _query():
+            return self.client.table("user_reminders").insert(payload).execute()
         
         result = await self._execute(_query)
+        for row in rows:
+            self._reminders_cache.pop(row["user_id"], None)
         return bool(result and result.data)
 
     async def get_pending_reminders(self, user_id: str) -> List[Dict]:
-        if not self.client:
-            return self.local_tasks.get_pending_reminders(user_id)
+        if self.client is None:
+            return await self._local(self.local_tasks.get_pending_reminders, user_id)
+        if (rows := self._reminders_cache.get(user_id)) is not None:
+            return _copy_rows(rows)
         def _query():
             return self.client.table("user_reminders").select("*")\
                 .eq("user_id", user_id)\
@@ -265,11 +367,15 @@ class SupabaseManager:
                 .execute()
         
         result = await self._execute(_query)
-        return result.data if result else []
+        if not result:
+            return []
+        if READ_CACHE_TTL_S:
+            self._reminders_cache[user_id] = _copy_rows(result.data)
+        return result.data
 
     async def delete_reminder(self, user_id: str, reminder_id: int) -> bool:
-        if not self.client:
-            return self.local_tasks.delete_reminder(user_id, reminder_id)
+        if self.client is None:
+            return await self._local(self.local_tasks.delete_reminder, user_id, reminder_id)
         def _query():
             return self.client.table("user_reminders").delete()\
                 .eq("user_id", user_id)\
@@ -277,29 +383,42 @@ class SupabaseManager:
                 .execute()
 
         result = await self._execute(_query)
+        self._reminders_cache.pop(user_id, None)
         return bool(result is not None)
 
     # --- Notes ---
     async def create_note(self, user_id: str, title: str, content: str) -> str:
-        if not self.client:
-            self.local_store.create_note(user_id, title, content)
-            return f"Note created: {title} - {content}"
+        if await self.create_notes_bulk([{"user_id": user_id, "title": title, "content": content}]):
+             return f"Note created: {title} - {content}"
+        return "Failed to create note."
 
+    async def create_notes_bulk(self, rows: List[Dict[str, Any]]) -> bool:
+        """Create several notes ({user_id, title, content}) in one request."""
+        if not rows:
+            return True
+        if self.client is None:
+            return await self._local(self.local_store.create_notes_bulk, rows)
+        payload = [
+            {
+                "user_id": row["user_id"],
+                "title": row["title"],
+                "content": row["content"]
+            }
+            for row in rows
+        ]
         def _query():
-            return self.client.table("user_notes").insert({
-                "user_id": user_id,
-                "title": title,
-                "content": content
-            }).execute()
+            return self.client.table("user_notes").insert(payload).execute()
         
         result = await self._execute(_query)
-        if result and result.data:
-             return f"Note created: {title} - {content}"
-        return "Failed to create note."
+        for row in rows:
+            self._forget_notes(row["user_id"])
+        return bool(result and result.data)
 
     async def get_notes(self, user_id: str, limit: int = 10) -> List[Dict]:
-        if not self.client:
-            return self.local_store.get_notes(user_id, limit)
+        if self.client is None:
+            return await self._local(self.local_store.get_notes, user_id, limit)
+        if (rows := self._notes_cache.get((user_id, limit))) is not None:
+            return _copy_rows(rows)
 
         def _query():
             return self.client.table("user_notes").select("*")\
@@ -309,11 +428,35 @@ class SupabaseManager:
                 .execute()
         
         result = await self._execute(_query)
-        return result.data if result else []
+        if not result:
+            return []
+        if READ_CACHE_TTL_S:
+            self._notes_cache[(user_id, limit)] = _copy_rows(result.data)
+        return result.data
+
+    # --- Dashboard ---
+    async def get_user_dashboard(self, user_id: str, notes_limit: int = 10) -> Dict[str, List[Dict]]:
+        """Fetch alarms, reminders and notes concurrently (one round trip of latency instead of three)."""
+        if self.client is None:
+            # Local stores only: one trip to the local-store worker rather than three tasks.
+            return await self._local(self._local_dashboard, user_id, notes_limit)
+        alarms, reminders, notes = await asyncio.gather(
+            self.get_active_alarms(user_id),
+            self.get_pending_reminders(user_id),
+            self.get_notes(user_id, notes_limit),
+        )
+        return {"alarms": alarms, "reminders": reminders, "notes": notes}
+
+    def _local_dashboard(self, user_id: str, notes_limit: int) -> Dict[str, List[Dict]]:
+        return {
+            "alarms": self.local_tasks.get_active_alarms(user_id),
+            "reminders": self.local_tasks.get_pending_reminders(user_id),
+            "notes": self.local_store.get_notes(user_id, notes_limit),
+        }
 
     # --- Sessions ---
     async def create_session_record(self, user_id: str, room_id: str, metadata: Dict = {}) -> bool:
-        if not self.client: return False
+        if self.client is None: return False
         def _query():
             return self.client.table("user_sessions").insert({
                 "user_id": user_id,
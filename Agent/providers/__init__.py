@@ -13,7 +13,7 @@ from .provider_types import (
     TTS_DEFAULTS,
 )
 print("🔍 DEBUG: providers/__init__ - Importing llmprovider...")
-from .llmprovider import get_llm_provider, get_llm_instance, list_llm_providers
+from .llmprovider import get_llm_provider, get_llm_instance, get_llm_instance_async, list_llm_providers
 print("🔍 DEBUG: providers/__init__ - Importing sttprovider...")
 from .sttprovider import get_stt_provider, list_stt_providers
 print("🔍 DEBUG: providers/__init__ - Importing ttsprovider...")
@@ -33,6 +33,7 @@ __all__ = [
     # Factory functions
     "get_llm_provider",
     "get_llm_instance",
+    "get_llm_instance_async",
     "get_stt_provider",
     "get_tts_provider",
     "ProviderFactory",
@@ -0,0 +1,34 @@
+"""
+Lazy loader for livekit.plugins.* modules, shared by the LLM, STT and TTS providers.
+"""
+
+import importlib
+import threading
+from typing import Any, Dict
+
+_PLUGIN_CACHE: Dict[str, Any] = {}
+_plugin_lock = threading.Lock()
+
+
+def load_plugin(name: str, label: str) -> Any:
+    """
+    Import livekit.plugins.<name> once per process and memoize the module.
+    A missing plugin is not cached: every call retries the import and raises
+    ImportError with an install hint, so installing the plugin takes effect
+    without a restart.
+    """
+    module = _PLUGIN_CACHE.get(name)
+    if module is not None:
+        return module
+    with _plugin_lock:
+        module = _PLUGIN_CACHE.get(name)
+        if module is None:
+            try:
+                module = importlib.import_module(f"livekit.plugins.{name}")
+            except ImportError:
+                raise ImportError(
+                    f"{label} plugin not installed. "
+                    f"Install with: pip install livekit-plugins-{name}"
+                ) from None
+            _PLUGIN_CACHE[name] = module
+    return module
@@ -11,9 +11,20 @@ print("🔍 DEBUG: ProviderFactory - Importing provider_types...")
 from .provider_types import LLMProvider, STTProvider, TTSProvider
 print("🔍 DEBUG: ProviderFactory - Importing settings...")
 from config.settings import settings
-from .llmprovider import get_llm_provider
-from .sttprovider import get_stt_provider
-from .ttsprovider import get_tts_provider
+from .llmprovider import (
+    get_llm_provider,
+    clear_llm_cache,
+    invalidate_env_cache,
+    _get_or_build,
+    _llm_cache_key,
+)
+from ._plugins import load_plugin
+from .sttprovider import (
+    get_stt_provider,
+    clear_stt_cache,
+    invalidate_env_cache as invalidate_stt_env_cache,
+)
+from .ttsprovider import get_tts_provider, invalidate_env_cache as invalidate_tts_env_cache
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +57,11 @@ class ProviderFactory:
     def reset_cache(cls):
         """Clear the provider cache (useful for testing)"""
         cls._cache.clear()
+        clear_llm_cache()
+        invalidate_env_cache()
+        clear_stt_cache()
+        invalidate_stt_env_cache()
+        invalidate_tts_env_cache()
 
     @staticmethod
     def _stable_kwargs(kwargs: Dict[str, Any]) -> str:
@@ -127,25 +143,16 @@ class ProviderFactory:
     ) -> Any:
         """Initialize LLM with fallback to Groq and connection timeout. Caches instances."""
         temp = temperature if temperature is not None else settings.llm_temperature
-        kwargs_key = cls._stable_kwargs(kwargs)
-        cache_key = f"llm:{provider_name}:{model}:{temp}:{kwargs_key}"
-        
-        if cache_key in cls._cache:
-            return cls._cache[cache_key]
+        cache_key = _llm_cache_key(provider_name, model, temp, cls._stable_kwargs(kwargs))
 
         timeout = timeout or cls.DEFAULT_LLM_TIMEOUT
         try:
-            instance = get_llm_provider(
-                provider_name=provider_name,
-                model=model,
-                temperature=temp,
-                **kwargs,
+            return _get_or_build(
+                cache_key,
+                lambda: cls._build_llm(provider_name, model, temp, **kwargs),
             )
-            logger.info(f"✅ LLM initialized: {provider_name} ({model})")
-            cls._cache[cache_key] = instance
-            return instance
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize LLM provider {provider_name}: {e}")
+        except Exception:
+            logger.exception("❌ Primary LLM init failed (provider=%s)", provider_name)
             fallback_model = os.getenv("GROQ_FALLBACK_MODEL", "llama-3.1-8b-instant")
             logger.warning(f"⚠️ Falling back to Groq LLM ({fallback_model})")
             slots = [2, 3, 1]
@@ -154,12 +161,18 @@ class ProviderFactory:
                 slot_key = os.getenv(f"GROQ_API_KEY_{slot}", "").strip() if slot > 1 else os.getenv("GROQ_API_KEY", "").strip()
                 if not slot_key:
                     continue
+                fallback_key = _llm_cache_key(
+                    "groq", fallback_model, temp, cls._stable_kwargs({"key_slot": slot})
+                )
                 try:
-                    return get_llm_provider(
-                        provider_name="groq",
-                        model=fallback_model,
-                        temperature=temp,
-                        key_slot=slot,
+                    return _get_or_build(
+                        fallback_key,
+                        lambda slot=slot: get_llm_provider(
+                            provider_name="groq",
+                            model=fallback_model,
+                            temperature=temp,
+                            key_slot=slot,
+                        ),
                     )
                 except Exception as slot_err:
                     last_err = slot_err
@@ -168,6 +181,17 @@ class ProviderFactory:
                 raise last_err
             raise
 
+    @staticmethod
+    def _build_llm(provider_name: str, model: str, temperature: float, **kwargs) -> Any:
+        instance = get_llm_provider(
+            provider_name=provider_name,
+            model=model,
+            temperature=temperature,
+            **kwargs,
+        )
+        logger.info(f"✅ LLM initialized: {provider_name} ({model})")
+        return instance
+
     @classmethod
     def get_stt(cls, provider_name: str, language: str, model: str, supervisor: Optional[Any] = None, timeout: Optional[float] = None) -> Any:
         """Initialize STT with fallback to Groq, optional resiliency, and connection timeout. Caches instances."""
@@ -223,7 +247,7 @@ class ProviderFactory:
                 logger.error(f"❌ Failed to initialize STT provider {candidate}: {e}")
 
         # Fallback to Groq STT if the whole chain fails.
-        from livekit.plugins import groq
+        groq = load_plugin("groq", "Groq")
         logger.warning("⚠️ Falling back to Groq STT (whisper-large-v3-turbo, en)")
         if last_error:
             logger.debug("Last STT initialization error before Groq fallback: %s", last_error)
@@ -310,7 +334,7 @@ class ProviderFactory:
         # Last-resort fallback to OpenAI when primary + Edge are unavailable.
         try:
             logger.error("❌ All configured TTS providers failed. Using OpenAI tts-1/alloy as last resort.")
-            from livekit.plugins import openai
+            openai = load_plugin("openai", "OpenAI")
 
             return openai.TTS(model="tts-1", voice="alloy")
         except Exception as fe:
@@ -320,7 +344,7 @@ class ProviderFactory:
 
     @staticmethod
     def _get_fresh_stt(provider_name, language, model):
-        return get_stt_provider(provider_name, language, model)
+        return get_stt_provider(provider_name, language, model, use_cache=False)
     
     @staticmethod
     def _get_fresh_tts(provider_name, voice, model):
@@ -19,24 +19,221 @@ Supported Providers:
 - Qwen
 """
 
+import asyncio
+import functools
+import itertools
 import os
 import logging
 import threading
 import re
-from typing import Any, Optional, Dict, Tuple
-
+import sys
+import weakref
+from collections import OrderedDict
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Dict, Tuple
+
+from ._plugins import load_plugin
 from .provider_types import LLMProvider, LLM_DEFAULTS
 
+_SUPPORTED_LLM_PROVIDER_VALUES = tuple(p.value for p in LLMProvider)
+
+# Default model per provider value, flattened once at import
+_DEFAULT_MODEL: Dict[str, str] = {
+    provider.value: config["model"] for provider, config in LLM_DEFAULTS.items()
+}
+
 # Plugins are lazy-loaded in factory functions to prevent import deadlocks
 # and ensure proper initialization context.
 
 
 logger = logging.getLogger(__name__)
 
-# Cache for LLM instance (with thread-safe lock)
-_llm_cache: Optional[Any] = None
-_cache_key: Optional[str] = None
+# Bounded LRU cache of LLM instances keyed by provider/model/temperature
+# (with thread-safe lock)
+_LLM_CACHE_MAX = max(1, int(os.getenv("LLM_CACHE_MAX", "16") or 16))
+_llm_cache: "OrderedDict[str, Any]" = OrderedDict()
 _cache_lock = threading.Lock()
+# Keys currently being built; waiters block on the Event instead of rebuilding
+_llm_inflight: Dict[str, threading.Event] = {}
+_INFLIGHT_WAIT_S = 60.0
+# Per-key locks for get_llm_instance_async so coroutines share one build.
+# An asyncio.Lock binds to the loop that first contends on it, so each loop
+# gets its own set; entries go away with their loop.
+_async_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_locks_mu = threading.Lock()
+
+# Process-local snapshot of the environment variables this module reads.
+# Call invalidate_env_cache() after mutating os.environ at runtime.
+_TRACKED_ENV_PREFIXES: Tuple[str, ...] = (
+    "LLM_",
+    "OPENAI_",
+    "GROQ_",
+    "GEMINI_",
+    "ANTHROPIC_",
+    "AZURE_OPENAI_",
+    "AWS_",
+    "TOGETHER_",
+    "MISTRAL_",
+    "PERPLEXITY_",
+    "OLLAMA_",
+    "VLLM_",
+    "DEEPSEEK_",
+    "QWEN_",
+    "NVIDIA_",
+)
+_env_snapshot: Optional[Dict[str, str]] = None
+_env_lock = threading.Lock()
+# (snapshot it was parsed from, (provider, model, temperature, cache_key))
+_runtime_config: Optional[Tuple[Dict[str, str], Tuple[str, str, float, str]]] = None
+
+
+def _env_vars() -> Dict[str, str]:
+    """Return the tracked environment snapshot, building it on first use."""
+    global _env_snapshot
+    snapshot = _env_snapshot
+    if snapshot is None:
+        with _env_lock:
+            snapshot = _env_snapshot
+            if snapshot is None:
+                # Interned names let lookups with literal keys match by identity.
+                snapshot = {
+                    sys.intern(name): value
+                    for name, value in os.environ.items()
+                    if name.startswith(_TRACKED_ENV_PREFIXES)
+                }
+                _env_snapshot = snapshot
+    return snapshot
+
+
+def _env(key: str, default: str = "") -> str:
+    """Snapshot-backed replacement for os.getenv for tracked variables."""
+    return _env_vars().get(key, default)
+
+
+_PLUGIN_CONSTRUCTORS: Dict[str, Callable[..., Any]] = {}
+
+
+def _load_llm_constructor(name: str, label: str, attr: str = "LLM") -> Callable[..., Any]:
+    """Resolve and memoize a plugin's LLM class (or a dotted attribute such as
+    "LLM.with_azure") so construction skips repeated attribute lookups."""
+    key = f"{name}.{attr}"
+    constructor = _PLUGIN_CONSTRUCTORS.get(key)
+    if constructor is None:
+        constructor = load_plugin(name, label)
+        for part in attr.split("."):
+            constructor = getattr(constructor, part)
+        _PLUGIN_CONSTRUCTORS[key] = constructor
+    return constructor
+
+
+def _use_shared_http_pool() -> bool:
+    """
+    LLM_SHARED_HTTP_POOL=false gives every OpenAI-compatible LLM its own pool.
+    Sharing needs a running event loop, since the pool belongs to that loop.
+    """
+    if _env("LLM_SHARED_HTTP_POOL", "true").strip().lower() in {"0", "false", "no", "off"}:
+        return False
+    if _bound_http_pool.get() is not None:
+        return True
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _LoopHttpPool(NamedTuple):
+    http_client: Any
+    # (api_key, base_url) -> openai.AsyncClient on http_client
+    openai_clients: Dict[Tuple[str, Optional[str]], Any]
+    # Suffix for LLM cache keys built while this pool is in use
+    cache_scope: str
+
+
+_pool_ids = itertools.count(1)
+
+
+# httpx.AsyncClient connections are bound to the loop that opened them, so
+# each running loop gets its own pool; entries go away with their loop.
+_loop_http_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopHttpPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Pool handed to an executor-thread build by get_llm_instance_async; that
+# thread has no running loop of its own.
+_bound_http_pool: ContextVar[Optional[_LoopHttpPool]] = ContextVar("llm_bound_http_pool", default=None)
+
+
+def _loop_http_pool() -> _LoopHttpPool:
+    pool = _bound_http_pool.get()
+    if pool is not None:
+        return pool
+    loop = asyncio.get_running_loop()
+    pool = _loop_http_pools.get(loop)
+    if pool is None or pool.http_client.is_closed:
+        import httpx
+
+        if pool is not None:
+            _evict_cache_scope(pool.cache_scope)
+        pool = _loop_http_pools[loop] = _LoopHttpPool(
+            httpx.AsyncClient(
+                # Same per-request timeouts the livekit openai plugin uses by default.
+                timeout=httpx.Timeout(connect=15.0, read=5.0, write=5.0, pool=5.0),
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=int(_env("LLM_HTTP_MAX_CONNECTIONS", "100")),
+                    max_keepalive_connections=int(_env("LLM_HTTP_MAX_KEEPALIVE", "50")),
+                    keepalive_expiry=120,
+                ),
+            ),
+            {},
+            f"@pool{next(_pool_ids)}",
+        )
+    return pool
+
+
+def _shared_http_client() -> Any:
+    """httpx pool shared by all OpenAI-compatible LLM clients on the running loop."""
+    return _loop_http_pool().http_client
+
+
+def _shared_openai_client(api_key: str, base_url: Optional[str]) -> Any:
+    """openai.AsyncClient for one endpoint/key, backed by the running loop's httpx pool."""
+    pool = _loop_http_pool()
+    client = pool.openai_clients.get((api_key, base_url))
+    if client is None:
+        import openai as openai_sdk
+
+        client = pool.openai_clients[(api_key, base_url)] = openai_sdk.AsyncClient(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0,
+            http_client=pool.http_client,
+        )
+    return client
+
+
+async def aclose_shared_http_pool() -> None:
+    """
+    Close the running loop's shared httpx pool (call on shutdown).
+    Cached LLMs built on that pool are dropped with it.
+    """
+    pool = _loop_http_pools.pop(asyncio.get_running_loop(), None)
+    if pool is None:
+        return
+    _evict_cache_scope(pool.cache_scope)
+    await pool.http_client.aclose()
+
+
+def invalidate_env_cache() -> None:
+    """Force the next _env() call to re-read os.environ."""
+    global _env_snapshot
+    with _env_lock:
+        _env_snapshot = None
 
 
 def get_llm_provider(
@@ -66,76 +263,181 @@ def get_llm_provider(
     """
     provider = provider_name.lower().strip()
     
-    logger.info(f"🤖 Initializing LLM provider: {provider}")
+    logger.info("🤖 Initializing LLM provider: %s", provider)
     
     try:
-        match provider:
-            case "openai":
-                return _get_openai_llm(model, temperature, **kwargs)
-            case "groq":
-                return _get_groq_llm(model, temperature, **kwargs)
-            case "gemini" | "google":
-                return _get_gemini_llm(model, temperature, **kwargs)
-            case "anthropic" | "claude":
-                return _get_anthropic_llm(model, temperature, **kwargs)
-            case "azure_openai" | "azure-openai" | "azureopenai":
-                return _get_azure_openai_llm(model, temperature, **kwargs)
-            case "aws_bedrock" | "bedrock" | "aws":
-                return _get_bedrock_llm(model, temperature, **kwargs)
-            case "together" | "together_ai" | "togetherai":
-                return _get_together_llm(model, temperature, **kwargs)
-            case "mistral":
-                return _get_mistral_llm(model, temperature, **kwargs)
-            case "perplexity":
-                return _get_perplexity_llm(model, temperature, **kwargs)
-            case "ollama":
-                return _get_ollama_llm(model, temperature, **kwargs)
-            case "vllm":
-                return _get_vllm_llm(model, temperature, **kwargs)
-            case "deepseek":
-                return _get_deepseek_llm(model, temperature, **kwargs)
-            case "qwen":
-                return _get_qwen_llm(model, temperature, **kwargs)
-            case "nvidia":
-                return _get_nvidia_llm(model, temperature, **kwargs)
-            case _:
-                raise ValueError(
-                    f"❌ Unsupported LLM provider: '{provider}'. "
-                    f"Supported providers: {[p.value for p in LLMProvider]}"
-                )
-    except ImportError as e:
-        logger.error(f"❌ Missing plugin for {provider}: {e}")
-        raise
-    except ValueError as e:
-        logger.error(f"❌ Configuration error for {provider}: {e}")
-        raise
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize {provider}: {e}")
+        try:
+            resolved = LLMProvider(provider)
+        except ValueError:
+            raise ValueError(
+                f"❌ Unsupported LLM provider: '{provider}'. "
+                f"Supported providers: {_SUPPORTED_LLM_PROVIDER_VALUES}"
+            ) from None
+        return _PROVIDER_DISPATCH[resolved](model, temperature, **kwargs)
+    except Exception:
+        # logger.exception already renders the exception type and message.
+        logger.exception("❌ Failed to initialize %s", provider)
         raise
 
 
 def get_llm_instance() -> Any:
     """
     Returns the LLM instance based on environment configuration.
-    Delegates to ProviderFactory for centralized caching.
+    Delegates to ProviderFactory for construction; instances are shared
+    through the bounded LRU in this module, so a warm call is a dict hit.
+
+    A cold call imports the plugin and builds the client synchronously, so
+    code running inside an event loop should use get_llm_instance_async().
     """
     from .factory import ProviderFactory
-    provider = os.getenv("LLM_PROVIDER", "groq").lower()
-    model = os.getenv("LLM_MODEL", "")
-    temperature_str = os.getenv("LLM_TEMPERATURE", "0.7")
+    provider, model, temperature, key = _parse_runtime_config()
+
+    llm = _cache_lookup(key)
+    if llm is not None:
+        return llm
+    return ProviderFactory.get_llm(provider, model, temperature)
+
+
+async def get_llm_instance_async() -> Any:
+    """
+    Event-loop friendly get_llm_instance(): a miss is built in the default
+    executor, and concurrent coroutines asking for the same key share it.
+    """
+    key = _parse_runtime_config()[3]
+    llm = _cache_lookup(key)
+    if llm is not None:
+        return llm
+
+    loop = asyncio.get_running_loop()
+    with _async_locks_mu:
+        lock = _async_locks.setdefault(loop, {}).setdefault(key, asyncio.Lock())
+    async with lock:
+        llm = _cache_lookup(key)
+        if llm is not None:
+            return llm
+        # Resolve the shared pool here, on the loop that will use it.
+        pool = _loop_http_pool() if _use_shared_http_pool() else None
+        return await loop.run_in_executor(None, _get_llm_instance_on_pool, pool)
+
+
+def _get_llm_instance_on_pool(pool: Optional[_LoopHttpPool]) -> Any:
+    """get_llm_instance() on an executor thread, building on the caller's loop pool."""
+    token = _bound_http_pool.set(pool)
+    try:
+        return get_llm_instance()
+    finally:
+        _bound_http_pool.reset(token)
+
+
+def _parse_runtime_config() -> Tuple[str, str, float, str]:
+    """
+    Parse LLM_PROVIDER/LLM_MODEL/LLM_TEMPERATURE into (provider, model,
+    temperature, cache_key). The result is reused until the env snapshot is
+    rebuilt (see invalidate_env_cache).
+    """
+    global _runtime_config
+    env = _env_vars()
+    cached = _runtime_config
+    if cached is not None and cached[0] is env:
+        return cached[1]
+
+    provider = env.get("LLM_PROVIDER", "groq").lower()
+    model = env.get("LLM_MODEL", "")
     try:
-        temperature = float(temperature_str)
+        temperature = float(env.get("LLM_TEMPERATURE", "0.7"))
     except ValueError:
         temperature = 0.7
-        
-    return ProviderFactory.get_llm(provider, model, temperature)
+    key = _llm_cache_key(provider, model, temperature)
+
+    config = (provider, model, temperature, key)
+    _runtime_config = (env, config)
+    return config
+
+
+def _llm_cache_key(provider: str, model: str, temperature: float, kwargs_key: str = "") -> str:
+    """Cache key shared by get_llm_instance and ProviderFactory.get_llm."""
+    return sys.intern(f"llm:{provider}:{model}:{temperature}:{kwargs_key}")
+
 
+def _scoped_cache_key(key: str) -> str:
+    """
+    Instances built while the shared pool is in use capture that pool's
+    http_client, which belongs to one loop; key them by pool so another loop
+    never gets a client bound to a closed or foreign loop.
+    """
+    if not _use_shared_http_pool():
+        return key
+    return key + _loop_http_pool().cache_scope
+
+
+def _evict_cache_scope(cache_scope: str) -> None:
+    """Drop the cached LLMs built on one (replaced or closed) pool."""
+    with _cache_lock:
+        for key in [key for key in _llm_cache if key.endswith(cache_scope)]:
+            del _llm_cache[key]
+
+
+def _cache_lookup(key: str) -> Optional[Any]:
+    key = _scoped_cache_key(key)
+    with _cache_lock:
+        llm = _llm_cache.get(key)
+        if llm is not None:
+            _llm_cache.move_to_end(key)
+        return llm
+
+
+def _get_or_build(key: str, builder: Callable[[], Any]) -> Any:
+    """
+    Return the cached LLM for key, building and inserting it on a miss.
+    Concurrent callers missing on the same key wait for the in-flight build
+    instead of constructing a duplicate client.
+    """
+    key = _scoped_cache_key(key)
+    while True:
+        with _cache_lock:
+            llm = _llm_cache.get(key)
+            if llm is not None:
+                _llm_cache.move_to_end(key)
+                return llm
+            pending = _llm_inflight.get(key)
+            if pending is None:
+                pending = _llm_inflight[key] = threading.Event()
+                break
+        if not pending.wait(_INFLIGHT_WAIT_S):
+            logger.warning("⚠️ Timed out waiting for in-flight LLM build (%s); building directly", key)
+            return builder()
+        # The owner finished (or failed); re-check the cache.
+
+    try:
+        llm = builder()
+    except BaseException:
+        with _cache_lock:
+            _llm_inflight.pop(key, None)
+        pending.set()
+        raise
 
+    with _cache_lock:
+        _llm_cache[key] = llm
+        _llm_cache.move_to_end(key)
+        while len(_llm_cache) > _LLM_CACHE_MAX:
+            _llm_cache.popitem(last=False)
+        _llm_inflight.pop(key, None)
+    pending.set()
+    return llm
+
+
+def clear_llm_cache() -> None:
+    """Drop all cached LLM instances (useful for testing and key rotation)."""
+    with _cache_lock:
+        _llm_cache.clear()
+    with _async_locks_mu:
+        _async_locks.clear()
+    _openai_compat_builder.cache_clear()
 
 
 def _validate_api_key(env_var: str, provider_name: str) -> str:
     """Validate that an API key exists in environment"""
-    api_key = os.getenv(env_var)
+    api_key = _env(env_var)
     if not api_key:
         raise ValueError(
             f"❌ {env_var} not found in environment. "
@@ -144,12 +446,21 @@ def _validate_api_key(env_var: str, provider_name: str) -> str:
     return api_key
 
 
+@functools.cache
+def _slot_env_names(provider_prefix: str) -> Tuple[str, str]:
+    """Interned <PREFIX>_ACTIVE_KEY_SLOT / <PREFIX>_SLOT_COUNT names."""
+    return (
+        sys.intern(f"{provider_prefix}_ACTIVE_KEY_SLOT"),
+        sys.intern(f"{provider_prefix}_SLOT_COUNT"),
+    )
+
+
 def _parse_preferred_slot(
     provider_prefix: str,
     key_slot: Any = None,
 ) -> Optional[int]:
     """Resolve preferred slot from explicit arg or <PROVIDER>_ACTIVE_KEY_SLOT env."""
-    active_slot_env = os.getenv(f"{provider_prefix}_ACTIVE_KEY_SLOT", "").strip()
+    active_slot_env = _env(_slot_env_names(provider_prefix)[0], "").strip()
     preferred_slot: Optional[int] = None
 
     raw_value = key_slot if key_slot is not None else active_slot_env
@@ -183,12 +494,12 @@ def _resolve_multi_slot_api_key(
         return explicit_api_key, preferred_slot or 0
 
     key_candidates: Dict[int, str] = {}
-    base_value = os.getenv(base_env_var, "").strip()
+    base_value = _env(base_env_var, "").strip()
     if base_value:
         key_candidates[1] = base_value
 
     # Optional UI-saved slot count helps expose newly created slots immediately.
-    slot_count_env = os.getenv(f"{provider_prefix}_SLOT_COUNT", "").strip()
+    slot_count_env = _env(_slot_env_names(provider_prefix)[1], "").strip()
     max_slot_from_count = 1
     try:
         if slot_count_env:
@@ -198,7 +509,7 @@ def _resolve_multi_slot_api_key(
 
     pattern = re.compile(rf"^{re.escape(base_env_var)}_(\d+)$")
     discovered_slots = []
-    for env_name, env_value in os.environ.items():
+    for env_name, env_value in _env_vars().items():
         m = pattern.match(env_name)
         if not m:
             continue
@@ -225,14 +536,16 @@ def _resolve_multi_slot_api_key(
     return _validate_api_key(base_env_var, provider_name), 1
 
 
+def _log_model_selection(provider_name: str, model_name: str, selected_slot: Optional[int]) -> None:
+    if selected_slot:
+        logger.info("✅ Using %s model: %s (key slot %s)", provider_name, model_name, selected_slot)
+    else:
+        logger.info("✅ Using %s model: %s", provider_name, model_name)
+
+
 def _get_openai_llm(model: str, temperature: float, **kwargs) -> Any:
     """Initialize OpenAI LLM"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
+    openai_llm = _load_llm_constructor("openai", "OpenAI")
     
     explicit_api_key = kwargs.pop("api_key", None)
     key_slot = kwargs.pop("key_slot", None)
@@ -243,14 +556,18 @@ def _get_openai_llm(model: str, temperature: float, **kwargs) -> Any:
         explicit_api_key=explicit_api_key,
         key_slot=key_slot,
     )
-    model_name = model or LLM_DEFAULTS[LLMProvider.OPENAI]["model"]
+    model_name = model or _DEFAULT_MODEL["openai"]
     
-    logger.info(
-        f"✅ Using OpenAI model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
+    _log_model_selection("OpenAI", model_name, selected_slot)
     
-    return openai.LLM(
+    if _use_shared_http_pool():
+        return openai_llm(
+            model=model_name,
+            client=_shared_openai_client(api_key, None),
+            temperature=temperature,
+            **kwargs
+        )
+    return openai_llm(
         model=model_name,
         api_key=api_key,
         temperature=temperature,
@@ -260,17 +577,12 @@ def _get_openai_llm(model: str, temperature: float, **kwargs) -> Any:
 
 def _get_groq_llm(model: str, temperature: float, **kwargs) -> Any:
     """Initialize Groq LLM"""
-    try:
-        from livekit.plugins import groq
-    except ImportError:
-        raise ImportError(
-            "Groq plugin not installed. Install with: pip install livekit-plugins-groq"
-        )
+    groq_llm = _load_llm_constructor("groq", "Groq")
     
     explicit_api_key = kwargs.pop("api_key", None)
     key_slot = kwargs.pop("key_slot", None)
 
-    active_slot_env = os.getenv("GROQ_ACTIVE_KEY_SLOT", "").strip()
+    active_slot_env = _env("GROQ_ACTIVE_KEY_SLOT", "").strip()
     preferred_slot: Optional[int] = None
     if key_slot is not None:
         try:
@@ -287,9 +599,9 @@ def _get_groq_llm(model: str, temperature: float, **kwargs) -> Any:
         api_key = explicit_api_key
         selected_slot = preferred_slot or 0
     else:
-        key_1 = os.getenv("GROQ_API_KEY", "").strip()
-        key_2 = os.getenv("GROQ_API_KEY_2", "").strip()
-        key_3 = os.getenv("GROQ_API_KEY_3", "").strip()
+        key_1 = _env("GROQ_API_KEY", "").strip()
+        key_2 = _env("GROQ_API_KEY_2", "").strip()
+        key_3 = _env("GROQ_API_KEY_3", "").strip()
         key_candidates = {
             1: key_1,
             2: key_2,
@@ -312,14 +624,11 @@ def _get_groq_llm(model: str, temperature: float, **kwargs) -> Any:
             api_key = _validate_api_key("GROQ_API_KEY", "Groq")
             selected_slot = 1
 
-    model_name = model or LLM_DEFAULTS[LLMProvider.GROQ]["model"]
+    model_name = model or _DEFAULT_MODEL["groq"]
     
-    logger.info(
-        f"✅ Using Groq model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
+    _log_model_selection("Groq", model_name, selected_slot)
     
-    return groq.LLM(
+    return groq_llm(
         model=model_name,
         api_key=api_key,
         temperature=temperature,
@@ -329,17 +638,12 @@ def _get_groq_llm(model: str, temperature: float, **kwargs) -> Any:
 
 def _get_gemini_llm(model: str, temperature: float, **kwargs) -> Any:
     """Initialize Google Gemini LLM"""
-    try:
-        from livekit.plugins import google
-    except ImportError:
-        raise ImportError(
-            "Google plugin not installed. Install with: pip install livekit-plugins-google"
-        )
+    google_llm = _load_llm_constructor("google", "Google")
     
     explicit_api_key = kwargs.pop("api_key", None)
     key_slot = kwargs.pop("key_slot", None)
 
-    active_slot_env = os.getenv("GEMINI_ACTIVE_KEY_SLOT", "").strip()
+    active_slot_env = _env("GEMINI_ACTIVE_KEY_SLOT", "").strip()
     preferred_slot: Optional[int] = None
     if key_slot is not None:
         try:
@@ -356,10 +660,10 @@ def _get_gemini_llm(model: str, temperature: float, **kwargs) -> Any:
         api_key = explicit_api_key
         selected_slot = preferred_slot or 0
     else:
-        oauth_1 = os.getenv("GEMINI_OAUTH_ACCESS_TOKEN", "").strip()
-        oauth_2 = os.getenv("GEMINI_OAUTH_ACCESS_TOKEN_2", "").strip()
-        key_1 = os.getenv("GEMINI_API_KEY", "").strip()
-        key_2 = os.getenv("GEMINI_API_KEY_2", "").strip()
+        oauth_1 = _env("GEMINI_OAUTH_ACCESS_TOKEN", "").strip()
+        oauth_2 = _env("GEMINI_OAUTH_ACCESS_TOKEN_2", "").strip()
+        key_1 = _env("GEMINI_API_KEY", "").strip()
+        key_2 = _env("GEMINI_API_KEY_2", "").strip()
         
         # Prioritize OAuth over API Keys for the same slot
         key_candidates = {
@@ -385,14 +689,11 @@ def _get_gemini_llm(model: str, temperature: float, **kwargs) -> Any:
             api_key = _validate_api_key("GEMINI_API_KEY", "Gemini")
             selected_slot = 1
 
-    model_name = model or LLM_DEFAULTS[LLMProvider.GEMINI]["model"]
+    model_name = model or _DEFAULT_MODEL["gemini"]
     
-    logger.info(
-        f"✅ Using Gemini model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
+    _log_model_selection("Gemini", model_name, selected_slot)
     
-    return google.LLM(
+    return google_llm(
         model=model_name,
         api_key=api_key,
         temperature=temperature,
@@ -402,12 +703,7 @@ def _get_gemini_llm(model: str, temperature: float, **kwargs) -> Any:
 
 def _get_anthropic_llm(model: str, temperature: float, **kwargs) -> Any:
     """Initialize Anthropic Claude LLM"""
-    try:
-        from livekit.plugins import anthropic
-    except ImportError:
-        raise ImportError(
-            "Anthropic plugin not installed. Install with: pip install livekit-plugins-anthropic"
-        )
+    anthropic_llm = _load_llm_constructor("anthropic", "Anthropic")
     
     explicit_api_key = kwargs.pop("api_key", None)
     key_slot = kwargs.pop("key_slot", None)
@@ -418,14 +714,11 @@ def _get_anthropic_llm(model: str, temperature: float, **kwargs) -> Any:
         explicit_api_key=explicit_api_key,
         key_slot=key_slot,
     )
-    model_name = model or LLM_DEFAULTS[LLMProvider.ANTHROPIC]["model"]
+    model_name = model or _DEFAULT_MODEL["anthropic"]
     
-    logger.info(
-        f"✅ Using Anthropic model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
+    _log_model_selection("Anthropic", model_name, selected_slot)
     
-    return anthropic.LLM(
+    return anthropic_llm(
         model=model_name,
         api_key=api_key,
         temperature=temperature,
@@ -435,24 +728,19 @@ def _get_anthropic_llm(model: str, temperature: float, **kwargs) -> Any:
 
 def _get_azure_openai_llm(model: str, temperature: float, **kwargs) -> Any:
     """Initialize Azure OpenAI LLM"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
+    with_azure = _load_llm_constructor("openai", "OpenAI", "LLM.with_azure")
     
     api_key = _validate_api_key("AZURE_OPENAI_API_KEY", "Azure OpenAI")
-    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-    api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
-    deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", model or "gpt-4o")
+    endpoint = _env("AZURE_OPENAI_ENDPOINT")
+    api_version = _env("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+    deployment = _env("AZURE_OPENAI_DEPLOYMENT", model or "gpt-4o")
     
     if not endpoint:
         raise ValueError("AZURE_OPENAI_ENDPOINT not found in environment")
     
-    logger.info(f"✅ Using Azure OpenAI deployment: {deployment}")
+    logger.info("✅ Using Azure OpenAI deployment: %s", deployment)
     
-    return openai.LLM.with_azure(
+    return with_azure(
         model=deployment,
         azure_endpoint=endpoint,
         api_key=api_key,
@@ -464,446 +752,298 @@ def _get_azure_openai_llm(model: str, temperature: float, **kwargs) -> Any:
 
 def _get_bedrock_llm(model: str, temperature: float, **kwargs) -> Any:
     """Initialize AWS Bedrock LLM"""
-    try:
-        from livekit.plugins import aws
-    except ImportError:
-        raise ImportError(
-            "AWS plugin not installed. Install with: pip install livekit-plugins-aws"
-        )
+    aws_llm = _load_llm_constructor("aws", "AWS")
     
     _validate_api_key("AWS_ACCESS_KEY_ID", "AWS")
     _validate_api_key("AWS_SECRET_ACCESS_KEY", "AWS")
     
-    region = os.getenv("AWS_REGION", "us-east-1")
-    model_name = model or LLM_DEFAULTS[LLMProvider.AWS_BEDROCK]["model"]
+    region = _env("AWS_REGION", "us-east-1")
+    model_name = model or _DEFAULT_MODEL["aws_bedrock"]
     
-    logger.info(f"✅ Using AWS Bedrock model: {model_name}")
+    logger.info("✅ Using AWS Bedrock model: %s", model_name)
     
-    return aws.LLM(
+    return aws_llm(
         model=model_name,
         region=region,
         **kwargs
     )
 
 
-def _get_together_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize Together.ai LLM (uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
-    
-    explicit_api_key = kwargs.pop("api_key", None)
-    key_slot = kwargs.pop("key_slot", None)
-    api_key, selected_slot = _resolve_multi_slot_api_key(
-        provider_prefix="TOGETHER",
-        provider_name="Together.ai",
-        base_env_var="TOGETHER_API_KEY",
-        explicit_api_key=explicit_api_key,
-        key_slot=key_slot,
-    )
-    model_name = model or LLM_DEFAULTS[LLMProvider.TOGETHER]["model"]
-    base_url = os.getenv("TOGETHER_BASE_URL", "https://api.together.xyz/v1")
-    
-    logger.info(
-        f"✅ Using Together.ai model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
-    
-    return openai.LLM(
-        model=model_name,
-        api_key=api_key,
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
-    )
-
-
-def _get_mistral_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize Mistral LLM (uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
-    
-    explicit_api_key = kwargs.pop("api_key", None)
-    key_slot = kwargs.pop("key_slot", None)
-    api_key, selected_slot = _resolve_multi_slot_api_key(
-        provider_prefix="MISTRAL",
-        provider_name="Mistral",
-        base_env_var="MISTRAL_API_KEY",
-        explicit_api_key=explicit_api_key,
-        key_slot=key_slot,
-    )
-    model_name = model or LLM_DEFAULTS[LLMProvider.MISTRAL]["model"]
-    base_url = os.getenv("MISTRAL_BASE_URL", "https://api.mistral.ai/v1")
-    
-    logger.info(
-        f"✅ Using Mistral model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
-    
-    return openai.LLM(
-        model=model_name,
-        api_key=api_key,
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
+class _OpenAICompatConfig(NamedTuple):
+    """Static settings for a provider served through the OpenAI-compatible API."""
+    provider: LLMProvider
+    name: str
+    env_prefix: Optional[str]  # None for local servers that need no API key
+    default_base_url: str
+    base_url_env: str
+    api_key_env: Optional[str]
+
+
+def _compat(
+    provider: LLMProvider, name: str, env_prefix: Optional[str], default_base_url: str
+) -> _OpenAICompatConfig:
+    """Build a table row with its env-var names derived and interned once."""
+    return _OpenAICompatConfig(
+        provider,
+        name,
+        env_prefix,
+        default_base_url,
+        sys.intern(f"{provider.value.upper()}_BASE_URL"),
+        sys.intern(f"{env_prefix}_API_KEY") if env_prefix else None,
     )
 
 
-def _get_perplexity_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize Perplexity LLM (uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
-    
-    explicit_api_key = kwargs.pop("api_key", None)
-    key_slot = kwargs.pop("key_slot", None)
-    api_key, selected_slot = _resolve_multi_slot_api_key(
-        provider_prefix="PERPLEXITY",
-        provider_name="Perplexity",
-        base_env_var="PERPLEXITY_API_KEY",
-        explicit_api_key=explicit_api_key,
-        key_slot=key_slot,
-    )
-    model_name = model or LLM_DEFAULTS[LLMProvider.PERPLEXITY]["model"]
-    base_url = os.getenv("PERPLEXITY_BASE_URL", "https://api.perplexity.ai")
-    
-    logger.info(
-        f"✅ Using Perplexity model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
-    
-    return openai.LLM(
-        model=model_name,
-        api_key=api_key,
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
-    )
+_OPENAI_COMPAT: Dict[str, _OpenAICompatConfig] = {
+    "together": _compat(LLMProvider.TOGETHER, "Together.ai", "TOGETHER", "https://api.together.xyz/v1"),
+    "mistral": _compat(LLMProvider.MISTRAL, "Mistral", "MISTRAL", "https://api.mistral.ai/v1"),
+    "perplexity": _compat(LLMProvider.PERPLEXITY, "Perplexity", "PERPLEXITY", "https://api.perplexity.ai"),
+    "ollama": _compat(LLMProvider.OLLAMA, "Ollama", None, "http://localhost:11434/v1"),
+    "vllm": _compat(LLMProvider.VLLM, "vLLM", None, "http://localhost:8000/v1"),
+    "deepseek": _compat(LLMProvider.DEEPSEEK, "DeepSeek", "DEEPSEEK", "https://api.deepseek.com"),
+    "qwen": _compat(LLMProvider.QWEN, "Qwen", "QWEN", "https://dashscope.aliyuncs.com/compatible-mode/v1"),
+    "nvidia": _compat(LLMProvider.NVIDIA, "Nvidia", "NVIDIA", "https://integrate.api.nvidia.com/v1"),
+}
 
 
-def _get_ollama_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize Ollama LLM (local, uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
-    
-    model_name = model or LLM_DEFAULTS[LLMProvider.OLLAMA]["model"]
-    base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
-    
-    logger.info(f"✅ Using Ollama model: {model_name} (local)")
-    
-    return openai.LLM(
-        model=model_name,
-        api_key="ollama",  # Ollama doesn't need a real key
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
-    )
+@functools.lru_cache(maxsize=32)
+def _openai_compat_builder(
+    openai_llm: Callable[..., Any], api_key: str, base_url: str, shared_pool: bool = False
+) -> Callable[..., Any]:
+    """Pre-bind the per-endpoint constants so a build only supplies model/temperature."""
+    if shared_pool:
+        # The client is looked up per build: it belongs to the running loop.
+        def build(**kwargs: Any) -> Any:
+            return openai_llm(client=_shared_openai_client(api_key, base_url), **kwargs)
 
+        return build
+    return functools.partial(openai_llm, api_key=api_key, base_url=base_url)
 
-def _get_vllm_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize vLLM LLM (local server, uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
-    
-    model_name = model or LLM_DEFAULTS[LLMProvider.VLLM]["model"]
-    base_url = os.getenv("VLLM_BASE_URL", "http://localhost:8000/v1")
-    
-    logger.info(f"✅ Using vLLM model: {model_name} (local server)")
-    
-    return openai.LLM(
-        model=model_name,
-        api_key="vllm",  # vLLM doesn't need a real key
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
-    )
 
+def _get_openai_compat_llm(key: str, model: str, temperature: float, **kwargs) -> Any:
+    """Initialize an LLM served through an OpenAI-compatible API (see _OPENAI_COMPAT)"""
+    cfg = _OPENAI_COMPAT[key]
+    openai_llm = _load_llm_constructor("openai", "OpenAI")
 
-def _get_deepseek_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize DeepSeek LLM (uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
-    
-    explicit_api_key = kwargs.pop("api_key", None)
-    key_slot = kwargs.pop("key_slot", None)
-    api_key, selected_slot = _resolve_multi_slot_api_key(
-        provider_prefix="DEEPSEEK",
-        provider_name="DeepSeek",
-        base_env_var="DEEPSEEK_API_KEY",
-        explicit_api_key=explicit_api_key,
-        key_slot=key_slot,
-    )
-    model_name = model or LLM_DEFAULTS[LLMProvider.DEEPSEEK]["model"]
-    base_url = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
-    
-    logger.info(
-        f"✅ Using DeepSeek model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
-    
-    return openai.LLM(
-        model=model_name,
-        api_key=api_key,
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
-    )
+    model_name = model or _DEFAULT_MODEL[cfg.provider.value]
+    base_url = _env(cfg.base_url_env, cfg.default_base_url)
 
-
-def _get_qwen_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize Qwen LLM (uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
+    if cfg.env_prefix is None:
+        # Local servers don't need a real key; the client just requires one.
+        api_key = key
+        logger.info("✅ Using %s model: %s (local)", cfg.name, model_name)
+    else:
+        explicit_api_key = kwargs.pop("api_key", None)
+        key_slot = kwargs.pop("key_slot", None)
+        api_key, selected_slot = _resolve_multi_slot_api_key(
+            provider_prefix=cfg.env_prefix,
+            provider_name=cfg.name,
+            base_env_var=cfg.api_key_env,
+            explicit_api_key=explicit_api_key,
+            key_slot=key_slot,
         )
-    
-    explicit_api_key = kwargs.pop("api_key", None)
-    key_slot = kwargs.pop("key_slot", None)
-    api_key, selected_slot = _resolve_multi_slot_api_key(
-        provider_prefix="QWEN",
-        provider_name="Qwen",
-        base_env_var="QWEN_API_KEY",
-        explicit_api_key=explicit_api_key,
-        key_slot=key_slot,
-    )
-    model_name = model or LLM_DEFAULTS[LLMProvider.QWEN]["model"]
-    base_url = os.getenv("QWEN_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1")
-    
-    logger.info(
-        f"✅ Using Qwen model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
-    
-    return openai.LLM(
-        model=model_name,
-        api_key=api_key,
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
-    )
+        _log_model_selection(cfg.name, model_name, selected_slot)
+
+    build = _openai_compat_builder(openai_llm, api_key, base_url, _use_shared_http_pool())
+    return build(model=model_name, temperature=temperature, **kwargs)
+
+
+# Canonical provider -> factory helper (aliases are folded by LLMProvider)
+_PROVIDER_DISPATCH: Dict[LLMProvider, Callable[..., Any]] = {
+    LLMProvider.OPENAI: _get_openai_llm,
+    LLMProvider.GROQ: _get_groq_llm,
+    LLMProvider.GEMINI: _get_gemini_llm,
+    LLMProvider.ANTHROPIC: _get_anthropic_llm,
+    LLMProvider.AZURE_OPENAI: _get_azure_openai_llm,
+    LLMProvider.AWS_BEDROCK: _get_bedrock_llm,
+    **{
+        cfg.provider: functools.partial(_get_openai_compat_llm, key)
+        for key, cfg in _OPENAI_COMPAT.items()
+    },
+}
 
 
-def _get_nvidia_llm(model: str, temperature: float, **kwargs) -> Any:
-    """Initialize Nvidia LLM (uses OpenAI-compatible API)"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
+@functools.cache
+def get_provider_info() -> Mapping[str, Mapping[str, Any]]:
+    """Provider information for documentation, built on first use."""
+    info = {
+        "openai": {
+            "name": "OpenAI",
+            "default_model": _DEFAULT_MODEL["openai"],
+            "env_vars": ("OPENAI_API_KEY", "OPENAI_API_KEY_<N>", "OPENAI_ACTIVE_KEY_SLOT", "OPENAI_SLOT_COUNT"),
+            "models": ("gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"),
+            "plugin": "livekit-plugins-openai",
+            "multi_slot_runtime": True,
+            "active_slot_env": "OPENAI_ACTIVE_KEY_SLOT",
+            "slot_count_env": "OPENAI_SLOT_COUNT",
+            "dynamic_key_pattern": "OPENAI_API_KEY_<N>",
+        },
+        "groq": {
+            "name": "Groq",
+            "default_model": _DEFAULT_MODEL["groq"],
+            "env_vars": ("GROQ_API_KEY", "GROQ_API_KEY_<N>", "GROQ_ACTIVE_KEY_SLOT", "GROQ_SLOT_COUNT"),
+            "models": ("llama-3.1-8b-instant", "llama-3.3-70b-versatile", "gemma2-9b-it", "mixtral-8x7b-32768"),
+            "plugin": "livekit-plugins-groq",
+            "multi_slot_runtime": True,
+            "active_slot_env": "GROQ_ACTIVE_KEY_SLOT",
+            "slot_count_env": "GROQ_SLOT_COUNT",
+            "dynamic_key_pattern": "GROQ_API_KEY_<N>",
+        },
+        "gemini": {
+            "name": "Google Gemini",
+            "default_model": _DEFAULT_MODEL["gemini"],
+            "env_vars": ("GEMINI_OAUTH_ACCESS_TOKEN", "GEMINI_OAUTH_ACCESS_TOKEN_<N>", "GEMINI_OAUTH_REFRESH_TOKEN", "GEMINI_OAUTH_REFRESH_TOKEN_<N>", "GEMINI_API_KEY", "GEMINI_API_KEY_<N>", "GEMINI_ACTIVE_KEY_SLOT", "GEMINI_SLOT_COUNT"),
+            "models": ("gemini-2.0-flash-exp", "gemini-1.5-pro", "gemini-1.5-flash"),
+            "plugin": "livekit-plugins-google",
+            "multi_slot_runtime": True,
+            "active_slot_env": "GEMINI_ACTIVE_KEY_SLOT",
+            "slot_count_env": "GEMINI_SLOT_COUNT",
+            "dynamic_key_pattern": "GEMINI_API_KEY_<N>",
+        },
+        "anthropic": {
+            "name": "Anthropic Claude",
+            "default_model": _DEFAULT_MODEL["anthropic"],
+            "env_vars": ("ANTHROPIC_API_KEY", "ANTHROPIC_API_KEY_<N>", "ANTHROPIC_ACTIVE_KEY_SLOT", "ANTHROPIC_SLOT_COUNT"),
+            "models": ("claude-3-5-sonnet-20241022", "claude-3-opus-20240229", "claude-3-haiku-20240307"),
+            "plugin": "livekit-plugins-anthropic",
+            "multi_slot_runtime": True,
+            "active_slot_env": "ANTHROPIC_ACTIVE_KEY_SLOT",
+            "slot_count_env": "ANTHROPIC_SLOT_COUNT",
+            "dynamic_key_pattern": "ANTHROPIC_API_KEY_<N>",
+        },
+        "azure_openai": {
+            "name": "Azure OpenAI",
+            "default_model": _DEFAULT_MODEL["azure_openai"],
+            "env_vars": ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_DEPLOYMENT"),
+            "models": ("gpt-4o", "gpt-4", "gpt-35-turbo"),
+            "plugin": "livekit-plugins-openai",
+        },
+        "aws_bedrock": {
+            "name": "AWS Bedrock",
+            "default_model": _DEFAULT_MODEL["aws_bedrock"],
+            "env_vars": ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"),
+            "models": ("anthropic.claude-3-sonnet-20240229-v1:0", "amazon.titan-text-lite-v1"),
+            "plugin": "livekit-plugins-aws",
+        },
+        "together": {
+            "name": "Together.ai",
+            "default_model": _DEFAULT_MODEL["together"],
+            "env_vars": ("TOGETHER_API_KEY", "TOGETHER_API_KEY_<N>", "TOGETHER_ACTIVE_KEY_SLOT", "TOGETHER_SLOT_COUNT"),
+            "models": ("meta-llama/Llama-3-70b-chat-hf", "mistralai/Mixtral-8x7B-Instruct-v0.1"),
+            "plugin": "livekit-plugins-openai",
+            "multi_slot_runtime": True,
+            "active_slot_env": "TOGETHER_ACTIVE_KEY_SLOT",
+            "slot_count_env": "TOGETHER_SLOT_COUNT",
+            "dynamic_key_pattern": "TOGETHER_API_KEY_<N>",
+        },
+        "mistral": {
+            "name": "Mistral AI",
+            "default_model": _DEFAULT_MODEL["mistral"],
+            "env_vars": ("MISTRAL_API_KEY", "MISTRAL_API_KEY_<N>", "MISTRAL_ACTIVE_KEY_SLOT", "MISTRAL_SLOT_COUNT"),
+            "models": ("mistral-large-latest", "mistral-medium", "mistral-small"),
+            "plugin": "livekit-plugins-openai",
+            "multi_slot_runtime": True,
+            "active_slot_env": "MISTRAL_ACTIVE_KEY_SLOT",
+            "slot_count_env": "MISTRAL_SLOT_COUNT",
+            "dynamic_key_pattern": "MISTRAL_API_KEY_<N>",
+        },
+        "perplexity": {
+            "name": "Perplexity AI",
+            "default_model": _DEFAULT_MODEL["perplexity"],
+            "env_vars": ("PERPLEXITY_API_KEY", "PERPLEXITY_API_KEY_<N>", "PERPLEXITY_ACTIVE_KEY_SLOT", "PERPLEXITY_SLOT_COUNT"),
+            "models": ("llama-3.1-sonar-large-128k-online", "llama-3.1-sonar-small-128k-online"),
+            "plugin": "livekit-plugins-openai",
+            "multi_slot_runtime": True,
+            "active_slot_env": "PERPLEXITY_ACTIVE_KEY_SLOT",
+            "slot_count_env": "PERPLEXITY_SLOT_COUNT",
+            "dynamic_key_pattern": "PERPLEXITY_API_KEY_<N>",
+        },
+        "ollama": {
+            "name": "Ollama (Local)",
+            "default_model": _DEFAULT_MODEL["ollama"],
+            "env_vars": ("OLLAMA_BASE_URL",),
+            "models": ("llama3", "mistral", "codellama"),
+            "plugin": "livekit-plugins-openai",
+        },
+        "vllm": {
+            "name": "vLLM (Local Server)",
+            "default_model": _DEFAULT_MODEL["vllm"],
+            "env_vars": ("VLLM_BASE_URL",),
+            "models": ("meta-llama/Llama-3-8b-chat-hf",),
+            "plugin": "livekit-plugins-openai",
+        },
+        "deepseek": {
+            "name": "DeepSeek",
+            "default_model": _DEFAULT_MODEL["deepseek"],
+            "env_vars": ("DEEPSEEK_API_KEY", "DEEPSEEK_API_KEY_<N>", "DEEPSEEK_ACTIVE_KEY_SLOT", "DEEPSEEK_SLOT_COUNT"),
+            "models": ("deepseek-chat", "deepseek-coder"),
+            "plugin": "livekit-plugins-openai",
+            "multi_slot_runtime": True,
+            "active_slot_env": "DEEPSEEK_ACTIVE_KEY_SLOT",
+            "slot_count_env": "DEEPSEEK_SLOT_COUNT",
+            "dynamic_key_pattern": "DEEPSEEK_API_KEY_<N>",
+        },
+        "qwen": {
+            "name": "Qwen (Alibaba)",
+            "default_model": _DEFAULT_MODEL["qwen"],
+            "env_vars": ("QWEN_API_KEY", "QWEN_API_KEY_<N>", "QWEN_ACTIVE_KEY_SLOT", "QWEN_SLOT_COUNT"),
+            "models": ("qwen-turbo", "qwen-plus", "qwen-max"),
+            "plugin": "livekit-plugins-openai",
+            "multi_slot_runtime": True,
+            "active_slot_env": "QWEN_ACTIVE_KEY_SLOT",
+            "slot_count_env": "QWEN_SLOT_COUNT",
+            "dynamic_key_pattern": "QWEN_API_KEY_<N>",
+        },
+        "nvidia": {
+            "name": "Nvidia (NIM)",
+            "default_model": _DEFAULT_MODEL["nvidia"],
+            "env_vars": ("NVIDIA_API_KEY", "NVIDIA_API_KEY_<N>", "NVIDIA_ACTIVE_KEY_SLOT", "NVIDIA_SLOT_COUNT"),
+            "models": (
+                "meta/llama-3.1-405b-instruct",
+                "meta/llama-3.1-70b-instruct",
+                "meta/llama-3.1-8b-instruct",
+                "mistralai/mixtral-8x22b-instruct-v0.1",
+                "mistralai/mistral-large-2-instruct",
+                "nvidia/nemotron-4-340b-instruct",
+                "google/gemma-2-27b-it",
+            ),
+            "plugin": "livekit-plugins-openai",
+            "multi_slot_runtime": True,
+            "active_slot_env": "NVIDIA_ACTIVE_KEY_SLOT",
+            "slot_count_env": "NVIDIA_SLOT_COUNT",
+            "dynamic_key_pattern": "NVIDIA_API_KEY_<N>",
+        },
+    }
+    return MappingProxyType({
+        provider_id: MappingProxyType(entry) for provider_id, entry in info.items()
+    })
+
+
+def __getattr__(name: str) -> Any:
+    # PROVIDER_INFO used to be a module-level dict; keep it importable.
+    if name == "PROVIDER_INFO":
+        return get_provider_info()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _format_provider_listing() -> str:
+    parts = ["\n🤖 Available LLM Providers:\n\n"]
+    for provider_id, info in get_provider_info().items():
+        parts.append(
+            f"  {provider_id.upper()}\n"
+            f"    Name: {info['name']}\n"
+            f"    Default Model: {info['default_model']}\n"
+            f"    Available Models: {', '.join(info['models'])}\n"
+            f"    Required Env Vars: {', '.join(info['env_vars'])}\n"
+            f"    Plugin: {info['plugin']}\n\n"
         )
-    
-    explicit_api_key = kwargs.pop("api_key", None)
-    key_slot = kwargs.pop("key_slot", None)
-    api_key, selected_slot = _resolve_multi_slot_api_key(
-        provider_prefix="NVIDIA",
-        provider_name="Nvidia",
-        base_env_var="NVIDIA_API_KEY",
-        explicit_api_key=explicit_api_key,
-        key_slot=key_slot,
-    )
-    model_name = model or LLM_DEFAULTS[LLMProvider.NVIDIA]["model"]
-    base_url = os.getenv("NVIDIA_BASE_URL", "https://integrate.api.nvidia.com/v1")
-    
-    logger.info(
-        f"✅ Using Nvidia model: {model_name}"
-        + (f" (key slot {selected_slot})" if selected_slot else "")
-    )
-    
-    return openai.LLM(
-        model=model_name,
-        api_key=api_key,
-        base_url=base_url,
-        temperature=temperature,
-        **kwargs
-    )
-
-
-# Provider information for documentation
-PROVIDER_INFO: Dict[str, Dict] = {
-    "openai": {
-        "name": "OpenAI",
-        "default_model": LLM_DEFAULTS[LLMProvider.OPENAI]["model"],
-        "env_vars": ["OPENAI_API_KEY", "OPENAI_API_KEY_<N>", "OPENAI_ACTIVE_KEY_SLOT", "OPENAI_SLOT_COUNT"],
-        "models": ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"],
-        "plugin": "livekit-plugins-openai",
-        "multi_slot_runtime": True,
-        "active_slot_env": "OPENAI_ACTIVE_KEY_SLOT",
-        "slot_count_env": "OPENAI_SLOT_COUNT",
-        "dynamic_key_pattern": "OPENAI_API_KEY_<N>",
-    },
-    "groq": {
-        "name": "Groq",
-        "default_model": LLM_DEFAULTS[LLMProvider.GROQ]["model"],
-        "env_vars": ["GROQ_API_KEY", "GROQ_API_KEY_<N>", "GROQ_ACTIVE_KEY_SLOT", "GROQ_SLOT_COUNT"],
-        "models": ["llama-3.1-8b-instant", "llama-3.3-70b-versatile", "gemma2-9b-it", "mixtral-8x7b-32768"],
-        "plugin": "livekit-plugins-groq",
-        "multi_slot_runtime": True,
-        "active_slot_env": "GROQ_ACTIVE_KEY_SLOT",
-        "slot_count_env": "GROQ_SLOT_COUNT",
-        "dynamic_key_pattern": "GROQ_API_KEY_<N>",
-    },
-    "gemini": {
-        "name": "Google Gemini",
-        "default_model": LLM_DEFAULTS[LLMProvider.GEMINI]["model"],
-        "env_vars": ["GEMINI_OAUTH_ACCESS_TOKEN", "GEMINI_OAUTH_ACCESS_TOKEN_<N>", "GEMINI_OAUTH_REFRESH_TOKEN", "GEMINI_OAUTH_REFRESH_TOKEN_<N>", "GEMINI_API_KEY", "GEMINI_API_KEY_<N>", "GEMINI_ACTIVE_KEY_SLOT", "GEMINI_SLOT_COUNT"],
-        "models": ["gemini-2.0-flash-exp", "gemini-1.5-pro", "gemini-1.5-flash"],
-        "plugin": "livekit-plugins-google",
-        "multi_slot_runtime": True,
-        "active_slot_env": "GEMINI_ACTIVE_KEY_SLOT",
-        "slot_count_env": "GEMINI_SLOT_COUNT",
-        "dynamic_key_pattern": "GEMINI_API_KEY_<N>",
-    },
-    "anthropic": {
-        "name": "Anthropic Claude",
-        "default_model": LLM_DEFAULTS[LLMProvider.ANTHROPIC]["model"],
-        "env_vars": ["ANTHROPIC_API_KEY", "ANTHROPIC_API_KEY_<N>", "ANTHROPIC_ACTIVE_KEY_SLOT", "ANTHROPIC_SLOT_COUNT"],
-        "models": ["claude-3-5-sonnet-20241022", "claude-3-opus-20240229", "claude-3-haiku-20240307"],
-        "plugin": "livekit-plugins-anthropic",
-        "multi_slot_runtime": True,
-        "active_slot_env": "ANTHROPIC_ACTIVE_KEY_SLOT",
-        "slot_count_env": "ANTHROPIC_SLOT_COUNT",
-        "dynamic_key_pattern": "ANTHROPIC_API_KEY_<N>",
-    },
-    "azure_openai": {
-        "name": "Azure OpenAI",
-        "default_model": LLM_DEFAULTS[LLMProvider.AZURE_OPENAI]["model"],
-        "env_vars": ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_DEPLOYMENT"],
-        "models": ["gpt-4o", "gpt-4", "gpt-35-turbo"],
-        "plugin": "livekit-plugins-openai",
-    },
-    "aws_bedrock": {
-        "name": "AWS Bedrock",
-        "default_model": LLM_DEFAULTS[LLMProvider.AWS_BEDROCK]["model"],
-        "env_vars": ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"],
-        "models": ["anthropic.claude-3-sonnet-20240229-v1:0", "amazon.titan-text-lite-v1"],
-        "plugin": "livekit-plugins-aws",
-    },
-    "together": {
-        "name": "Together.ai",
-        "default_model": LLM_DEFAULTS[LLMProvider.TOGETHER]["model"],
-        "env_vars": ["TOGETHER_API_KEY", "TOGETHER_API_KEY_<N>", "TOGETHER_ACTIVE_KEY_SLOT", "TOGETHER_SLOT_COUNT"],
-        "models": ["meta-llama/Llama-3-70b-chat-hf", "mistralai/Mixtral-8x7B-Instruct-v0.1"],
-        "plugin": "livekit-plugins-openai",
-        "multi_slot_runtime": True,
-        "active_slot_env": "TOGETHER_ACTIVE_KEY_SLOT",
-        "slot_count_env": "TOGETHER_SLOT_COUNT",
-        "dynamic_key_pattern": "TOGETHER_API_KEY_<N>",
-    },
-    "mistral": {
-        "name": "Mistral AI",
-        "default_model": LLM_DEFAULTS[LLMProvider.MISTRAL]["model"],
-        "env_vars": ["MISTRAL_API_KEY", "MISTRAL_API_KEY_<N>", "MISTRAL_ACTIVE_KEY_SLOT", "MISTRAL_SLOT_COUNT"],
-        "models": ["mistral-large-latest", "mistral-medium", "mistral-small"],
-        "plugin": "livekit-plugins-openai",
-        "multi_slot_runtime": True,
-        "active_slot_env": "MISTRAL_ACTIVE_KEY_SLOT",
-        "slot_count_env": "MISTRAL_SLOT_COUNT",
-        "dynamic_key_pattern": "MISTRAL_API_KEY_<N>",
-    },
-    "perplexity": {
-        "name": "Perplexity AI",
-        "default_model": LLM_DEFAULTS[LLMProvider.PERPLEXITY]["model"],
-        "env_vars": ["PERPLEXITY_API_KEY", "PERPLEXITY_API_KEY_<N>", "PERPLEXITY_ACTIVE_KEY_SLOT", "PERPLEXITY_SLOT_COUNT"],
-        "models": ["llama-3.1-sonar-large-128k-online", "llama-3.1-sonar-small-128k-online"],
-        "plugin": "livekit-plugins-openai",
-        "multi_slot_runtime": True,
-        "active_slot_env": "PERPLEXITY_ACTIVE_KEY_SLOT",
-        "slot_count_env": "PERPLEXITY_SLOT_COUNT",
-        "dynamic_key_pattern": "PERPLEXITY_API_KEY_<N>",
-    },
-    "ollama": {
-        "name": "Ollama (Local)",
-        "default_model": LLM_DEFAULTS[LLMProvider.OLLAMA]["model"],
-        "env_vars": ["OLLAMA_BASE_URL"],
-        "models": ["llama3", "mistral", "codellama"],
-        "plugin": "livekit-plugins-openai",
-    },
-    "vllm": {
-        "name": "vLLM (Local Server)",
-        "default_model": LLM_DEFAULTS[LLMProvider.VLLM]["model"],
-        "env_vars": ["VLLM_BASE_URL"],
-        "models": ["meta-llama/Llama-3-8b-chat-hf"],
-        "plugin": "livekit-plugins-openai",
-    },
-    "deepseek": {
-        "name": "DeepSeek",
-        "default_model": LLM_DEFAULTS[LLMProvider.DEEPSEEK]["model"],
-        "env_vars": ["DEEPSEEK_API_KEY", "DEEPSEEK_API_KEY_<N>", "DEEPSEEK_ACTIVE_KEY_SLOT", "DEEPSEEK_SLOT_COUNT"],
-        "models": ["deepseek-chat", "deepseek-coder"],
-        "plugin": "livekit-plugins-openai",
-        "multi_slot_runtime": True,
-        "active_slot_env": "DEEPSEEK_ACTIVE_KEY_SLOT",
-        "slot_count_env": "DEEPSEEK_SLOT_COUNT",
-        "dynamic_key_pattern": "DEEPSEEK_API_KEY_<N>",
-    },
-    "qwen": {
-        "name": "Qwen (Alibaba)",
-        "default_model": LLM_DEFAULTS[LLMProvider.QWEN]["model"],
-        "env_vars": ["QWEN_API_KEY", "QWEN_API_KEY_<N>", "QWEN_ACTIVE_KEY_SLOT", "QWEN_SLOT_COUNT"],
-        "models": ["qwen-turbo", "qwen-plus", "qwen-max"],
-        "plugin": "livekit-plugins-openai",
-        "multi_slot_runtime": True,
-        "active_slot_env": "QWEN_ACTIVE_KEY_SLOT",
-        "slot_count_env": "QWEN_SLOT_COUNT",
-        "dynamic_key_pattern": "QWEN_API_KEY_<N>",
-    },
-    "nvidia": {
-        "name": "Nvidia (NIM)",
-        "default_model": LLM_DEFAULTS[LLMProvider.NVIDIA]["model"],
-        "env_vars": ["NVIDIA_API_KEY", "NVIDIA_API_KEY_<N>", "NVIDIA_ACTIVE_KEY_SLOT", "NVIDIA_SLOT_COUNT"],
-        "models": [
-            "meta/llama-3.1-405b-instruct",
-            "meta/llama-3.1-70b-instruct",
-            "meta/llama-3.1-8b-instruct",
-            "mistralai/mixtral-8x22b-instruct-v0.1",
-            "mistralai/mistral-large-2-instruct",
-            "nvidia/nemotron-4-340b-instruct",
-            "google/gemma-2-27b-it"
-        ],
-        "plugin": "livekit-plugins-openai",
-        "multi_slot_runtime": True,
-        "active_slot_env": "NVIDIA_ACTIVE_KEY_SLOT",
-        "slot_count_env": "NVIDIA_SLOT_COUNT",
-        "dynamic_key_pattern": "NVIDIA_API_KEY_<N>",
-    },
-}
+    return "".join(parts)
 
 
 def list_llm_providers() -> None:
     """Print information about all available LLM providers"""
-    print("\n🤖 Available LLM Providers:\n")
-    for provider_id, info in PROVIDER_INFO.items():
-        print(f"  {provider_id.upper()}")
-        print(f"    Name: {info['name']}")
-        print(f"    Default Model: {info['default_model']}")
-        print(f"    Available Models: {', '.join(info['models'])}")
-        print(f"    Required Env Vars: {', '.join(info['env_vars'])}")
-        print(f"    Plugin: {info['plugin']}")
-        print()
+    sys.stdout.write(_format_provider_listing())
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -23,6 +23,29 @@ class LLMProvider(str, Enum):
     QWEN = "qwen"
     NVIDIA = "nvidia"
 
+    @classmethod
+    def _missing_(cls, value):
+        """Resolve case/whitespace variants and aliases (e.g. "google", "bedrock")."""
+        if isinstance(value, str):
+            normalized = value.strip().lower().replace("-", "_")
+            member = cls._value2member_map_.get(normalized)
+            if member is None:
+                member = _LLM_PROVIDER_ALIASES.get(normalized)
+            return member
+        return None
+
+
+# Alternate names accepted by LLMProvider(...) in addition to member values
+_LLM_PROVIDER_ALIASES = {
+    "google": LLMProvider.GEMINI,
+    "claude": LLMProvider.ANTHROPIC,
+    "azureopenai": LLMProvider.AZURE_OPENAI,
+    "bedrock": LLMProvider.AWS_BEDROCK,
+    "aws": LLMProvider.AWS_BEDROCK,
+    "together_ai": LLMProvider.TOGETHER,
+    "togetherai": LLMProvider.TOGETHER,
+}
+
 
 class STTProvider(str, Enum):
     """Supported Speech-to-Text Providers"""
@@ -15,20 +15,114 @@ Supported Providers:
 - Whisper.cpp (offline)
 """
 
+from __future__ import annotations
+
+import functools
 import inspect
 import os
 import logging
 import re
 import socket
-from typing import Any, Optional, Dict
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Dict
 
+from ._plugins import load_plugin
 from .provider_types import STTProvider, STT_DEFAULTS
 
-# Plugins are lazy-loaded in factory functions to prevent import deadlocks
-# and ensure proper initialization context.
+_SUPPORTED_STT_PROVIDER_VALUES = tuple(p.value for p in STTProvider)
+
+# Default model per provider value, flattened once at import
+_DEFAULT_MODEL: Dict[str, str] = {
+    provider.value: config["model"] for provider, config in STT_DEFAULTS.items()
+}
+
+# Plugins are lazy-loaded by _require_plugin() on first use to prevent
+# import deadlocks and ensure proper initialization context.
+# module under livekit.plugins -> display label
+_PLUGIN_LABELS: Dict[str, str] = {
+    "groq": "Groq",
+    "openai": "OpenAI",
+    "deepgram": "Deepgram",
+    "assemblyai": "AssemblyAI",
+    "google": "Google",
+    "azure": "Azure",
+    "aws": "AWS",
+}
 
 logger = logging.getLogger(__name__)
 
+# Error message templates, formatted only on the failure path
+_UNSUPPORTED_PROVIDER_MSG = (
+    "❌ Unsupported STT provider: '{provider}'. "
+    f"Supported providers: {_SUPPORTED_STT_PROVIDER_VALUES}"
+)
+_MISSING_KEY_MSG = "❌ {env_var} not found in environment. Please set {env_var} in your .env file."
+_MODEL_PATH_MISSING_MSG = "❌ {env_var} not set. Download a model from {url} and set the path."
+_CUSTOM_WRAPPER_MSG = (
+    "{label} STT integration requires custom implementation. "
+    "Use a different provider or implement {wrapper} wrapper."
+)
+
+
+def _require_plugin(name: str) -> Any:
+    return load_plugin(name, _PLUGIN_LABELS[name])
+
+
+def __getattr__(name: str) -> Any:
+    if name == "STT_PROVIDER_INFO":
+        # Kept importable; the table itself is only built when asked for.
+        return _provider_info()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Region-qualified language code as AWS Transcribe expects it, e.g. "en-US"
+_BCP47_RE = re.compile(r"^[a-z]{2}-[A-Z]{2}$")
+
+# AWS Transcribe requires full language codes in BCP-47 format
+# Map common 2-letter codes to their appropriate regional variants
+_AWS_LANGUAGE_MAPPINGS: Dict[str, str] = {
+    "en": "en-US",
+    "es": "es-US",
+    "fr": "fr-FR",
+    "de": "de-DE",
+    "it": "it-IT",
+    "pt": "pt-BR",  # Brazilian Portuguese is more common
+    "zh": "zh-CN",  # Simplified Chinese (Mandarin)
+    "ja": "ja-JP",
+    "ko": "ko-KR",
+    "ar": "ar-SA",  # Modern Standard Arabic
+    "hi": "hi-IN",
+    "ru": "ru-RU",
+    "nl": "nl-NL",
+    "sv": "sv-SE",
+    "no": "no-NO",
+    "da": "da-DK",
+    "fi": "fi-FI",
+    "pl": "pl-PL",
+    "tr": "tr-TR",
+    "th": "th-TH",
+    "vi": "vi-VN",
+}
+_AWS_SUPPORTED_CODES_STR = ", ".join(sorted(_AWS_LANGUAGE_MAPPINGS))
+_AWS_LANGUAGES_URL = "https://docs.aws.amazon.com/transcribe/latest/dg/supported-languages.html"
+_AWS_LANG_FORMAT_WARNING = (
+    "⚠️ Language code '%s' may not be properly formatted. "
+    "Expected format: 'xx-YY' (e.g., 'en-US'). "
+    f"See: {_AWS_LANGUAGES_URL}"
+)
+_AWS_LANG_ERROR_TEMPLATE = (
+    "❌ Unsupported language code: '{language}'. "
+    "Please provide full BCP-47 format (e.g., 'en-US', '{language}-XX') or use a supported code. "
+    "Supported 2-letter codes: {supported}. "
+    f"Full list: {_AWS_LANGUAGES_URL}"
+)
+
+
+# Transcript filters, compiled once; is_valid_voice_transcript runs per utterance
+_NOISE_MARKER_RE = re.compile(r"\[(inaudible|noise|silence)\]")
+_REPEATED_CHAR_RE = re.compile(r"([a-z])\1{5,}")
+
 
 def is_valid_voice_transcript(text: str) -> bool:
     """Basic quality filter to drop obvious STT fragments/drift."""
@@ -37,10 +131,10 @@ def is_valid_voice_transcript(text: str) -> bool:
         return False
 
     sample_lower = sample.lower()
-    if re.search(r"\[(inaudible|noise|silence)\]", sample_lower):
+    if _NOISE_MARKER_RE.search(sample_lower):
         return False
 
-    if re.search(r"([a-z])\1{5,}", sample_lower):
+    if _REPEATED_CHAR_RE.search(sample_lower):
         return False
 
     filler_tokens = [w.strip(".,!?;:") for w in sample_lower.split()]
@@ -68,7 +162,7 @@ def _resolve_deepgram_runtime_config(
     default_language = language or STT_DEFAULTS[STTProvider.DEEPGRAM]["language"]
     resolved_language = os.getenv("DEEPGRAM_LANGUAGE", default_language)
 
-    default_model = model or STT_DEFAULTS[STTProvider.DEEPGRAM]["model"]
+    default_model = model or _DEFAULT_MODEL["deepgram"]
     resolved_model = os.getenv("DEEPGRAM_MODEL", default_model)
 
     options: Dict[str, Any] = dict(kwargs)
@@ -213,6 +307,8 @@ def get_stt_provider(
     provider_name: str,
     language: str = "en",
     model: str = "",
+    *,
+    use_cache: bool = True,
     **kwargs
 ) -> Any:
     """
@@ -222,10 +318,14 @@ def get_stt_provider(
         provider_name: Name of the provider (e.g., "groq", "deepgram", "openai")
         language: Language code for transcription (default: "en")
         model: Model name to use (provider-specific, uses default if empty)
+        use_cache: Reuse the instance built for the same arguments (default: True)
         **kwargs: Additional provider-specific arguments
     
     Returns:
-        LiveKit-compatible STT instance
+        LiveKit-compatible STT instance. Cached instances are shared between
+        callers; LiveKit STT objects open a separate stream per session, so
+        sharing one is safe. Calls whose kwargs cannot be frozen into a
+        hashable key are never cached.
     
     Raises:
         ValueError: If provider is not supported or API key is missing
@@ -234,70 +334,122 @@ def get_stt_provider(
         >>> stt = get_stt_provider("groq", language="en")
         >>> stt = get_stt_provider("deepgram", language="en", model="nova-2")
     """
-    provider = provider_name.lower().strip()
-    
-    logger.info(f"🎙️ Initializing STT provider: {provider}")
+    # Names from config are usually canonical already; skip the re-normalize.
+    # Normalized names are interned so the dispatch and cache lookups that
+    # follow can match the (interned literal) table keys by identity.
+    if provider_name in _STT_DISPATCH:
+        provider = provider_name
+    else:
+        provider = sys.intern(provider_name.strip().lower())
+
+    if use_cache:
+        try:
+            frozen = _FrozenKwargs(kwargs)
+        except TypeError:
+            frozen = None
+        if frozen is not None:
+            return _build_stt_cached(provider, language, model, frozen)
+    return _build_stt(provider, language, model, **kwargs)
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable, order-independent stand-in for a kwargs value (TypeError if impossible)."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(v) for v in value))
+    hash(value)
+    return value
+
+
+class _FrozenKwargs:
+    """
+    Cache-key wrapper for get_stt_provider kwargs: hashes and compares by the
+    frozen form, so equivalent kwargs (any order, list values) share an
+    entry, while the builder still receives the caller's original objects.
+    """
+
+    __slots__ = ("kwargs", "key", "_hash")
+
+    def __init__(self, kwargs: Dict[str, Any]) -> None:
+        self.kwargs = kwargs
+        self.key = tuple(sorted((name, _freeze(value)) for name, value in kwargs.items()))
+        self._hash = hash(self.key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _FrozenKwargs) and self.key == other.key
+
+
+@functools.lru_cache(maxsize=32)
+def _build_stt_cached(provider: str, language: str, model: str, frozen: _FrozenKwargs) -> Any:
+    return _build_stt(provider, language, model, **frozen.kwargs)
+
+
+def clear_stt_cache() -> None:
+    """Drop all cached STT instances (useful for testing and key rotation)."""
+    _build_stt_cached.cache_clear()
+
+
+get_stt_provider.cache_clear = clear_stt_cache
+
+
+def _build_stt(provider: str, language: str, model: str, **kwargs) -> Any:
+    logger.info("🎙️ Initializing STT provider: %s", provider)
     
     try:
-        match provider:
-            case "groq":
-                return _get_groq_stt(language, model, **kwargs)
-            case "openai" | "whisper":
-                return _get_openai_stt(language, model, **kwargs)
-            case "deepgram":
-                return _get_deepgram_stt(language, model, **kwargs)
-            case "assemblyai" | "assembly":
-                return _get_assemblyai_stt(language, model, **kwargs)
-            case "google" | "google_speech":
-                return _get_google_stt(language, model, **kwargs)
-            case "azure" | "azure_speech":
-                return _get_azure_stt(language, model, **kwargs)
-            case "aws_transcribe" | "aws" | "transcribe":
-                return _get_aws_transcribe_stt(language, model, **kwargs)
-            case "vosk":
-                return _get_vosk_stt(language, model, **kwargs)
-            case "whisper_cpp" | "whispercpp":
-                return _get_whisper_cpp_stt(language, model, **kwargs)
-            case _:
-                raise ValueError(
-                    f"❌ Unsupported STT provider: '{provider}'. "
-                    f"Supported providers: {[p.value for p in STTProvider]}"
-                )
+        handler = _STT_DISPATCH.get(provider)
+        if handler is None:
+            raise ValueError(_UNSUPPORTED_PROVIDER_MSG.format(provider=provider))
+        return handler(language, model, **kwargs)
     except ImportError as e:
-        logger.error(f"❌ Missing plugin for {provider}: {e}")
+        logger.error("❌ Missing plugin for %s: %s", provider, e)
         raise
     except ValueError as e:
-        logger.error(f"❌ Configuration error for {provider}: {e}")
+        logger.error("❌ Configuration error for %s: %s", provider, e)
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to initialize {provider}: {e}")
+        logger.error("❌ Failed to initialize %s: %s", provider, e)
         raise
 
 
+@functools.lru_cache(maxsize=None)
 def _validate_api_key(env_var: str, provider_name: str) -> str:
-    """Validate that an API key exists in environment"""
+    """
+    Validate that an API key exists in environment.
+    Found keys are memoized (failures are not); call invalidate_env_cache()
+    after changing keys at runtime.
+    """
     api_key = os.getenv(env_var)
     if not api_key:
-        raise ValueError(
-            f"❌ {env_var} not found in environment. "
-            f"Please set {env_var} in your .env file."
-        )
+        raise ValueError(_MISSING_KEY_MSG.format(env_var=env_var))
     return api_key
 
 
+@functools.cache
+def _get_env(key: str, default: str) -> str:
+    """Memoized os.environ read for settings fixed at deploy time (regions)."""
+    return os.environ.get(key, default)
+
+
+def invalidate_env_cache() -> None:
+    """Forget memoized environment reads so the next build re-reads os.environ."""
+    _validate_api_key.cache_clear()
+    _get_env.cache_clear()
+
+
 def _get_groq_stt(language: str, model: str, **kwargs) -> Any:
     """Initialize Groq STT (Whisper Turbo)"""
-    try:
-        from livekit.plugins import groq
-    except ImportError:
-        raise ImportError(
-            "Groq plugin not installed. Install with: pip install livekit-plugins-groq"
-        )
+    groq = _require_plugin("groq")
     
     _validate_api_key("GROQ_API_KEY", "Groq")
-    model_name = model or STT_DEFAULTS[STTProvider.GROQ]["model"]
+    model_name = model or _DEFAULT_MODEL["groq"]
     
-    logger.info(f"✅ Using Groq STT model: {model_name}, language: {language}")
+    logger.info("✅ Using Groq STT model: %s, language: %s", model_name, language)
     
     return groq.STT(
         model=model_name,
@@ -308,17 +460,12 @@ def _get_groq_stt(language: str, model: str, **kwargs) -> Any:
 
 def _get_openai_stt(language: str, model: str, **kwargs) -> Any:
     """Initialize OpenAI Whisper STT"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
+    openai = _require_plugin("openai")
     
     api_key = _validate_api_key("OPENAI_API_KEY", "OpenAI")
-    model_name = model or STT_DEFAULTS[STTProvider.OPENAI]["model"]
+    model_name = model or _DEFAULT_MODEL["openai"]
     
-    logger.info(f"✅ Using OpenAI Whisper model: {model_name}, language: {language}")
+    logger.info("✅ Using OpenAI Whisper model: %s, language: %s", model_name, language)
     
     return openai.STT(
         model=model_name,
@@ -330,12 +477,7 @@ def _get_openai_stt(language: str, model: str, **kwargs) -> Any:
 
 def _get_deepgram_stt(language: str, model: str, **kwargs) -> Any:
     """Initialize Deepgram STT (streaming supported)"""
-    try:
-        from livekit.plugins import deepgram
-    except ImportError:
-        raise ImportError(
-            "Deepgram plugin not installed. Install with: pip install livekit-plugins-deepgram"
-        )
+    deepgram = _require_plugin("deepgram")
     
     api_key = _validate_api_key("DEEPGRAM_API_KEY", "Deepgram")
     supported_params = set(inspect.signature(deepgram.STT.__init__).parameters.keys())
@@ -363,16 +505,11 @@ def _get_deepgram_stt(language: str, model: str, **kwargs) -> Any:
 
 def _get_assemblyai_stt(language: str, model: str, **kwargs) -> Any:
     """Initialize AssemblyAI STT (streaming supported)"""
-    try:
-        from livekit.plugins import assemblyai
-    except ImportError:
-        raise ImportError(
-            "AssemblyAI plugin not installed. Install with: pip install livekit-plugins-assemblyai"
-        )
+    assemblyai = _require_plugin("assemblyai")
     
     api_key = _validate_api_key("ASSEMBLYAI_API_KEY", "AssemblyAI")
     
-    logger.info(f"✅ Using AssemblyAI STT, language: {language}")
+    logger.info("✅ Using AssemblyAI STT, language: %s", language)
     
     return assemblyai.STT(
         api_key=api_key,
@@ -382,19 +519,14 @@ def _get_assemblyai_stt(language: str, model: str, **kwargs) -> Any:
 
 def _get_google_stt(language: str, model: str, **kwargs) -> Any:
     """Initialize Google Cloud Speech-to-Text"""
-    try:
-        from livekit.plugins import google
-    except ImportError:
-        raise ImportError(
-            "Google plugin not installed. Install with: pip install livekit-plugins-google"
-        )
+    google = _require_plugin("google")
     
     # Google uses service account credentials
     credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if not credentials_path:
         logger.warning("⚠️ GOOGLE_APPLICATION_CREDENTIALS not set, using default credentials")
     
-    logger.info(f"✅ Using Google Speech-to-Text, language: {language}")
+    logger.info("✅ Using Google Speech-to-Text, language: %s", language)
     
     return google.STT(
         language=language,
@@ -404,17 +536,12 @@ def _get_google_stt(language: str, model: str, **kwargs) -> Any:
 
 def _get_azure_stt(language: str, model: str, **kwargs) -> Any:
     """Initialize Azure Speech-to-Text"""
-    try:
-        from livekit.plugins import azure
-    except ImportError:
-        raise ImportError(
-            "Azure plugin not installed. Install with: pip install livekit-plugins-azure"
-        )
+    azure = _require_plugin("azure")
     
     api_key = _validate_api_key("AZURE_SPEECH_KEY", "Azure Speech")
-    region = os.getenv("AZURE_SPEECH_REGION", "eastus")
+    region = _get_env("AZURE_SPEECH_REGION", "eastus")
     
-    logger.info(f"✅ Using Azure Speech-to-Text, region: {region}, language: {language}")
+    logger.info("✅ Using Azure Speech-to-Text, region: %s, language: %s", region, language)
     
     return azure.STT(
         speech_key=api_key,
@@ -426,67 +553,28 @@ def _get_azure_stt(language: str, model: str, **kwargs) -> Any:
 
 def _get_aws_transcribe_stt(language: str, model: str, **kwargs) -> Any:
     """Initialize AWS Transcribe"""
-    try:
-        from livekit.plugins import aws
-    except ImportError:
-        raise ImportError(
-            "AWS plugin not installed. Install with: pip install livekit-plugins-aws"
-        )
+    aws = _require_plugin("aws")
     
     _validate_api_key("AWS_ACCESS_KEY_ID", "AWS")
     _validate_api_key("AWS_SECRET_ACCESS_KEY", "AWS")
-    region = os.getenv("AWS_REGION", "us-east-1")
-    
-    # AWS Transcribe requires full language codes in BCP-47 format
-    # Map common 2-letter codes to their appropriate regional variants
-    AWS_LANGUAGE_MAPPINGS = {
-        "en": "en-US",
-        "es": "es-US",
-        "fr": "fr-FR",
-        "de": "de-DE",
-        "it": "it-IT",
-        "pt": "pt-BR",  # Brazilian Portuguese is more common
-        "zh": "zh-CN",  # Simplified Chinese (Mandarin)
-        "ja": "ja-JP",
-        "ko": "ko-KR",
-        "ar": "ar-SA",  # Modern Standard Arabic
-        "hi": "hi-IN",
-        "ru": "ru-RU",
-        "nl": "nl-NL",
-        "sv": "sv-SE",
-        "no": "no-NO",
-        "da": "da-DK",
-        "fi": "fi-FI",
-        "pl": "pl-PL",
-        "tr": "tr-TR",
-        "th": "th-TH",
-        "vi": "vi-VN",
-    }
+    region = _get_env("AWS_REGION", "us-east-1")
     
     # Validate and convert language code
     if "-" in language:
         # Already has region, validate format
-        if not re.match(r'^[a-z]{2}-[A-Z]{2}$', language):
-            logger.warning(
-                f"⚠️ Language code '{language}' may not be properly formatted. "
-                f"Expected format: 'xx-YY' (e.g., 'en-US'). "
-                f"See: https://docs.aws.amazon.com/transcribe/latest/dg/supported-languages.html"
-            )
+        if not _BCP47_RE.match(language):
+            logger.warning(_AWS_LANG_FORMAT_WARNING, language)
         aws_language = language
     else:
         # Map 2-letter code to regional variant
-        if language.lower() in AWS_LANGUAGE_MAPPINGS:
-            aws_language = AWS_LANGUAGE_MAPPINGS[language.lower()]
-            logger.info(f"📝 Mapped '{language}' to AWS language code: {aws_language}")
-        else:
+        aws_language = _AWS_LANGUAGE_MAPPINGS.get(language.lower())
+        if aws_language is None:
             raise ValueError(
-                f"❌ Unsupported language code: '{language}'. "
-                f"Please provide full BCP-47 format (e.g., 'en-US', '{language}-XX') or use a supported code. "
-                f"Supported 2-letter codes: {', '.join(sorted(AWS_LANGUAGE_MAPPINGS.keys()))}. "
-                f"Full list: https://docs.aws.amazon.com/transcribe/latest/dg/supported-languages.html"
+                _AWS_LANG_ERROR_TEMPLATE.format(language=language, supported=_AWS_SUPPORTED_CODES_STR)
             )
+        logger.info("📝 Mapped '%s' to AWS language code: %s", language, aws_language)
     
-    logger.info(f"✅ Using AWS Transcribe, region: {region}, language: {aws_language}")
+    logger.info("✅ Using AWS Transcribe, region: %s, language: %s", region, aws_language)
     
     return aws.STT(
         region=region,
@@ -505,17 +593,13 @@ def _get_vosk_stt(language: str, model: str, **kwargs) -> Any:
     
     if not model_path:
         raise ValueError(
-            "❌ VOSK_MODEL_PATH not set. Download a model from "
-            "https://alphacephei.com/vosk/models and set the path."
+            _MODEL_PATH_MISSING_MSG.format(env_var="VOSK_MODEL_PATH", url="https://alphacephei.com/vosk/models")
         )
     
-    logger.info(f"✅ Using Vosk STT (offline), model: {model_path}")
+    logger.info("✅ Using Vosk STT (offline), model: %s", model_path)
     
     # Return a placeholder - implement custom Vosk wrapper if needed
-    raise NotImplementedError(
-        "Vosk STT integration requires custom implementation. "
-        "Use a different provider or implement VoskSTT wrapper."
-    )
+    raise NotImplementedError(_CUSTOM_WRAPPER_MSG.format(label="Vosk", wrapper="VoskSTT"))
 
 
 def _get_whisper_cpp_stt(language: str, model: str, **kwargs) -> Any:
@@ -526,112 +610,143 @@ def _get_whisper_cpp_stt(language: str, model: str, **kwargs) -> Any:
     
     if not model_path:
         raise ValueError(
-            "❌ WHISPER_CPP_MODEL_PATH not set. Download a model from "
-            "https://huggingface.co/ggerganov/whisper.cpp and set the path."
+            _MODEL_PATH_MISSING_MSG.format(
+                env_var="WHISPER_CPP_MODEL_PATH", url="https://huggingface.co/ggerganov/whisper.cpp"
+            )
         )
     
-    logger.info(f"✅ Using Whisper.cpp STT (offline), model: {model_path}")
+    logger.info("✅ Using Whisper.cpp STT (offline), model: %s", model_path)
     
     # Return a placeholder - implement custom Whisper.cpp wrapper if needed
-    raise NotImplementedError(
-        "Whisper.cpp STT integration requires custom implementation. "
-        "Use a different provider or implement WhisperCppSTT wrapper."
-    )
+    raise NotImplementedError(_CUSTOM_WRAPPER_MSG.format(label="Whisper.cpp", wrapper="WhisperCppSTT"))
+
+
+# Provider name (including aliases) -> factory helper
+_STT_DISPATCH: Dict[str, Callable[..., Any]] = {
+    "groq": _get_groq_stt,
+    "openai": _get_openai_stt,
+    "whisper": _get_openai_stt,
+    "deepgram": _get_deepgram_stt,
+    "assemblyai": _get_assemblyai_stt,
+    "assembly": _get_assemblyai_stt,
+    "google": _get_google_stt,
+    "google_speech": _get_google_stt,
+    "azure": _get_azure_stt,
+    "azure_speech": _get_azure_stt,
+    "aws_transcribe": _get_aws_transcribe_stt,
+    "aws": _get_aws_transcribe_stt,
+    "transcribe": _get_aws_transcribe_stt,
+    "vosk": _get_vosk_stt,
+    "whisper_cpp": _get_whisper_cpp_stt,
+    "whispercpp": _get_whisper_cpp_stt,
+}
 
 
-# Provider information for documentation
-STT_PROVIDER_INFO: Dict[str, Dict] = {
-    "groq": {
-        "name": "Groq (Whisper Turbo)",
-        "default_model": STT_DEFAULTS[STTProvider.GROQ]["model"],
-        "env_vars": ["GROQ_API_KEY"],
-        "models": ["whisper-large-v3-turbo", "whisper-large-v3"],
-        "streaming": True,
-        "plugin": "livekit-plugins-groq",
-    },
-    "openai": {
-        "name": "OpenAI Whisper",
-        "default_model": STT_DEFAULTS[STTProvider.OPENAI]["model"],
-        "env_vars": ["OPENAI_API_KEY"],
-        "models": ["whisper-1"],
-        "streaming": False,
-        "plugin": "livekit-plugins-openai",
-    },
-    "deepgram": {
-        "name": "Deepgram",
-        "default_model": STT_DEFAULTS[STTProvider.DEEPGRAM]["model"],
-        "env_vars": ["DEEPGRAM_API_KEY"],
-        "models": ["nova-2", "nova", "enhanced", "base"],
-        "streaming": True,
-        "plugin": "livekit-plugins-deepgram",
-    },
-    "assemblyai": {
-        "name": "AssemblyAI",
-        "default_model": STT_DEFAULTS[STTProvider.ASSEMBLYAI]["model"],
-        "env_vars": ["ASSEMBLYAI_API_KEY"],
-        "models": ["best", "nano"],
-        "streaming": True,
-        "plugin": "livekit-plugins-assemblyai",
-    },
-    "google": {
-        "name": "Google Cloud Speech",
-        "default_model": STT_DEFAULTS[STTProvider.GOOGLE]["model"],
-        "env_vars": ["GOOGLE_APPLICATION_CREDENTIALS"],
-        "models": ["latest_long", "latest_short", "command_and_search"],
-        "streaming": True,
-        "plugin": "livekit-plugins-google",
-    },
-    "azure": {
-        "name": "Azure Speech",
-        "default_model": STT_DEFAULTS[STTProvider.AZURE]["model"],
-        "env_vars": ["AZURE_SPEECH_KEY", "AZURE_SPEECH_REGION"],
-        "models": ["en-US", "en-GB", "de-DE", "fr-FR"],
-        "streaming": True,
-        "plugin": "livekit-plugins-azure",
-    },
-    "aws_transcribe": {
-        "name": "AWS Transcribe",
-        "default_model": STT_DEFAULTS[STTProvider.AWS_TRANSCRIBE]["model"],
-        "env_vars": ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"],
-        "models": ["en-US", "en-GB", "es-US"],
-        "streaming": True,
-        "plugin": "livekit-plugins-aws",
-    },
-    "vosk": {
-        "name": "Vosk (Offline)",
-        "default_model": STT_DEFAULTS[STTProvider.VOSK]["model"],
-        "env_vars": ["VOSK_MODEL_PATH"],
-        "models": ["vosk-model-en-us-0.22", "vosk-model-small-en-us-0.15"],
-        "streaming": True,
-        "plugin": "custom",
-        "offline": True,
-    },
-    "whisper_cpp": {
-        "name": "Whisper.cpp (Offline)",
-        "default_model": STT_DEFAULTS[STTProvider.WHISPER_CPP]["model"],
-        "env_vars": ["WHISPER_CPP_MODEL_PATH"],
-        "models": ["ggml-base.en.bin", "ggml-small.en.bin", "ggml-medium.en.bin"],
-        "streaming": False,
-        "plugin": "custom",
-        "offline": True,
-    },
-}
+@functools.cache
+def _provider_info() -> Mapping[str, Mapping[str, Any]]:
+    """Provider information for documentation, built on first use."""
+    info = {
+        "groq": {
+            "name": "Groq (Whisper Turbo)",
+            "default_model": _DEFAULT_MODEL["groq"],
+            "env_vars": ("GROQ_API_KEY",),
+            "models": ("whisper-large-v3-turbo", "whisper-large-v3"),
+            "streaming": True,
+            "plugin": "livekit-plugins-groq",
+        },
+        "openai": {
+            "name": "OpenAI Whisper",
+            "default_model": _DEFAULT_MODEL["openai"],
+            "env_vars": ("OPENAI_API_KEY",),
+            "models": ("whisper-1",),
+            "streaming": False,
+            "plugin": "livekit-plugins-openai",
+        },
+        "deepgram": {
+            "name": "Deepgram",
+            "default_model": _DEFAULT_MODEL["deepgram"],
+            "env_vars": ("DEEPGRAM_API_KEY",),
+            "models": ("nova-2", "nova", "enhanced", "base"),
+            "streaming": True,
+            "plugin": "livekit-plugins-deepgram",
+        },
+        "assemblyai": {
+            "name": "AssemblyAI",
+            "default_model": _DEFAULT_MODEL["assemblyai"],
+            "env_vars": ("ASSEMBLYAI_API_KEY",),
+            "models": ("best", "nano"),
+            "streaming": True,
+            "plugin": "livekit-plugins-assemblyai",
+        },
+        "google": {
+            "name": "Google Cloud Speech",
+            "default_model": _DEFAULT_MODEL["google"],
+            "env_vars": ("GOOGLE_APPLICATION_CREDENTIALS",),
+            "models": ("latest_long", "latest_short", "command_and_search"),
+            "streaming": True,
+            "plugin": "livekit-plugins-google",
+        },
+        "azure": {
+            "name": "Azure Speech",
+            "default_model": _DEFAULT_MODEL["azure"],
+            "env_vars": ("AZURE_SPEECH_KEY", "AZURE_SPEECH_REGION"),
+            "models": ("en-US", "en-GB", "de-DE", "fr-FR"),
+            "streaming": True,
+            "plugin": "livekit-plugins-azure",
+        },
+        "aws_transcribe": {
+            "name": "AWS Transcribe",
+            "default_model": _DEFAULT_MODEL["aws_transcribe"],
+            "env_vars": ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"),
+            "models": ("en-US", "en-GB", "es-US"),
+            "streaming": True,
+            "plugin": "livekit-plugins-aws",
+        },
+        "vosk": {
+            "name": "Vosk (Offline)",
+            "default_model": _DEFAULT_MODEL["vosk"],
+            "env_vars": ("VOSK_MODEL_PATH",),
+            "models": ("vosk-model-en-us-0.22", "vosk-model-small-en-us-0.15"),
+            "streaming": True,
+            "plugin": "custom",
+            "offline": True,
+        },
+        "whisper_cpp": {
+            "name": "Whisper.cpp (Offline)",
+            "default_model": _DEFAULT_MODEL["whisper_cpp"],
+            "env_vars": ("WHISPER_CPP_MODEL_PATH",),
+            "models": ("ggml-base.en.bin", "ggml-small.en.bin", "ggml-medium.en.bin"),
+            "streaming": False,
+            "plugin": "custom",
+            "offline": True,
+        },
+    }
+    return MappingProxyType({
+        provider_id: MappingProxyType(entry) for provider_id, entry in info.items()
+    })
+
+
+@functools.cache
+def _format_provider_listing() -> str:
+    parts = ["\n🎙️ Available STT Providers:\n\n"]
+    for provider_id, info in _provider_info().items():
+        parts.append(
+            f"  {provider_id.upper()}\n"
+            f"    Name: {info['name']}\n"
+            f"    Default Model: {info['default_model']}\n"
+            f"    Available Models: {', '.join(info['models'])}\n"
+            f"    Streaming: {'✅' if info['streaming'] else '❌'}\n"
+            f"    Offline: {'✅' if info.get('offline') else '❌'}\n"
+            f"    Required Env Vars: {', '.join(info['env_vars'])}\n"
+            f"    Plugin: {info['plugin']}\n\n"
+        )
+    return "".join(parts)
 
 
 def list_stt_providers() -> None:
     """Print information about all available STT providers"""
-    print("\n🎙️ Available STT Providers:\n")
-    for provider_id, info in STT_PROVIDER_INFO.items():
-        print(f"  {provider_id.upper()}")
-        print(f"    Name: {info['name']}")
-        print(f"    Default Model: {info['default_model']}")
-        print(f"    Available Models: {', '.join(info['models'])}")
-        print(f"    Streaming: {'✅' if info['streaming'] else '❌'}")
-        print(f"    Offline: {'✅' if info.get('offline') else '❌'}")
-        print(f"    Required Env Vars: {', '.join(info['env_vars'])}")
-        print(f"    Plugin: {info['plugin']}")
-        print()
-
+    sys.stdout.write(_format_provider_listing())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     list_stt_providers()
@@ -16,18 +16,41 @@ Supported Providers:
 - Piper TTS (offline)
 """
 
+import functools
 import os
 import logging
-from typing import Any, Optional, Dict
+import sys
+from typing import Any, Callable, Optional, Dict, Tuple
 
+from ._plugins import load_plugin
 from .provider_types import TTSProvider, TTS_DEFAULTS
 
-# Plugins are lazy-loaded in factory functions to prevent import deadlocks
-# and ensure proper initialization context.
+_SUPPORTED_TTS_PROVIDER_VALUES = tuple(p.value for p in TTSProvider)
+_DEFAULT_VOICE: Dict[str, str] = {
+    provider.value: config["voice"] for provider, config in TTS_DEFAULTS.items()
+}
+
+# Plugins are lazy-loaded by _require_plugin() on first use to prevent
+# import deadlocks and ensure proper initialization context.
+# module under livekit.plugins -> display label
+_PLUGIN_LABELS: Dict[str, str] = {
+    "groq": "Groq",
+    "elevenlabs": "ElevenLabs",
+    "cartesia": "Cartesia",
+    "deepgram": "Deepgram",
+    "openai": "OpenAI",
+    "azure": "Azure",
+    "google": "Google",
+    "aws": "AWS",
+}
 
 logger = logging.getLogger(__name__)
 
 
+def _require_plugin(name: str) -> Any:
+    return load_plugin(name, _PLUGIN_LABELS[name])
+
+
 def get_tts_provider(
     provider_name: str,
     voice: str = "",
@@ -53,42 +76,17 @@ def get_tts_provider(
         >>> tts = get_tts_provider("elevenlabs", voice="Rachel")
         >>> tts = get_tts_provider("cartesia", voice="79a125e8-cd45-4c13-8a67-188112f4dd22")
     """
-    provider = provider_name.lower().strip()
+    provider, handler = _resolve(provider_name)
     
     logger.info(f"🔊 Initializing TTS provider: {provider}")
     
     try:
-        match provider:
-            case "groq" | "playai":
-                return _get_groq_tts(voice, model, **kwargs)
-            case "noop" | "none" | "text_only":
-                logger.info("✅ Using No-Op TTS (Text Only Mode)")
-                return None
-            case "elevenlabs" | "eleven":
-                return _get_elevenlabs_tts(voice, model, **kwargs)
-            case "cartesia":
-                return _get_cartesia_tts(voice, model, **kwargs)
-            case "deepgram" | "aura":
-                return _get_deepgram_tts(voice, model, **kwargs)
-            case "openai":
-                return _get_openai_tts(voice, model, **kwargs)
-            case "azure" | "azure_tts":
-                return _get_azure_tts(voice, model, **kwargs)
-            case "google" | "google_tts":
-                return _get_google_tts(voice, model, **kwargs)
-            case "aws_polly" | "polly" | "aws":
-                return _get_polly_tts(voice, model, **kwargs)
-            case "coqui":
-                return _get_coqui_tts(voice, model, **kwargs)
-            case "piper":
-                return _get_piper_tts(voice, model, **kwargs)
-            case "edge" | "edge_tts" | "edgetts" | "microsoft":
-                return _get_edge_tts(voice, model, **kwargs)
-            case _:
-                raise ValueError(
-                    f"❌ Unsupported TTS provider: '{provider}'. "
-                    f"Supported providers: {[p.value for p in TTSProvider]}"
-                )
+        if handler is None:
+            raise ValueError(
+                f"❌ Unsupported TTS provider: '{provider}'. "
+                f"Supported providers: {_SUPPORTED_TTS_PROVIDER_VALUES}"
+            )
+        return handler(voice, model, **kwargs)
     except ImportError as e:
         logger.error(f"❌ Missing plugin for {provider}: {e}")
         raise
@@ -100,25 +98,62 @@ def get_tts_provider(
         raise
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve(provider_name: str) -> Tuple[str, Optional[Callable[..., Any]]]:
+    """Normalize a raw provider name once and pair it with its builder (None if unknown)."""
+    provider = sys.intern(provider_name.strip().lower())
+    return provider, _TTS_DISPATCH.get(provider)
+
+
+# env var -> API key for keys already validated; see _clear_validation_cache()
+_VALIDATED_KEYS: Dict[str, str] = {}
+
+
 def _validate_api_key(env_var: str, provider_name: str) -> str:
-    """Validate that an API key exists in environment"""
+    """
+    Validate that an API key exists in environment.
+    Found keys are remembered per env var (failures are not); call
+    invalidate_env_cache() after changing keys at runtime.
+    """
+    api_key = _VALIDATED_KEYS.get(env_var)
+    if api_key is not None:
+        return api_key
     api_key = os.getenv(env_var)
     if not api_key:
         raise ValueError(
             f"❌ {env_var} not found in environment. "
             f"Please set {env_var} in your .env file."
         )
+    _VALIDATED_KEYS[env_var] = api_key
     return api_key
 
 
+def _clear_validation_cache() -> None:
+    """Forget validated API keys so the next lookup re-reads os.environ."""
+    _VALIDATED_KEYS.clear()
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Memoized os.getenv for settings fixed at deploy time (regions, model paths)."""
+    return os.getenv(name, default)
+
+
+def invalidate_env_cache() -> None:
+    """Forget memoized environment reads so the next build re-reads os.environ."""
+    _clear_validation_cache()
+    _cached_env.cache_clear()
+
+
+def _get_noop_tts(voice: str, model: str, **kwargs) -> None:
+    """No TTS: the agent answers in text only"""
+    logger.info("✅ Using No-Op TTS (Text Only Mode)")
+    return None
+
+
 def _get_groq_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Groq TTS (PlayAI)"""
-    try:
-        from livekit.plugins import groq
-    except ImportError:
-        raise ImportError(
-            "Groq plugin not installed. Install with: pip install livekit-plugins-groq"
-        )
+    groq = _require_plugin("groq")
     
     _validate_api_key("GROQ_API_KEY", "Groq")
     requested_model = (
@@ -131,7 +166,7 @@ def _get_groq_tts(voice: str, model: str, **kwargs) -> Any:
         voice
         or os.getenv("GROQ_TTS_VOICE", "")
         or os.getenv("TTS_VOICE", "")
-        or TTS_DEFAULTS[TTSProvider.GROQ]["voice"]
+        or _DEFAULT_VOICE["groq"]
     )
 
     valid_models = set(getattr(getattr(groq, "tts", None), "TTSModels", ()).__args__ or ())
@@ -166,18 +201,13 @@ def _get_groq_tts(voice: str, model: str, **kwargs) -> Any:
 
 def _get_elevenlabs_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize ElevenLabs TTS"""
-    try:
-        from livekit.plugins import elevenlabs
-    except ImportError:
-        raise ImportError(
-            "ElevenLabs plugin not installed. Install with: pip install livekit-plugins-elevenlabs"
-        )
+    elevenlabs = _require_plugin("elevenlabs")
     
     api_key = _validate_api_key("ELEVENLABS_API_KEY", "ElevenLabs")
     voice_id = (
         os.getenv("ELEVENLABS_VOICE_ID", "").strip()
         or voice
-        or TTS_DEFAULTS[TTSProvider.ELEVENLABS]["voice"]
+        or _DEFAULT_VOICE["elevenlabs"]
     )
     model_name = (
         model
@@ -197,15 +227,10 @@ def _get_elevenlabs_tts(voice: str, model: str, **kwargs) -> Any:
 
 def _get_cartesia_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Cartesia TTS"""
-    try:
-        from livekit.plugins import cartesia
-    except ImportError:
-        raise ImportError(
-            "Cartesia plugin not installed. Install with: pip install livekit-plugins-cartesia"
-        )
+    cartesia = _require_plugin("cartesia")
     
     api_key = _validate_api_key("CARTESIA_API_KEY", "Cartesia")
-    voice_id = voice or TTS_DEFAULTS[TTSProvider.CARTESIA]["voice"]
+    voice_id = voice or _DEFAULT_VOICE["cartesia"]
     
     logger.info(f"✅ Using Cartesia TTS, voice: {voice_id}")
     
@@ -218,15 +243,10 @@ def _get_cartesia_tts(voice: str, model: str, **kwargs) -> Any:
 
 def _get_deepgram_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Deepgram Aura TTS"""
-    try:
-        from livekit.plugins import deepgram
-    except ImportError:
-        raise ImportError(
-            "Deepgram plugin not installed. Install with: pip install livekit-plugins-deepgram"
-        )
+    deepgram = _require_plugin("deepgram")
     
     api_key = _validate_api_key("DEEPGRAM_API_KEY", "Deepgram")
-    voice_name = voice or TTS_DEFAULTS[TTSProvider.DEEPGRAM]["voice"]
+    voice_name = voice or _DEFAULT_VOICE["deepgram"]
     
     logger.info(f"✅ Using Deepgram Aura TTS, voice: {voice_name}")
     
@@ -239,15 +259,10 @@ def _get_deepgram_tts(voice: str, model: str, **kwargs) -> Any:
 
 def _get_openai_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize OpenAI TTS"""
-    try:
-        from livekit.plugins import openai
-    except ImportError:
-        raise ImportError(
-            "OpenAI plugin not installed. Install with: pip install livekit-plugins-openai"
-        )
+    openai = _require_plugin("openai")
     
     api_key = _validate_api_key("OPENAI_API_KEY", "OpenAI")
-    voice_name = voice or TTS_DEFAULTS[TTSProvider.OPENAI]["voice"]
+    voice_name = voice or _DEFAULT_VOICE["openai"]
     model_name = model or "tts-1"
     
     logger.info(f"✅ Using OpenAI TTS, voice: {voice_name}, model: {model_name}")
@@ -262,22 +277,17 @@ def _get_openai_tts(voice: str, model: str, **kwargs) -> Any:
 
 def _get_azure_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Azure Neural TTS"""
-    try:
-        from livekit.plugins import azure
-    except ImportError:
-        raise ImportError(
-            "Azure plugin not installed. Install with: pip install livekit-plugins-azure"
-        )
+    azure = _require_plugin("azure")
     
     # We use settings directly for cleaner access, or fallback to env
-    api_key = settings.azure_speech_key or os.getenv("AZURE_SPEECH_KEY")
-    region = settings.azure_speech_region or os.getenv("AZURE_SPEECH_REGION", "eastus")
-    endpoint = settings.azure_speech_endpoint or os.getenv("AZURE_SPEECH_ENDPOINT")
+    api_key = settings.azure_speech_key or _cached_env("AZURE_SPEECH_KEY")
+    region = settings.azure_speech_region or _cached_env("AZURE_SPEECH_REGION", "eastus")
+    endpoint = settings.azure_speech_endpoint or _cached_env("AZURE_SPEECH_ENDPOINT")
     
     if not api_key:
         raise ValueError("AZURE_SPEECH_KEY not found in environment")
     
-    voice_name = voice or TTS_DEFAULTS[TTSProvider.AZURE]["voice"]
+    voice_name = voice or _DEFAULT_VOICE["azure"]
     
     logger.info(f"✅ Using Azure Neural TTS, voice: {voice_name}, region: {region}")
     
@@ -295,19 +305,14 @@ def _get_azure_tts(voice: str, model: str, **kwargs) -> Any:
 
 def _get_google_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Google Cloud TTS"""
-    try:
-        from livekit.plugins import google
-    except ImportError:
-        raise ImportError(
-            "Google plugin not installed. Install with: pip install livekit-plugins-google"
-        )
+    google = _require_plugin("google")
     
     # Google uses service account credentials
-    credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    credentials_path = _cached_env("GOOGLE_APPLICATION_CREDENTIALS")
     if not credentials_path:
         logger.warning("⚠️ GOOGLE_APPLICATION_CREDENTIALS not set, using default credentials")
     
-    voice_name = voice or TTS_DEFAULTS[TTSProvider.GOOGLE]["voice"]
+    voice_name = voice or _DEFAULT_VOICE["google"]
     
     logger.info(f"✅ Using Google Cloud TTS, voice: {voice_name}")
     
@@ -319,17 +324,12 @@ def _get_google_tts(voice: str, model: str, **kwargs) -> Any:
 
 def _get_polly_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Amazon Polly TTS"""
-    try:
-        from livekit.plugins import aws
-    except ImportError:
-        raise ImportError(
-            "AWS plugin not installed. Install with: pip install livekit-plugins-aws"
-        )
+    aws = _require_plugin("aws")
     
     _validate_api_key("AWS_ACCESS_KEY_ID", "AWS")
     _validate_api_key("AWS_SECRET_ACCESS_KEY", "AWS")
-    region = os.getenv("AWS_REGION", os.getenv("POLLY_REGION", "us-east-1"))
-    voice_name = voice or TTS_DEFAULTS[TTSProvider.AWS_POLLY]["voice"]
+    region = _cached_env("AWS_REGION", _cached_env("POLLY_REGION", "us-east-1"))
+    voice_name = voice or _DEFAULT_VOICE["aws_polly"]
     engine = kwargs.pop("engine", "neural")  # neural or standard
     
     logger.info(f"✅ Using Amazon Polly TTS, voice: {voice_name}, region: {region}, engine: {engine}")
@@ -346,10 +346,10 @@ def _get_coqui_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Coqui TTS (offline, local)"""
     logger.warning("⚠️ Coqui TTS requires local model installation")
     
-    model_name = voice or model or os.getenv("COQUI_MODEL", "")
+    model_name = voice or model or _cached_env("COQUI_MODEL", "")
     
     if not model_name:
-        model_name = TTS_DEFAULTS[TTSProvider.COQUI]["voice"]
+        model_name = _DEFAULT_VOICE["coqui"]
     
     logger.info(f"✅ Using Coqui TTS (offline), model: {model_name}")
     
@@ -364,8 +364,8 @@ def _get_piper_tts(voice: str, model: str, **kwargs) -> Any:
     """Initialize Piper TTS (offline, local)"""
     logger.warning("⚠️ Piper TTS requires local model installation")
     
-    model_path = model or os.getenv("PIPER_MODEL_PATH", "")
-    voice_name = voice or TTS_DEFAULTS[TTSProvider.PIPER]["voice"]
+    model_path = model or _cached_env("PIPER_MODEL_PATH", "")
+    voice_name = voice or _DEFAULT_VOICE["piper"]
     
     if not model_path:
         raise ValueError(
@@ -410,7 +410,7 @@ def _get_edge_tts(voice: str, model: str, **kwargs) -> Any:
         )
     
     # Use provided voice or default
-    voice_name = voice or TTS_DEFAULTS[TTSProvider.EDGE_TTS]["voice"]
+    voice_name = voice or _DEFAULT_VOICE["edge_tts"]
     
     # Extract Edge-TTS specific kwargs
     rate = kwargs.pop("rate", "+0%")
@@ -427,11 +427,40 @@ def _get_edge_tts(voice: str, model: str, **kwargs) -> Any:
     )
 
 
+# Provider name (including aliases) -> factory helper
+_TTS_DISPATCH: Dict[str, Callable[..., Any]] = {
+    "groq": _get_groq_tts,
+    "playai": _get_groq_tts,
+    "noop": _get_noop_tts,
+    "none": _get_noop_tts,
+    "text_only": _get_noop_tts,
+    "elevenlabs": _get_elevenlabs_tts,
+    "eleven": _get_elevenlabs_tts,
+    "cartesia": _get_cartesia_tts,
+    "deepgram": _get_deepgram_tts,
+    "aura": _get_deepgram_tts,
+    "openai": _get_openai_tts,
+    "azure": _get_azure_tts,
+    "azure_tts": _get_azure_tts,
+    "google": _get_google_tts,
+    "google_tts": _get_google_tts,
+    "aws_polly": _get_polly_tts,
+    "polly": _get_polly_tts,
+    "aws": _get_polly_tts,
+    "coqui": _get_coqui_tts,
+    "piper": _get_piper_tts,
+    "edge": _get_edge_tts,
+    "edge_tts": _get_edge_tts,
+    "edgetts": _get_edge_tts,
+    "microsoft": _get_edge_tts,
+}
+
+
 # Provider information for documentation
 TTS_PROVIDER_INFO: Dict[str, Dict] = {
     "groq": {
         "name": "Groq (PlayAI)",
-        "default_voice": TTS_DEFAULTS[TTSProvider.GROQ]["voice"],
+        "default_voice": _DEFAULT_VOICE["groq"],
         "env_vars": ["GROQ_API_KEY"],
         "voices": [
             "autumn",
@@ -450,7 +479,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "elevenlabs": {
         "name": "ElevenLabs",
-        "default_voice": TTS_DEFAULTS[TTSProvider.ELEVENLABS]["voice"],
+        "default_voice": _DEFAULT_VOICE["elevenlabs"],
         "env_vars": ["ELEVENLABS_API_KEY"],
         "voices": ["Rachel", "Drew", "Clyde", "Paul", "Domi", "Dave", "Bella"],
         "streaming": True,
@@ -458,7 +487,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "cartesia": {
         "name": "Cartesia",
-        "default_voice": TTS_DEFAULTS[TTSProvider.CARTESIA]["voice"],
+        "default_voice": _DEFAULT_VOICE["cartesia"],
         "env_vars": ["CARTESIA_API_KEY"],
         "voices": ["79a125e8-cd45-4c13-8a67-188112f4dd22"],
         "streaming": True,
@@ -466,7 +495,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "deepgram": {
         "name": "Deepgram Aura",
-        "default_voice": TTS_DEFAULTS[TTSProvider.DEEPGRAM]["voice"],
+        "default_voice": _DEFAULT_VOICE["deepgram"],
         "env_vars": ["DEEPGRAM_API_KEY"],
         "voices": ["aura-asteria-en", "aura-luna-en", "aura-stella-en", "aura-athena-en"],
         "streaming": True,
@@ -474,7 +503,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "openai": {
         "name": "OpenAI TTS",
-        "default_voice": TTS_DEFAULTS[TTSProvider.OPENAI]["voice"],
+        "default_voice": _DEFAULT_VOICE["openai"],
         "env_vars": ["OPENAI_API_KEY"],
         "voices": ["alloy", "echo", "fable", "onyx", "nova", "shimmer"],
         "streaming": True,
@@ -482,7 +511,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "azure": {
         "name": "Azure Neural TTS",
-        "default_voice": TTS_DEFAULTS[TTSProvider.AZURE]["voice"],
+        "default_voice": _DEFAULT_VOICE["azure"],
         "env_vars": ["AZURE_SPEECH_KEY", "AZURE_SPEECH_REGION"],
         "voices": ["en-US-JennyNeural", "en-US-GuyNeural", "en-GB-SoniaNeural"],
         "streaming": True,
@@ -490,7 +519,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "google": {
         "name": "Google Cloud TTS",
-        "default_voice": TTS_DEFAULTS[TTSProvider.GOOGLE]["voice"],
+        "default_voice": _DEFAULT_VOICE["google"],
         "env_vars": ["GOOGLE_APPLICATION_CREDENTIALS"],
         "voices": ["en-US-Neural2-C", "en-US-Neural2-F", "en-GB-Neural2-A"],
         "streaming": True,
@@ -498,7 +527,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "aws_polly": {
         "name": "Amazon Polly",
-        "default_voice": TTS_DEFAULTS[TTSProvider.AWS_POLLY]["voice"],
+        "default_voice": _DEFAULT_VOICE["aws_polly"],
         "env_vars": ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "POLLY_REGION"],
         "voices": ["Joanna", "Matthew", "Ivy", "Kendra", "Salli"],
         "streaming": True,
@@ -506,7 +535,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "coqui": {
         "name": "Coqui TTS (Offline)",
-        "default_voice": TTS_DEFAULTS[TTSProvider.COQUI]["voice"],
+        "default_voice": _DEFAULT_VOICE["coqui"],
         "env_vars": ["COQUI_MODEL"],
         "voices": ["tts_models/en/ljspeech/tacotron2-DDC"],
         "streaming": False,
@@ -515,7 +544,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "piper": {
         "name": "Piper TTS (Offline)",
-        "default_voice": TTS_DEFAULTS[TTSProvider.PIPER]["voice"],
+        "default_voice": _DEFAULT_VOICE["piper"],
         "env_vars": ["PIPER_MODEL_PATH"],
         "voices": ["en_US-lessac-medium", "en_US-amy-medium"],
         "streaming": True,
@@ -524,7 +553,7 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
     },
     "edge_tts": {
         "name": "Microsoft Edge TTS (FREE)",
-        "default_voice": TTS_DEFAULTS[TTSProvider.EDGE_TTS]["voice"],
+        "default_voice": _DEFAULT_VOICE["edge_tts"],
         "env_vars": [],  # No API key required!
         "voices": [
             "en-US-JennyNeural",
@@ -544,20 +573,27 @@ TTS_PROVIDER_INFO: Dict[str, Dict] = {
 }
 
 
-def list_tts_providers() -> None:
-    """Print information about all available TTS providers"""
-    print("\n🔊 Available TTS Providers:\n")
+@functools.cache
+def _format_provider_listing() -> str:
+    parts = ["\n🔊 Available TTS Providers:\n\n"]
     for provider_id, info in TTS_PROVIDER_INFO.items():
-        print(f"  {provider_id.upper()}")
-        print(f"    Name: {info['name']}")
-        print(f"    Default Voice: {info['default_voice']}")
-        print(f"    Available Voices: {', '.join(info['voices'][:5])}")
-        print(f"    Streaming: {'✅' if info['streaming'] else '❌'}")
-        print(f"    Offline: {'✅' if info.get('offline') else '❌'}")
-        print(f"    Required Env Vars: {', '.join(info['env_vars'])}")
-        print(f"    Plugin: {info['plugin']}")
-        print()
+        parts.append(
+            f"  {provider_id.upper()}\n"
+            f"    Name: {info['name']}\n"
+            f"    Default Voice: {info['default_voice']}\n"
+            f"    Available Voices: {', '.join(info['voices'][:5])}\n"
+            f"    Streaming: {'✅' if info['streaming'] else '❌'}\n"
+            f"    Offline: {'✅' if info.get('offline') else '❌'}\n"
+            f"    Required Env Vars: {', '.join(info['env_vars'])}\n"
+            f"    Plugin: {info['plugin']}\n\n"
+        )
+    return "".join(parts)
 
 
+def list_tts_providers() -> None:
+    """Print information about all available TTS providers"""
+    sys.stdout.write(_format_provider_listing())
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     list_tts_providers()
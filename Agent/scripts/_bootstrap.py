@@ -0,0 +1,19 @@
+"""
+Shared entry-point helper for the console/verification scripts.
+Runs the script's coroutine on uvloop when it is installed (Linux/macOS),
+falling back to the stock asyncio loop otherwise.
+"""
+import asyncio
+
+try:
+    import uvloop
+except ImportError:  # Windows, or uvloop not installed
+    uvloop = None
+
+
+def run(main):
+    """asyncio.run(main), on a uvloop event loop when available."""
+    if uvloop is None:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
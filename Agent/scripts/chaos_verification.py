@@ -2,11 +2,8 @@
 Chaos Engineering Test Suite for Maya-One (Phases 0-8)
 Focuses on resilience, error recovery, and performance under stress.
 """
-import asyncio
 import logging
 import pytest
-import os
-from unittest.mock import MagicMock, patch
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -35,13 +32,13 @@ async def test_mode_switching_resilience():
 @pytest.mark.asyncio
 async def test_rag_index_failure_handling():
     """Chaos: Test RAG behavior when Supabase or index is missing"""
+    from unittest.mock import patch
     from core.intelligence.rag_engine import RAGEngine
     
     # Mock a failing Supabase client
     with patch('supabase.client.Client.rpc', side_effect=Exception("Connection Timeout")):
         rag_engine = RAGEngine() # Instantiate RAGEngine inside the patch context
         logger.info("🧪 Testing RAG Resilience (Simulating DB Failure)...")
-        context = MagicMock()
         result = await rag_engine.search("test query")
         assert result == []
         logger.info("✅ RAG failure handled gracefully")
@@ -136,10 +133,22 @@ async def test_reflection_intervention():
     assert "destructive" in result.reasoning.lower()
     logger.info(f"✅ Reflection blocked risky action: {result.reasoning}")
 
+async def _run_all():
+    """Run every scenario in order on one event loop.
+
+    Scenarios run sequentially: the RAG scenario patches the Supabase client
+    class globally and the agent/skill registries are process-wide singletons.
+    """
+    for scenario in (
+        test_mode_switching_resilience,
+        test_rag_index_failure_handling,
+        test_planner_step_failure_recovery,
+        test_agent_routing_conflict,
+        test_skill_permission_enforcement,
+        test_reflection_intervention,
+    ):
+        await scenario()
+
 if __name__ == "__main__":
-    asyncio.run(test_mode_switching_resilience())
-    asyncio.run(test_rag_index_failure_handling())
-    asyncio.run(test_planner_step_failure_recovery())
-    asyncio.run(test_agent_routing_conflict())
-    asyncio.run(test_skill_permission_enforcement())
-    asyncio.run(test_reflection_intervention())
+    import _bootstrap
+    _bootstrap.run(_run_all())
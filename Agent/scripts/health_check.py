@@ -10,23 +10,44 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+REQUIRED_ENV = ("SUPABASE_URL", "SUPABASE_SERVICE_KEY")
+
+
+def _missing_env() -> tuple:
+    """Required variables that are currently unset."""
+    return tuple(var for var in REQUIRED_ENV if not os.getenv(var))
+
+
+_manager = None
+
+
+def _db():
+    """
+    Shared SupabaseManager, so repeated in-process probes reuse one client.
+    A manager whose client failed to initialize is rebuilt on the next probe.
+    """
+    global _manager
+    if _manager is None or _manager.client is None:
+        from core.system_control.supabase_manager import SupabaseManager
+        _manager = SupabaseManager()
+    return _manager
+
+
 async def check_health():
     """Perform health checks."""
     try:
-        # Check 1: Supabase connection
-        from core.system_control.supabase_manager import SupabaseManager
-        db = SupabaseManager()
+        # Check 1: Environment variables (cheap, so fail fast before touching the DB)
+        missing = _missing_env()
+        if missing:
+            print(f"❌ Missing environment variables: {list(missing)}")
+            return False
+
+        # Check 2: Supabase connection
+        db = _db()
         if not db.client:
             print("❌ Supabase client not initialized")
             return False
         
-        # Check 2: Environment variables
-        required_env = ["SUPABASE_URL", "SUPABASE_SERVICE_KEY"]
-        missing = [var for var in required_env if not os.getenv(var)]
-        if missing:
-            print(f"❌ Missing environment variables: {missing}")
-            return False
-        
         print("✅ Health check passed")
         return True
         
@@ -34,6 +55,9 @@ async def check_health():
         print(f"❌ Health check failed: {e}")
         return False
 
+def check_health_once() -> bool:
+    """Run one probe synchronously, reusing the cached SupabaseManager."""
+    return asyncio.run(check_health())
+
 if __name__ == "__main__":
-    result = asyncio.run(check_health())
-    sys.exit(0 if result else 1)
+    sys.exit(0 if check_health_once() else 1)
@@ -4,39 +4,109 @@ import os
 import sys
 from pathlib import Path
 
+import aiofiles
+
 # Add project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from core.intelligence.rag_engine import get_rag_engine
 
+# add_documents calls in flight across all files; readers wait for a slot.
+INGEST_CONCURRENCY = max(1, int(os.getenv("INGEST_CONCURRENCY", "16")))
+# Chunks embedded and inserted per add_documents call.
+BATCH_SIZE = max(1, int(os.getenv("INGEST_BATCH_SIZE", "64")))
+
+
+async def iter_paragraphs(p: Path):
+    """Yield the file's paragraphs (blocks separated by a blank line) as they are read."""
+    buf = []
+    async with aiofiles.open(p, 'r', encoding='utf-8') as f:
+        async for line in f:
+            if line == "\n":
+                chunk = "".join(buf).strip()
+                buf.clear()
+                if chunk:
+                    yield chunk
+            else:
+                buf.append(line)
+    chunk = "".join(buf).strip()
+    if chunk:
+        yield chunk
+
+
+async def _report_progress(progress: asyncio.Queue):
+    """Print per-batch results from one place while files ingest concurrently."""
+    while True:
+        item = await progress.get()
+        if item is None:
+            return
+        source, first, count, success = item
+        chunks = f"chunks {first+1}-{first+count}"
+        if success:
+            print(f"  ✅ {source}: added {chunks}")
+        else:
+            print(f"  ❌ {source}: failed to add {chunks}")
+
+
+async def _ingest_file(engine, p: Path, sem: asyncio.Semaphore, progress: asyncio.Queue):
+    batches = []
+    total = 0
+
+    async def push(first: int, batch: list):
+        try:
+            success = await engine.add_documents(batch)
+        finally:
+            sem.release()
+        progress.put_nowait((p.name, first, len(batch), success))
+        return len(batch) if success else 0
+
+    async def flush(batch: list):
+        await sem.acquire()
+        batches.append(asyncio.create_task(push(total - len(batch), batch)))
+
+    # Basic chunking (by paragraph or double newline), pushed in batches while reading
+    batch = []
+    async for chunk in iter_paragraphs(p):
+        batch.append({"content": chunk, "metadata": {"source": p.name, "chunk_index": total}})
+        total += 1
+        if len(batch) >= BATCH_SIZE:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+
+    added = sum(await asyncio.gather(*batches))
+    return p.name, added, total
+
+
 async def ingest_files(file_paths: list):
     """Ingest a list of files into the RAG engine."""
+    engine = get_rag_engine()
+    files = []
     for path in file_paths:
         p = Path(path)
         if not p.exists():
             print(f"⚠️ File not found: {path}")
             continue
-            
         print(f"📄 Ingesting {p.name}...")
-        with open(p, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Basic chunking (by paragraph or double newline)
-        chunks = [c.strip() for c in content.split("\n\n") if c.strip()]
-        
-        for i, chunk in enumerate(chunks):
-            success = await get_rag_engine().add_document(
-                content=chunk,
-                metadata={"source": p.name, "chunk_index": i}
-            )
-            if success:
-                print(f"  ✅ Added chunk {i+1}/{len(chunks)}")
-            else:
-                print(f"  ❌ Failed to add chunk {i+1}")
+        files.append(p)
+
+    sem = asyncio.Semaphore(INGEST_CONCURRENCY)
+    progress = asyncio.Queue()
+    reporter = asyncio.create_task(_report_progress(progress))
+    try:
+        summaries = await asyncio.gather(*(_ingest_file(engine, p, sem, progress) for p in files))
+    finally:
+        progress.put_nowait(None)
+        await reporter
+
+    for name, added, total in summaries:
+        print(f"  📊 {name}: {added}/{total} chunks added")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python ingest_docs.py <path_to_file1> <path_to_file2> ...")
         sys.exit(1)
-        
-    asyncio.run(ingest_files(sys.argv[1:]))
+
+    import _bootstrap
+    _bootstrap.run(ingest_files(sys.argv[1:]))
@@ -5,14 +5,26 @@ Allows talking directly to the agent to verify high-level behaviors.
 import asyncio
 import logging
 import sys
-from agent import Assistant
-from livekit.agents import ChatContext, ChatMessage
-from core.governance.modes import AgentMode
+import time
+from collections import deque
 
 # Silence external logs
 logging.getLogger("livekit").setLevel(logging.ERROR)
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+# Turns (user + assistant messages) kept in the context sent to the LLM
+MAX_RECENT_MESSAGES = 20
+# Seconds between stdout flushes while streaming a reply
+STREAM_FLUSH_INTERVAL = 0.05
+
+async def _prefetch_rag_index():
+    """Load the RAG engine (embedding model, DB client) while the user types."""
+    try:
+        from core.intelligence.rag_engine import get_rag_engine
+        await asyncio.to_thread(get_rag_engine)
+    except Exception as e:
+        logging.getLogger(__name__).debug("RAG prefetch skipped: %s", e)
+
 async def run_console_interactive():
     print("\n" + "="*50)
     print("🤖 MAYA-ONE PHASE 8 INTERACTIVE VERIFICATION")
@@ -28,7 +40,9 @@ async def run_console_interactive():
     from dotenv import load_dotenv
     load_dotenv()
     
-    # Imports for setup
+    # Imports for setup (deferred so importing this module stays cheap)
+    from agent import Assistant
+    from livekit.agents import ChatContext, ChatMessage
     from providers import ProviderFactory
     from config.settings import settings
     from core.llm.smart_llm import SmartLLM
@@ -40,13 +54,14 @@ async def run_console_interactive():
     )
     from tools.system.pc_control import open_app, close_app
     
-    # 1. Setup Dependencies
-    llm = ProviderFactory.get_llm(
-        settings.llm_provider,
-        settings.llm_model
+    # 1. Setup Dependencies: build the LLM on a worker thread meanwhile.
+    # MemoryManager stays on the loop thread; its __init__ schedules the cloud
+    # sync task with asyncio.create_task.
+    llm_fut = asyncio.ensure_future(
+        asyncio.to_thread(ProviderFactory.get_llm, settings.llm_provider, settings.llm_model)
     )
-    
     memory_manager = MemoryManager()
+    llm = await llm_fut
     tools_list = [
         get_weather, search_web, get_current_datetime, send_email,
         set_alarm, list_alarms, create_note, read_note, open_app, close_app
@@ -67,15 +82,20 @@ async def run_console_interactive():
     assistant = Assistant()
     assistant._llm = smart_llm # Manually inject LLM for console mode
     
-    chat_ctx = ChatContext()
-    
-    # Add initial greeting context
-    chat_ctx.add_message(role="system", content="You are Maya-One, an advanced AI assistant. You have full Phase 8 capabilities enabled including specialized agents, RAG, and self-reflection.")
+    # System prompt stays pinned; only the most recent messages follow it
+    system_msg = ChatMessage(role="system", content=["You are Maya-One, an advanced AI assistant. You have full Phase 8 capabilities enabled including specialized agents, RAG, and self-reflection."])
+    recent = deque(maxlen=MAX_RECENT_MESSAGES)
+
+    # Warm the RAG index in the background so the first query doesn't pay for it
+    prefetch_task = asyncio.create_task(_prefetch_rag_index())
 
     while True:
         try:
             print("👤 You: ", end="", flush=True)
-            user_input = sys.stdin.readline().strip()
+            # Read on a worker thread so background tasks keep running while the user types
+            line = await asyncio.to_thread(sys.stdin.readline)
+            if not line: break  # EOF
+            user_input = line.strip()
             if not user_input: continue
             if user_input.lower() in ['exit', 'quit']: break
             
@@ -84,9 +104,9 @@ async def run_console_interactive():
             # Create a message object
             msg = ChatMessage(role="user", content=[user_input])
             
-            # Add message to context so agent can see it
-            # msg is already a ChatMessage object, but add_message takes role/content
-            chat_ctx.add_message(role=msg.role, content=msg.content)
+            # Rebuild a bounded context so each call sends O(N) history, not the whole session
+            recent.append(msg)
+            chat_ctx = ChatContext([system_msg, *recent])
             
             # Execute through Assistant.llm_node (The core routing logic)
             stream = assistant.llm_node(chat_ctx, msg, None)
@@ -97,15 +117,25 @@ async def run_console_interactive():
             
             print("\n🤖 Maya: ", end="", flush=True)
             full_response = ""
+            # Coalesce tokens and flush on newline or every STREAM_FLUSH_INTERVAL seconds
+            pending = []
+            last_flush = time.monotonic()
             async for chunk in stream:
                  content = chunk.choices[0].delta.content if chunk.choices and chunk.choices[0].delta.content else ""
                  if content:
-                     print(content, end="", flush=True)
+                     pending.append(content)
                      full_response += content
+                     now = time.monotonic()
+                     if "\n" in content or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                         sys.stdout.write("".join(pending))
+                         sys.stdout.flush()
+                         pending.clear()
+                         last_flush = now
+            sys.stdout.write("".join(pending))
             print("\n")
             
-            # Add response to context
-            chat_ctx.add_message(role="assistant", content=full_response)
+            # Add response to history
+            recent.append(ChatMessage(role="assistant", content=[full_response]))
 
         except KeyboardInterrupt:
             break
@@ -113,4 +143,5 @@ async def run_console_interactive():
             print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(run_console_interactive())
+    import _bootstrap
+    _bootstrap.run(run_console_interactive())
@@ -3,18 +3,14 @@ import sys
 import os
 import asyncio
 import logging
-from unittest.mock import MagicMock
+from dataclasses import dataclass
 
 # Ensure we can import from the Agent directory
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from agent import Assistant
-from livekit.agents import ChatContext
+# Only the lightweight role enum is imported eagerly; the agent stack is
+# imported inside run_interactive_session() so startup stays fast.
 from core.governance.types import UserRole
-from core.tools import ToolManager
-from core.intent.classifier import IntentResult, IntentType
-from unittest.mock import patch
-import logging
 
 # Define Mock Tools
 async def open_app(ctx, app_name):
@@ -34,20 +30,49 @@ get_weather.parameters = {"type": "object", "properties": {"location": {"type":
 
 local_tools = [open_app, get_weather]
 
+
+@dataclass(slots=True, frozen=True)
+class GovContext:
+    """Governance context handed to the router (what agent.py injects per turn)."""
+    user_role: UserRole
+    user_id: str
+
 # Configure logging to stdout
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+SEPARATOR = "-" * 20
+
+# Menu choice -> (role, user id); anything else falls back to GUEST
+_ROLES = {
+    "1": (UserRole.GUEST, "guest_user"),
+    "2": (UserRole.ADMIN, "admin_user"),
+}
+
+
+def _emit(*lines):
+    """Write several lines with one stdout write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 async def run_interactive_session():
-    print("--- ZOYA/MAYA Governance Verification ---\n")
-    
+    from unittest.mock import MagicMock
+    from agent import Assistant
+    from livekit.agents import ChatContext
+    from core.tools import ToolManager
+    from core.intent.classifier import IntentResult, IntentType
+    from core.routing.router import get_router
+
     # Select Role
-    print("Select User Role:")
-    print("1. GUEST (Default)")
-    print("2. ADMIN")
-    choice = input("Enter choice (1/2): ")
+    _emit(
+        "--- ZOYA/MAYA Governance Verification ---\n",
+        "Select User Role:",
+        "1. GUEST (Default)",
+        "2. ADMIN",
+    )
+    choice = await asyncio.to_thread(input, "Enter choice (1/2): ")
     
-    role = UserRole.ADMIN if choice == '2' else UserRole.GUEST
-    user_id = "admin_user" if role == UserRole.ADMIN else "guest_user"
+    role, user_id = _ROLES.get(choice.strip(), _ROLES["1"])
     
     print(f"\nInitializing Agent as {role.name} ({user_id})...\n")
     
@@ -70,8 +95,13 @@ async def run_interactive_session():
     
     print("Agent & Governance Layer Ready. Type 'exit' to quit.\n")
     
+    # Context injection as per agent.py; role and user are fixed for the session
+    ctx = GovContext(role, user_id)
+    router = get_router()
+    
     while True:
-        user_input = input(f"{role.name} > ")
+        # Read on a worker thread so background tasks keep running while the user types
+        user_input = await asyncio.to_thread(input, f"{role.name} > ")
         if user_input.lower() in ['exit', 'quit']:
             break
             
@@ -94,23 +124,10 @@ async def run_interactive_session():
         # We can directly call the routing logic to verify governance,
         # mirroring what llm_node does.
         
-        from core.routing.router import get_router
-        
-        print("Thinking...")
-        
-        # Context injection as per agent.py
-        class Context: pass
-        ctx = Context()
-        ctx.user_role = role
-        ctx.user_id = user_id
-        
-        
-        router = get_router()
-        
         # Bypass Classifier for direct governance testing
         if user_input.startswith("exec:"):
             tool_name = user_input.split(":", 1)[1].strip()
-            print(f"⚡ Forcing execution of: {tool_name}")
+            _emit("Thinking...", f"⚡ Forcing execution of: {tool_name}")
             
             # Create a fake intent result
             intent = IntentResult(
@@ -121,11 +138,7 @@ async def run_interactive_session():
             )
             
             # Manually call handle_tool_action to trigger governed executor
-            # We need to construct a context object as agent.py does
-            ctx = Context()
-            ctx.user_role = role
-            ctx.user_id = user_id
-            
+            # (with the same context object agent.py would build)
             try:
                 # We access the private method or just call the executor directly if exposed
                 # But router._handle_tool_action handles param extraction which we skipped
@@ -133,36 +146,41 @@ async def run_interactive_session():
                 result = await router._handle_tool_action(user_input, intent, context=ctx)
                 
                 if result.error:
-                    print(f"❌ BLOCKED/ERROR: {result.error}")
+                    _emit(f"❌ BLOCKED/ERROR: {result.error}", SEPARATOR)
                 else:
-                    print(f"✅ TOOL EXECUTED: {result.tool_executed}")
-                    print(f"   Output: {result.response}")
+                    _emit(
+                        f"✅ TOOL EXECUTED: {result.tool_executed}",
+                        f"   Output: {result.response}",
+                        SEPARATOR,
+                    )
                     
             except Exception as e:
-                print(f"⚠️ Exception during execution: {e}")
+                _emit(f"⚠️ Exception during execution: {e}", SEPARATOR)
                 
-            print("-" * 20)
             continue
 
+        _emit("Thinking...")
         try:
             result = await router.route(user_input, context=ctx)
             
             if result.handled:
                 if result.error:
-                    print(f"❌ BLOCKED/ERROR: {result.error}")
+                    _emit(f"❌ BLOCKED/ERROR: {result.error}", SEPARATOR)
                 else:
                     if result.tool_executed:
-                         print(f"✅ TOOL EXECUTED: {result.tool_executed}")
-                         print(f"   Output: {result.response}")
+                         _emit(
+                             f"✅ TOOL EXECUTED: {result.tool_executed}",
+                             f"   Output: {result.response}",
+                             SEPARATOR,
+                         )
                     else:
-                         print(f"ℹ️ HANDLED: {result.response}")
+                         _emit(f"ℹ️ HANDLED: {result.response}", SEPARATOR)
             else:
-                 print("💬 (Passed to LLM for chat)")
+                 _emit("💬 (Passed to LLM for chat)", SEPARATOR)
                  
         except Exception as e:
-            print(f"⚠️ Exception: {e}")
-            
-        print("-" * 20)
+            _emit(f"⚠️ Exception: {e}", SEPARATOR)
 
 if __name__ == "__main__":
-    asyncio.run(run_interactive_session())
+    import _bootstrap
+    _bootstrap.run(run_interactive_session())
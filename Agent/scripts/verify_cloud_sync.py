@@ -29,4 +29,5 @@ async def test_cloud_sync():
     await mm.cloud_sync.stop()
 
 if __name__ == "__main__":
-    asyncio.run(test_cloud_sync())
+    import _bootstrap
+    _bootstrap.run(test_cloud_sync())
@@ -36,4 +36,5 @@ async def test_local_memory():
         print("\n❌ FAILURE: Could not retrieve memory.")
 
 if __name__ == "__main__":
-    asyncio.run(test_local_memory())
+    import _bootstrap
+    _bootstrap.run(test_local_memory())
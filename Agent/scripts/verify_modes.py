@@ -1,6 +1,7 @@
 
 import asyncio
 import logging
+from unittest.mock import AsyncMock
 from livekit.agents import ChatContext, ChatMessage
 from core.governance.modes import AgentMode
 from core.governance.types import UserRole
@@ -11,7 +12,7 @@ class MockAssistant:
         self.agent_mode = mode
         self.user_role = UserRole.ADMIN
         self.user_id = "test_user"
-        self.rate_limiter = type('MockRateLimiter', (), {'acquire': asyncio.coroutine(lambda: None)})()
+        self.rate_limiter = type('MockRateLimiter', (), {'acquire': AsyncMock(return_value=None)})()
 
     async def llm_node_logic(self, user_text):
         """Minimal version of the logic in Assistant.llm_node for verification"""
@@ -53,4 +54,5 @@ async def main():
     print(await assistant.llm_node_logic("Set an alarm for 8am"))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import _bootstrap
+    _bootstrap.run(main())
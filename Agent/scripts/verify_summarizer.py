@@ -5,6 +5,7 @@ import os
 from dotenv import load_dotenv
 from livekit.agents import ChatContext, ChatMessage
 from core.memory.memory_manager import MemoryManager
+from telemetry.chaos_guardrails import GuardrailLimits, reset_chaos_guardrails
 
 # Setup
 load_dotenv()
@@ -27,6 +28,13 @@ async def test_summarizer():
         ctx.add_message(role="user", content=f"User message {i}: I like apples.")
         ctx.add_message(role="assistant", content=f"Assistant message {i}: Apples are good.")
     
+    # Budget check so CI reruns can't run away with Groq tokens (~4 chars per token)
+    guardrails = reset_chaos_guardrails(GuardrailLimits(max_tokens_per_session=5000))
+    estimate_in = sum(len(msg.text_content or "") for msg in ctx.messages()) // 4
+    if not guardrails.check_token_budget(estimate_in, 0):
+        print(f"❌ Estimated {estimate_in} tokens exceeds the guardrail budget. Skipping test.")
+        return
+
     # Trigger summarization (threshold=10)
     print("Triggering summarization (threshold=10)...")
     summary = await mm.summarize_session(ctx, threshold=10)
@@ -37,4 +45,5 @@ async def test_summarizer():
         print("❌ No summary generated (check logs).")
 
 if __name__ == "__main__":
-    asyncio.run(test_summarizer())
+    import _bootstrap
+    _bootstrap.run(test_summarizer())
@@ -19,60 +19,70 @@ class ChaosGuardrails:
     
     def __init__(self, limits: Optional[GuardrailLimits] = None):
         self.limits = limits or GuardrailLimits()
-        self.session_start_time = time.time()
+        # Thresholds hoisted out of the per-call checks; limits are fixed per instance
+        # (reset_chaos_guardrails() builds a new one for new limits).
+        self._max_tokens = self.limits.max_tokens_per_session
+        self._warn_tokens = self._max_tokens * 0.8
+        self._max_retries = self.limits.max_retries_per_request
+        self._max_duration = self.limits.max_session_duration_seconds
+        self._warn_duration = self._max_duration * 0.8
+        self._max_failures = self.limits.max_consecutive_failures
+        self.session_start_time = time.monotonic()
         self.total_tokens_used = 0
         self.consecutive_failures = 0
         self.emergency_stop_triggered = False
         
     def reset_session(self):
         """Reset session-level counters."""
-        self.session_start_time = time.time()
+        self.session_start_time = time.monotonic()
         self.total_tokens_used = 0
         self.consecutive_failures = 0
         self.emergency_stop_triggered = False
         
     def check_token_budget(self, tokens_in: int, tokens_out: int) -> bool:
         """Check if token usage is within budget."""
-        self.total_tokens_used += (tokens_in + tokens_out)
+        used = self.total_tokens_used + tokens_in + tokens_out
+        self.total_tokens_used = used
         
-        if self.total_tokens_used >= self.limits.max_tokens_per_session:
-            logger.error(f"🚨 GUARDRAIL: Token budget exceeded ({self.total_tokens_used}/{self.limits.max_tokens_per_session})")
+        if used >= self._max_tokens:
+            logger.error(f"🚨 GUARDRAIL: Token budget exceeded ({used}/{self._max_tokens})")
             self.emergency_stop_triggered = True
             return False
         
-        if self.total_tokens_used >= self.limits.max_tokens_per_session * 0.8:
-            logger.warning(f"⚠️ GUARDRAIL: Token budget at 80% ({self.total_tokens_used}/{self.limits.max_tokens_per_session})")
+        if used >= self._warn_tokens:
+            logger.warning(f"⚠️ GUARDRAIL: Token budget at 80% ({used}/{self._max_tokens})")
         
         return True
     
     def check_retry_limit(self, retry_count: int) -> bool:
         """Check if retry count is within limit."""
-        if retry_count >= self.limits.max_retries_per_request:
-            logger.error(f"🚨 GUARDRAIL: Retry limit exceeded ({retry_count}/{self.limits.max_retries_per_request})")
+        if retry_count >= self._max_retries:
+            logger.error(f"🚨 GUARDRAIL: Retry limit exceeded ({retry_count}/{self._max_retries})")
             self.emergency_stop_triggered = True
             return False
         return True
     
     def check_session_duration(self) -> bool:
         """Check if session duration is within limit."""
-        elapsed = time.time() - self.session_start_time
+        elapsed = time.monotonic() - self.session_start_time
         
-        if elapsed >= self.limits.max_session_duration_seconds:
-            logger.error(f"🚨 GUARDRAIL: Session duration exceeded ({elapsed:.0f}s/{self.limits.max_session_duration_seconds}s)")
+        if elapsed >= self._max_duration:
+            logger.error(f"🚨 GUARDRAIL: Session duration exceeded ({elapsed:.0f}s/{self._max_duration}s)")
             self.emergency_stop_triggered = True
             return False
         
-        if elapsed >= self.limits.max_session_duration_seconds * 0.8:
-            logger.warning(f"⚠️ GUARDRAIL: Session duration at 80% ({elapsed:.0f}s/{self.limits.max_session_duration_seconds}s)")
+        if elapsed >= self._warn_duration:
+            logger.warning(f"⚠️ GUARDRAIL: Session duration at 80% ({elapsed:.0f}s/{self._max_duration}s)")
         
         return True
     
     def record_failure(self):
         """Record a failure and check consecutive failure limit."""
-        self.consecutive_failures += 1
+        failures = self.consecutive_failures + 1
+        self.consecutive_failures = failures
         
-        if self.consecutive_failures >= self.limits.max_consecutive_failures:
-            logger.error(f"🚨 GUARDRAIL: Consecutive failure limit exceeded ({self.consecutive_failures}/{self.limits.max_consecutive_failures})")
+        if failures >= self._max_failures:
+            logger.error(f"🚨 GUARDRAIL: Consecutive failure limit exceeded ({failures}/{self._max_failures})")
             self.emergency_stop_triggered = True
             return False
         return True
@@ -87,13 +97,13 @@ class ChaosGuardrails:
     
     def get_status(self) -> dict:
         """Get current guardrail status."""
-        elapsed = time.time() - self.session_start_time
+        elapsed = time.monotonic() - self.session_start_time
         return {
             'tokens_used': self.total_tokens_used,
-            'tokens_limit': self.limits.max_tokens_per_session,
-            'tokens_remaining': self.limits.max_tokens_per_session - self.total_tokens_used,
+            'tokens_limit': self._max_tokens,
+            'tokens_remaining': self._max_tokens - self.total_tokens_used,
             'session_duration': elapsed,
-            'session_limit': self.limits.max_session_duration_seconds,
+            'session_limit': self._max_duration,
             'consecutive_failures': self.consecutive_failures,
             'emergency_stop': self.emergency_stop_triggered
         }
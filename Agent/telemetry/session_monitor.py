@@ -1,15 +1,50 @@
 
+import asyncio
+import functools
 import logging
+import threading
 import time
 import os
-from dataclasses import dataclass
+import re
+from collections import deque
+from dataclasses import dataclass, fields
 from typing import Optional, Dict
 
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, checkpointing stays off
+    fcntl = None
+
 from core.evaluation.evaluation_engine import EvaluationEngine, SystemStats
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+_CLOCK = time.monotonic_ns
+
+# Bounded so long-lived sessions don't grow the history without limit
+METRICS_HISTORY_SIZE = 4096
+# Finished requests waiting for the background drain before end_request processes inline
+DRAIN_QUEUE_SIZE = 1024
+# Column order of the numeric ring (and of the on-disk checkpoint)
+RING_COLUMNS = (
+    'context_size',
+    'llm_latency',
+    'stream_first_chunk_latency',
+    'retry_count',
+    'memory_retrieval_count',
+)
+# Checkpoint header: magic, version, rows, cols, then the state fields below
+_CHECKPOINT_MAGIC = 0x4D415941544C4D31  # "MAYATLM1"
+_CHECKPOINT_VERSION = 1
+_HEADER_STATE = ('write_idx', 'turn_counter', 'recovery_start_turn', 'in_recovery', 'consecutive_healthy_turns')
+_HEADER_FIELDS = 4 + len(_HEADER_STATE)
+# Rolling P95/P99 over the most recent PERCENTILE_WINDOW requests, refreshed every PERCENTILE_EVERY
+PERCENTILE_WINDOW = 500
+PERCENTILE_EVERY = 50
+
+@dataclass(slots=True)
 class RequestMetrics:
     tokens_in: int = 0
     tokens_out: int = 0
@@ -35,18 +70,45 @@ class RequestMetrics:
     tts_downtime: float = 0.0
     reconnect_attempts: int = 0
 
-class SessionMonitor:
-    _instance = None
+_METRIC_FIELDS = tuple(f.name for f in fields(RequestMetrics))
+
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(SessionMonitor, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+def metrics_to_dict(metrics: RequestMetrics) -> Dict[str, object]:
+    """Flat field dict for structured logs (no deep copy, unlike dataclasses.asdict)."""
+    return {name: getattr(metrics, name) for name in _METRIC_FIELDS}
 
-    def _initialize(self):
-        self.metrics_history = []
+class SessionMonitor:
+    _VALID_METRICS = frozenset(_METRIC_FIELDS)
+    # RequestMetrics field -> key in self.thresholds
+    _THRESHOLD_MAP = {
+        'context_size': 'context_tokens',
+        'llm_latency': 'llm_latency',
+        'stream_first_chunk_latency': 'first_chunk_latency',
+        'retry_count': 'retries_per_request',
+        'memory_retrieval_count': 'memory_retrieval_count',
+    }
+
+    def __init__(self, checkpoint_dir: Optional[str] = None, checkpoint_key: Optional[str] = None):
+        self.metrics_history = deque(maxlen=METRICS_HISTORY_SIZE)
+        self.turn_counter = 0
+        
+        # Numeric metrics as a (METRICS_HISTORY_SIZE, len(RING_COLUMNS)) ring written alongside
+        # the history; memory-mapped to disk when checkpointing so it survives a crash
+        self._checkpoint_lock = None
+        self._ring, self._header = self._open_checkpoint(checkpoint_dir, checkpoint_key)
+        self._bind_columns()
+        self._write_idx = 0
+        self.rolling_percentiles: Dict[str, Dict[str, float]] = {}
+        
+        # Background drain for finished requests (started lazily on the running loop)
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self.drain_stats = {'writes_total': 0, 'queue_full_total': 0}
+        
+        # Guards read-modify-write increments; plain stores don't need it
+        self._inc_lock = threading.Lock()
         self.current_metrics = RequestMetrics()
+        self.request_start_time_ns = _CLOCK()
         
         # Initialize evaluation engine
         memory_db_path = os.path.expanduser("~/.maya/memory/keyword.db")
@@ -61,6 +123,22 @@ class SessionMonitor:
             'retries_per_request': {'warning': 1, 'critical': 3},        # Baseline: 0 (conservative)
             'memory_retrieval_count': {'warning': 2, 'critical': 5}      # P95: 1, P99: 1 (with margin)
         }
+        # (warning, critical) per RequestMetrics field, resolved once for record_metric
+        self._fast_thresholds = {
+            metric: (self.thresholds[key]['warning'], self.thresholds[key]['critical'])
+            for metric, key in self._THRESHOLD_MAP.items()
+        }
+        # Warning thresholds never change after this point; hoist them for the per-turn recovery check
+        self._warn_thresholds_vec = tuple(
+            self.thresholds[key]['warning']
+            for key in (
+                'context_tokens',
+                'llm_latency',
+                'first_chunk_latency',
+                'retries_per_request',
+                'memory_retrieval_count',
+            )
+        )
         
         # Chaos experiment context
         self.current_experiment_id = None
@@ -71,67 +149,276 @@ class SessionMonitor:
         # Recovery tracking
         self.consecutive_healthy_turns = 0
         self.in_recovery = False
+        self.recovery_start_turn = 0
+        
+        if self._header is not None:
+            self._restore_checkpoint()
     
     def start_request(self):
         # We don't reset everything if it's a multi-turn call within one flow,
         # but usually, we want per-request clear. 
         # For drift detection, we might also want a Session-wide counter.
+        # Always a fresh instance: the history and the drain queue keep references
+        # to finished requests, so a recycled object would be overwritten in place.
         self.current_metrics = RequestMetrics()
-        self.request_start_time = time.time()
+        self.request_start_time_ns = _CLOCK()
+
+    def request_elapsed(self) -> float:
+        """Seconds since the last start_request, immune to wall-clock jumps."""
+        return (_CLOCK() - self.request_start_time_ns) * 1e-9
 
     def record_metric(self, metric_name: str, value: float, increment: bool = False):
-        if hasattr(self.current_metrics, metric_name):
-            if increment:
-                current_val = getattr(self.current_metrics, metric_name)
-                setattr(self.current_metrics, metric_name, current_val + value)
-            else:
-                setattr(self.current_metrics, metric_name, value)
-            
-            # Check threshold against the final value
-            self._check_threshold(metric_name, getattr(self.current_metrics, metric_name))
+        if metric_name not in self._VALID_METRICS:
+            logger.warning("unknown_metric", extra={"metric": metric_name})
+            return
+        
+        metrics = self.current_metrics
+        if increment:
+            with self._inc_lock:
+                value = getattr(metrics, metric_name) + value
+                setattr(metrics, metric_name, value)
         else:
-            logger.warning(f"⚠️ Unknown metric recorded: {metric_name}")
+            setattr(metrics, metric_name, value)
+        
+        # Check threshold against the final value
+        limits = self._fast_thresholds.get(metric_name)
+        if limits is not None and value >= limits[0]:
+            if value >= limits[1]:
+                logger.error("metric_threshold_exceeded", extra={"metric": metric_name, "value": value, "threshold": limits[1], "severity": "critical"})
+            else:
+                logger.warning("metric_threshold_exceeded", extra={"metric": metric_name, "value": value, "threshold": limits[0], "severity": "warning"})
 
     def end_request(self):
+        metrics = self.current_metrics
         # Tag with experiment context if active
         if self.current_experiment_id:
-            self.current_metrics.experiment_id = self.current_experiment_id
-            self.current_metrics.experiment_type = self.current_experiment_type
-            self.current_metrics.phase = self.current_phase
-            self.current_metrics.turn_number = self.current_turn
+            metrics.experiment_id = self.current_experiment_id
+            metrics.experiment_type = self.current_experiment_type
+            metrics.phase = self.current_phase
+            metrics.turn_number = self.current_turn
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, sync callers): process in place
+            self._process_request(metrics)
+            return
+        
+        queue = self._ensure_drain(loop)
+        try:
+            queue.put_nowait(metrics)
+            self.drain_stats['writes_total'] += 1
+        except asyncio.QueueFull:
+            # Backpressure: catch up on the backlog in order, then this request
+            self.drain_stats['queue_full_total'] += 1
+            self._drain_pending()
+            self._process_request(metrics)
+
+    async def flush(self):
+        """Wait until every finished request has been processed by the drain task."""
+        if self._queue is not None and self._drain_task is not None and not self._drain_task.done():
+            await self._queue.join()
+
+    def _ensure_drain(self, loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+        task = self._drain_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            if self._queue is not None:
+                # Don't lose requests queued on a previous loop
+                self._drain_pending()
+            self._queue = asyncio.Queue(maxsize=DRAIN_QUEUE_SIZE)
+            self._drain_task = loop.create_task(self._drain())
+        return self._queue
+
+    async def _drain(self):
+        queue = self._queue
+        while True:
+            metrics = await queue.get()
+            try:
+                self._process_request(metrics)
+            except Exception as e:
+                logger.error("request_metrics_failed", extra={"error": str(e)})
+            finally:
+                queue.task_done()
+            # Work through whatever else piled up before yielding again
+            self._drain_pending()
+
+    def _drain_pending(self):
+        queue = self._queue
+        while True:
+            try:
+                metrics = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                self._process_request(metrics)
+            except Exception as e:
+                logger.error("request_metrics_failed", extra={"error": str(e)})
+            finally:
+                queue.task_done()
+
+    def _process_request(self, metrics: RequestMetrics):
+        self.turn_counter += 1
         
         # Update recovery tracking
-        self._update_recovery_status()
+        self._update_recovery_status(metrics)
         
         # Evaluate system health
         system_stats = SystemStats(memory_mb=self.get_memory_usage())
-        health = self.evaluation_engine.evaluate(self.current_metrics, system_stats)
+        health = self.evaluation_engine.evaluate(metrics, system_stats)
         
         if not health.is_healthy():
-            logger.error(f"🚨 Health Score: {health.overall_score:.2f} - {health}")
-        
-        self.metrics_history.append(self.current_metrics)
-        logger.info(f"📊 Request Metrics: {self.current_metrics}")
-        
-    def _check_threshold(self, metric_name: str, value: float):
-        if metric_name == 'context_size':
-            threshold_key = 'context_tokens'
-        elif metric_name == 'llm_latency':
-            threshold_key = 'llm_latency'
-        elif metric_name == 'stream_first_chunk_latency':
-            threshold_key = 'first_chunk_latency'
-        elif metric_name == 'retry_count':
-            threshold_key = 'retries_per_request'
-        else:
-            return
-
-        thresholds = self.thresholds.get(threshold_key)
-        if thresholds:
-            if value >= thresholds['critical']:
-                logger.error(f"🚨 CRITICAL: {metric_name} exceeded critical threshold: {value} >= {thresholds['critical']}")
-            elif value >= thresholds['warning']:
-                logger.warning(f"⚠️ WARNING: {metric_name} exceeded warning threshold: {value} >= {thresholds['warning']}")
+            logger.error("health_degraded", extra={"score": health.overall_score, "health": str(health)})
+        
+        self.metrics_history.append(metrics)
+        self._record_columns(metrics)
+        if self.turn_counter % PERCENTILE_EVERY == 0:
+            self.rolling_percentiles = self.compute_rolling_percentiles()
+            logger.info("rolling_percentiles", extra={"percentiles": self.rolling_percentiles})
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("request_metrics", extra={"metrics": metrics_to_dict(metrics)})
+        
+    def _record_columns(self, metrics: RequestMetrics):
+        self._ring[self._write_idx % METRICS_HISTORY_SIZE] = (
+            metrics.context_size,
+            metrics.llm_latency,
+            metrics.stream_first_chunk_latency,
+            metrics.retry_count,
+            metrics.memory_retrieval_count,
+        )
+        self._write_idx += 1
+        if self._header is not None:
+            self._write_header()
+    
+    def _write_header(self):
+        # Only this process writes here: _open_checkpoint holds an exclusive lock on the files
+        self._header[4:] = (
+            self._write_idx,
+            self.turn_counter,
+            self.recovery_start_turn,
+            self.in_recovery,
+            self.consecutive_healthy_turns,
+        )
     
+    def _bind_columns(self):
+        self._columns = {name: self._ring[:, i] for i, name in enumerate(RING_COLUMNS)}
+        self._col_context_size = self._columns['context_size']
+        self._col_llm_latency = self._columns['llm_latency']
+        self._col_first_chunk_latency = self._columns['stream_first_chunk_latency']
+        self._col_retry_count = self._columns['retry_count']
+        self._col_memory_retrieval_count = self._columns['memory_retrieval_count']
+
+    def _open_checkpoint(self, checkpoint_dir: Optional[str], checkpoint_key: Optional[str]):
+        shape = (METRICS_HISTORY_SIZE, len(RING_COLUMNS))
+        if not checkpoint_dir:
+            return np.zeros(shape, dtype=np.float32), None
+        if fcntl is None:
+            logger.warning("telemetry_checkpoint_unavailable", extra={"path": checkpoint_dir, "error": "no file locking"})
+            return np.zeros(shape, dtype=np.float32), None
+        
+        key = re.sub(r"[^A-Za-z0-9_.-]", "_", checkpoint_key or f"pid{os.getpid()}")
+        base = os.path.join(checkpoint_dir, f"session-{key}")
+        try:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            lock = open(f"{base}.lock", "a")
+            try:
+                # One writer per checkpoint; a second process gets an in-memory ring instead
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                raise
+            
+            ring_path, header_path = f"{base}.ring", f"{base}.hdr"
+            ring_bytes = shape[0] * shape[1] * np.dtype(np.float32).itemsize
+            header_bytes = _HEADER_FIELDS * np.dtype(np.int64).itemsize
+            resume = (
+                os.path.exists(header_path) and os.path.getsize(header_path) == header_bytes
+                and os.path.exists(ring_path) and os.path.getsize(ring_path) == ring_bytes
+            )
+            if resume:
+                header = np.memmap(header_path, dtype=np.int64, mode='r+', shape=(_HEADER_FIELDS,))
+                resume = tuple(int(v) for v in header[:4]) == (
+                    _CHECKPOINT_MAGIC, _CHECKPOINT_VERSION, shape[0], shape[1]
+                )
+            if resume:
+                ring = np.memmap(ring_path, dtype=np.float32, mode='r+', shape=shape)
+            else:
+                ring = np.memmap(ring_path, dtype=np.float32, mode='w+', shape=shape)
+                header = np.memmap(header_path, dtype=np.int64, mode='w+', shape=(_HEADER_FIELDS,))
+                header[:4] = (_CHECKPOINT_MAGIC, _CHECKPOINT_VERSION, shape[0], shape[1])
+            self._checkpoint_lock = lock
+            return ring, header
+        except (OSError, ValueError) as e:
+            logger.warning("telemetry_checkpoint_unavailable", extra={"path": base, "error": str(e)})
+            return np.zeros(shape, dtype=np.float32), None
+
+    def _restore_checkpoint(self):
+        write_idx, turn_counter, recovery_start_turn, in_recovery, healthy_turns = (
+            int(v) for v in self._header[4:]
+        )
+        self._write_idx = write_idx
+        self.turn_counter = turn_counter
+        self.recovery_start_turn = recovery_start_turn
+        self.in_recovery = bool(in_recovery)
+        self.consecutive_healthy_turns = healthy_turns
+        if turn_counter:
+            logger.info("telemetry_checkpoint_restored", extra={"turns": turn_counter, "in_recovery": self.in_recovery})
+
+    def reset(self):
+        """Drop all history, ring, recovery and checkpoint state for a fresh run."""
+        with self._inc_lock:
+            if self._queue is not None:
+                # Requests finished before the reset must not land after it
+                while True:
+                    try:
+                        self._queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    self._queue.task_done()
+            self.metrics_history.clear()
+            self._ring[:] = 0
+            self._write_idx = 0
+            self.turn_counter = 0
+            self.recovery_start_turn = 0
+            self.in_recovery = False
+            self.consecutive_healthy_turns = 0
+            self.rolling_percentiles = {}
+            if self._header is not None:
+                self._write_header()
+
+    def close(self):
+        """Process queued requests, stop the drain task, then flush and release any checkpoint."""
+        if self._queue is not None:
+            self._drain_pending()
+        if self._drain_task is not None and not self._drain_task.done():
+            self._drain_task.cancel()
+        self._drain_task = None
+        if self._header is not None:
+            self._ring.flush()
+            self._header.flush()
+            # Keep the data in memory; the files stay behind for the next start
+            self._ring = np.array(self._ring)
+            self._bind_columns()
+            self._header = None
+        if self._checkpoint_lock is not None:
+            self._checkpoint_lock.close()
+            self._checkpoint_lock = None
+        
+    def compute_rolling_percentiles(self, window: int = PERCENTILE_WINDOW) -> Dict[str, Dict[str, float]]:
+        """P95/P99 of each recorded column over the last `window` requests."""
+        size = len(self._col_llm_latency)
+        n = min(window, self._write_idx, size)
+        if n == 0:
+            return {}
+        
+        recent = np.arange(self._write_idx - n, self._write_idx) % size
+        k95, k99 = int(0.95 * (n - 1)), int(0.99 * (n - 1))
+        result = {}
+        for name, col in self._columns.items():
+            # partition selects both ranks in O(n) without a full sort
+            ranked = np.partition(col[recent], (k95, k99))
+            result[name] = {'p95': float(ranked[k95]), 'p99': float(ranked[k99])}
+        return result
+
     def set_tags(self, experiment_id: str, experiment_type: str, phase: str, turn: int):
         """Set chaos experiment tags for the current request."""
         self.current_experiment_id = experiment_id
@@ -143,43 +430,41 @@ class SessionMonitor:
         """Set chaos experiment context for telemetry tagging."""
         self.current_experiment_id = experiment_id
         self.current_experiment_type = experiment_type
-        logger.info(f"🧪 Chaos experiment started: {experiment_id} (type: {experiment_type})")
+        logger.info("chaos_experiment_started", extra={"experiment_id": experiment_id, "experiment_type": experiment_type})
     
     def clear_experiment_context(self):
         """Clear chaos experiment context."""
-        logger.info(f"🧪 Chaos experiment ended: {self.current_experiment_id}")
+        logger.info("chaos_experiment_ended", extra={"experiment_id": self.current_experiment_id})
         self.current_experiment_id = None
         self.current_experiment_type = None
     
-    def _update_recovery_status(self):
+    def _update_recovery_status(self, m: RequestMetrics):
         """Track system recovery after degradation."""
-        # Check if all metrics are below warning thresholds
-        is_healthy = True
-        
-        if self.current_metrics.context_size >= self.thresholds['context_tokens']['warning']:
-            is_healthy = False
-        if self.current_metrics.llm_latency >= self.thresholds['llm_latency']['warning']:
-            is_healthy = False
-        if self.current_metrics.stream_first_chunk_latency >= self.thresholds['first_chunk_latency']['warning']:
-            is_healthy = False
-        if self.current_metrics.retry_count >= self.thresholds['retries_per_request']['warning']:
-            is_healthy = False
-        if self.current_metrics.memory_retrieval_count >= self.thresholds['memory_retrieval_count']['warning']:
-            is_healthy = False
+        # Check if all metrics are below warning thresholds; one bit per breach.
+        # Kept inline: a helper or JIT call costs more than these five comparisons.
+        ctx_w, llm_w, fc_w, retry_w, mem_w = self._warn_thresholds_vec
+        unhealthy_bits = (
+            (m.context_size >= ctx_w)
+            | (m.llm_latency >= llm_w) << 1
+            | (m.stream_first_chunk_latency >= fc_w) << 2
+            | (m.retry_count >= retry_w) << 3
+            | (m.memory_retrieval_count >= mem_w) << 4
+        )
+        is_healthy = unhealthy_bits == 0
         
         if is_healthy:
             self.consecutive_healthy_turns += 1
             if self.in_recovery and self.consecutive_healthy_turns >= 3:
                 # System has recovered (3 consecutive healthy turns)
-                self.current_metrics.system_recovery_turns = len(self.metrics_history) - self.recovery_start_turn
-                logger.info(f"✅ System recovered after {self.current_metrics.system_recovery_turns} turns")
+                m.system_recovery_turns = self.turn_counter - self.recovery_start_turn
+                logger.info("system_recovered", extra={"recovery_turns": m.system_recovery_turns})
                 self.in_recovery = False
         else:
             if not self.in_recovery:
                 # Degradation detected, start recovery tracking
                 self.in_recovery = True
-                self.recovery_start_turn = len(self.metrics_history)
-                logger.warning(f"⚠️ System degradation detected, tracking recovery...")
+                self.recovery_start_turn = self.turn_counter
+                logger.warning("system_degradation_detected", extra={"turn": self.turn_counter})
             self.consecutive_healthy_turns = 0
 
     # --- System Metrics ---
@@ -193,19 +478,18 @@ class SessionMonitor:
 
     def record_circuit_breaker_state(self, provider_name: str, state: str):
         """Log circuit breaker state changes."""
-        logger.info(f"⚡ Circuit Breaker [{provider_name}]: {state}")
+        logger.info("circuit_breaker_state", extra={"provider": provider_name, "state": state})
         # Could add to a history list if needed
 
     def record_provider_failure(self, provider_name: str):
         """Record a provider failure event."""
-        logger.warning(f"📉 Provider Failure: {provider_name}")
+        logger.warning("provider_failure", extra={"provider": provider_name})
         # We could increment a counter here
 
     def log_system_health(self):
         """Log a snapshot of system health."""
         mem = self.get_memory_usage()
         
-        import threading
         threads = threading.active_count()
         
         fds = 0
@@ -216,11 +500,15 @@ class SessionMonitor:
         
         from core.runtime.runtime_mode import is_interactive
         if not is_interactive():
-            logger.info(f"🏥 System Health: Memory={mem:.2f}MB | Threads={threads} | FDs={fds}")
+            logger.info("system_health", extra={"memory_mb": round(mem, 2), "threads": threads, "fds": fds})
             
         return mem
 
 # Singleton Accessor
+@functools.cache
 def get_session_monitor() -> SessionMonitor:
-    return SessionMonitor()
+    # Checkpointing is opt-in; set MAYA_TELEMETRY_SESSION to a stable id to resume after a crash
+    checkpoint_dir = os.getenv("MAYA_TELEMETRY_CHECKPOINT_DIR", "").strip() or None
+    checkpoint_key = os.getenv("MAYA_TELEMETRY_SESSION", "").strip() or None
+    return SessionMonitor(checkpoint_dir=checkpoint_dir, checkpoint_key=checkpoint_key)
 
@@ -1,15 +1,17 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from core.media.media_models import MediaCommand
+from core.media.providers import playerctl_provider
 from core.media.providers.playerctl_provider import PlayerctlProvider
 
 
 @pytest.mark.asyncio
 async def test_playerctl_provider_executes_shell_command() -> None:
     provider = PlayerctlProvider()
-    with patch("core.media.providers.playerctl_provider.run_shell_command", AsyncMock(return_value="ok")) as mock_run:
+    with patch("core.media.providers.playerctl_provider._exec_playerctl", AsyncMock(return_value=(0, "ok"))) as mock_run:
         result = await provider.execute(MediaCommand(action="pause"), user_id="u1")
 
     assert result.success is True
@@ -20,7 +22,7 @@ async def test_playerctl_provider_executes_shell_command() -> None:
 @pytest.mark.asyncio
 async def test_playerctl_provider_supports_play_action() -> None:
     provider = PlayerctlProvider()
-    with patch("core.media.providers.playerctl_provider.run_shell_command", AsyncMock(return_value="playing")):
+    with patch("core.media.providers.playerctl_provider._exec_playerctl", AsyncMock(return_value=(0, "playing"))):
         result = await provider.execute(MediaCommand(action="play"), user_id="u1")
 
     assert result.success is True
@@ -31,10 +33,107 @@ async def test_playerctl_provider_supports_play_action() -> None:
 async def test_playerctl_provider_marks_no_player_output_as_failure() -> None:
     provider = PlayerctlProvider()
     with patch(
-        "core.media.providers.playerctl_provider.run_shell_command",
-        AsyncMock(return_value="STDERR:\nNo player could handle this command"),
+        "core.media.providers.playerctl_provider._exec_playerctl",
+        AsyncMock(return_value=(1, "STDERR:\nNo player could handle this command")),
     ):
         result = await provider.execute(MediaCommand(action="play"), user_id="u1")
 
     assert result.success is False
     assert "no active media player" in result.message.lower()
+
+
+@pytest.mark.asyncio
+async def test_playerctl_provider_reuses_recent_status_until_state_changes() -> None:
+    provider = PlayerctlProvider()
+    with patch(
+        "core.media.providers.playerctl_provider._run_playerctl",
+        AsyncMock(side_effect=["Playing", "Paused"]),
+    ) as mock_run, patch(
+        "core.media.providers.playerctl_provider._exec_playerctl",
+        AsyncMock(return_value=(0, "")),
+    ) as mock_exec:
+        first = await provider.execute(MediaCommand(action="status"), user_id="u1")
+        second = await provider.execute(MediaCommand(action="status"), user_id="u1")
+        await provider.execute(MediaCommand(action="next"), user_id="u1")
+        third = await provider.execute(MediaCommand(action="status"), user_id="u1")
+
+    assert first.message == second.message == "Playing"
+    assert third.message == "Paused"
+    assert mock_run.await_count == 2
+    mock_exec.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_playerctl_provider_parses_current_track() -> None:
+    provider = PlayerctlProvider()
+    with patch(
+        "core.media.providers.playerctl_provider._run_playerctl",
+        AsyncMock(return_value="Song Title\tSome Artist"),
+    ):
+        result = await provider.execute(MediaCommand(action="current"), user_id="u1")
+
+    assert result.success is True
+    assert result.message == "Song Title - Some Artist"
+    assert result.track is not None
+    assert (result.track.title, result.track.artist) == ("Song Title", "Some Artist")
+
+
+@pytest.mark.asyncio
+async def test_playerctl_provider_infers_status_after_pause() -> None:
+    provider = PlayerctlProvider()
+    with patch(
+        "core.media.providers.playerctl_provider._exec_playerctl",
+        AsyncMock(return_value=(0, "")),
+    ) as mock_exec, patch(
+        "core.media.providers.playerctl_provider._run_playerctl",
+        AsyncMock(return_value="Playing"),
+    ) as mock_run:
+        await provider.execute(MediaCommand(action="pause"), user_id="u1")
+        status = await provider.execute(MediaCommand(action="status"), user_id="u1")
+
+    assert status.message == "Paused"
+    mock_exec.assert_awaited_once()
+    mock_run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "returncode, output",
+    [(1, ""), (0, "Could not connect to players"), (0, "STDERR:\nNo players found")],
+    ids=["nonzero-exit", "unrecognised-output", "stderr"],
+)
+async def test_playerctl_provider_queries_status_when_pause_outcome_is_unknown(returncode, output) -> None:
+    provider = PlayerctlProvider()
+    with patch(
+        "core.media.providers.playerctl_provider._exec_playerctl",
+        AsyncMock(return_value=(returncode, output)),
+    ), patch(
+        "core.media.providers.playerctl_provider._run_playerctl",
+        AsyncMock(return_value="Playing"),
+    ) as mock_run:
+        await provider.execute(MediaCommand(action="pause"), user_id="u1")
+        status = await provider.execute(MediaCommand(action="status"), user_id="u1")
+
+    assert status.message == "Playing"
+    mock_run.assert_awaited_once_with("status")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_playerctl_call_kills_and_reaps_the_child(monkeypatch) -> None:
+    spawned = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def spawn_sleep(*_args, **kwargs):
+        proc = await real_exec("sleep", "30", **kwargs)
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(playerctl_provider.asyncio, "create_subprocess_exec", spawn_sleep)
+    task = asyncio.create_task(playerctl_provider._exec_playerctl("status"))
+    while not spawned:
+        await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert spawned[0].returncode is not None
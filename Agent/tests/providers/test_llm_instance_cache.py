@@ -0,0 +1,267 @@
+import asyncio
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from providers import llmprovider
+from providers.factory import ProviderFactory
+
+
+def setup_function() -> None:
+    ProviderFactory.reset_cache()
+
+
+def test_get_llm_instance_reuses_cached_instance(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_MODEL", "llama-3.1-8b-instant")
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.3")
+    instance = MagicMock(name="groq_llm")
+
+    with patch("providers.factory.get_llm_provider", return_value=instance) as mock_get_llm:
+        first = llmprovider.get_llm_instance()
+        second = llmprovider.get_llm_instance()
+        via_factory = ProviderFactory.get_llm("groq", "llama-3.1-8b-instant", 0.3)
+
+    assert first is instance
+    assert second is instance
+    assert via_factory is instance
+    assert mock_get_llm.call_count == 1
+
+
+def test_get_llm_instance_keeps_multiple_models(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.7")
+
+    def fake_get_llm_provider(provider_name, model, temperature, **kwargs):
+        return MagicMock(name=f"{provider_name}:{model}")
+
+    with patch("providers.factory.get_llm_provider", side_effect=fake_get_llm_provider) as mock_get_llm:
+        monkeypatch.setenv("LLM_MODEL", "model-a")
+        first_a = llmprovider.get_llm_instance()
+        monkeypatch.setenv("LLM_MODEL", "model-b")
+        llmprovider.invalidate_env_cache()
+        first_b = llmprovider.get_llm_instance()
+        monkeypatch.setenv("LLM_MODEL", "model-a")
+        llmprovider.invalidate_env_cache()
+        second_a = llmprovider.get_llm_instance()
+
+    assert first_a is second_a
+    assert first_a is not first_b
+    assert mock_get_llm.call_count == 2
+
+
+def test_get_llm_instance_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.7")
+    monkeypatch.setattr(llmprovider, "_LLM_CACHE_MAX", 2)
+
+    with patch("providers.factory.get_llm_provider", side_effect=lambda **kw: MagicMock()) as mock_get_llm:
+        for model in ("model-a", "model-b", "model-c", "model-a"):
+            monkeypatch.setenv("LLM_MODEL", model)
+            llmprovider.invalidate_env_cache()
+            llmprovider.get_llm_instance()
+
+    assert mock_get_llm.call_count == 4
+    assert len(llmprovider._llm_cache) == 2
+
+
+def test_groq_fallback_is_cached(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "gsk-test")
+    monkeypatch.delenv("GROQ_API_KEY_2", raising=False)
+    monkeypatch.delenv("GROQ_API_KEY_3", raising=False)
+    fallback = MagicMock(name="groq_fallback")
+    calls = []
+
+    def fake_get_llm_provider(provider_name, model, temperature, **kwargs):
+        calls.append(provider_name)
+        if provider_name == "openai":
+            raise ValueError("OPENAI_API_KEY not found")
+        return fallback
+
+    with patch("providers.factory.get_llm_provider", side_effect=fake_get_llm_provider):
+        first = ProviderFactory.get_llm("openai", "gpt-4o", 0.5)
+        second = ProviderFactory.get_llm("openai", "gpt-4o", 0.5)
+
+    assert first is fallback
+    assert second is fallback
+    assert calls == ["openai", "groq", "openai"]
+
+
+def test_concurrent_misses_share_one_build():
+    calls = []
+    barrier = threading.Barrier(4)
+    results = []
+
+    def slow_builder():
+        calls.append(1)
+        time.sleep(0.05)
+        return MagicMock(name="llm")
+
+    def worker():
+        barrier.wait()
+        results.append(llmprovider._get_or_build("llm:test:model:0.7:", slow_builder))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+    assert not llmprovider._llm_inflight
+
+
+def test_failed_build_is_not_cached():
+    def failing_builder():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        llmprovider._get_or_build("llm:test:broken:0.7:", failing_builder)
+
+    assert "llm:test:broken:0.7:" not in llmprovider._llm_cache
+    assert not llmprovider._llm_inflight
+
+
+def test_env_snapshot_is_refreshed_on_invalidate(monkeypatch):
+    monkeypatch.setenv("LLM_MODEL", "before")
+    llmprovider.invalidate_env_cache()
+    assert llmprovider._env("LLM_MODEL") == "before"
+
+    monkeypatch.setenv("LLM_MODEL", "after")
+    assert llmprovider._env("LLM_MODEL") == "before"
+
+    llmprovider.invalidate_env_cache()
+    assert llmprovider._env("LLM_MODEL") == "after"
+
+
+def test_runtime_config_is_reused_until_env_invalidated(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "OpenAI")
+    monkeypatch.setenv("LLM_MODEL", "gpt-4o")
+    monkeypatch.setenv("LLM_TEMPERATURE", "not-a-number")
+    llmprovider.invalidate_env_cache()
+
+    first = llmprovider._parse_runtime_config()
+    assert first == ("openai", "gpt-4o", 0.7, "llm:openai:gpt-4o:0.7:")
+    assert llmprovider._parse_runtime_config() is first
+
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.2")
+    llmprovider.invalidate_env_cache()
+    assert llmprovider._parse_runtime_config()[2] == 0.2
+
+
+def test_cache_keys_and_env_names_are_interned(monkeypatch):
+    monkeypatch.setenv("LLM_MODEL", "interned")
+    llmprovider.invalidate_env_cache()
+
+    dynamic = "".join(["llm:groq:", "m", ":0.7:"])
+    assert llmprovider._llm_cache_key("groq", "m", 0.7) is sys.intern(dynamic)
+    env_name = next(name for name in llmprovider._env_vars() if name == "LLM_MODEL")
+    assert env_name is sys.intern("LLM_MODEL")
+
+
+@pytest.mark.asyncio
+async def test_get_llm_instance_async_shares_one_build(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_MODEL", "async-model")
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.7")
+    llmprovider.invalidate_env_cache()
+    instance = MagicMock(name="async_llm")
+
+    def slow_get_llm_provider(**kwargs):
+        time.sleep(0.05)
+        return instance
+
+    with patch("providers.factory.get_llm_provider", side_effect=slow_get_llm_provider) as mock_get_llm:
+        results = await asyncio.gather(*(llmprovider.get_llm_instance_async() for _ in range(4)))
+
+    assert all(result is instance for result in results)
+    assert mock_get_llm.call_count == 1
+
+
+def test_get_llm_instance_async_locks_are_per_event_loop(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_MODEL", "loop-model")
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.7")
+    monkeypatch.setenv("LLM_SHARED_HTTP_POOL", "false")
+    llmprovider.invalidate_env_cache()
+
+    async def contended_build():
+        llmprovider._llm_cache.clear()
+        return await asyncio.gather(*(llmprovider.get_llm_instance_async() for _ in range(2)))
+
+    def slow_get_llm_provider(**kwargs):
+        time.sleep(0.05)
+        return MagicMock()
+
+    with patch("providers.factory.get_llm_provider", side_effect=slow_get_llm_provider):
+        first = asyncio.run(contended_build())
+        second = asyncio.run(contended_build())
+
+    assert first[0] is first[1]
+    assert second[0] is second[1]
+    llmprovider.invalidate_env_cache()
+
+
+@pytest.mark.asyncio
+async def test_get_llm_instance_async_builds_on_the_loop_pool(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_MODEL", "pooled-model")
+    monkeypatch.setenv("LLM_SHARED_HTTP_POOL", "true")
+    llmprovider.invalidate_env_cache()
+    seen = []
+
+    def record_pool(**_):
+        seen.append((llmprovider._use_shared_http_pool(), llmprovider._shared_http_client()))
+        return MagicMock()
+
+    with patch("providers.factory.get_llm_provider", side_effect=record_pool):
+        await llmprovider.get_llm_instance_async()
+
+    assert seen == [(True, llmprovider._shared_http_client())]
+    await llmprovider.aclose_shared_http_pool()
+    llmprovider.invalidate_env_cache()
+
+
+def test_pooled_llm_instances_are_not_shared_across_event_loops(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_MODEL", "scoped-model")
+    monkeypatch.setenv("LLM_SHARED_HTTP_POOL", "true")
+    llmprovider.invalidate_env_cache()
+
+    async def build_twice():
+        first = llmprovider.get_llm_instance()
+        assert llmprovider.get_llm_instance() is first
+        return first
+
+    with patch("providers.factory.get_llm_provider", side_effect=lambda **_: MagicMock()):
+        first_loop = asyncio.run(build_twice())
+        second_loop = asyncio.run(build_twice())
+
+    assert first_loop is not second_loop
+    llmprovider.invalidate_env_cache()
+
+
+@pytest.mark.asyncio
+async def test_closing_the_pool_evicts_its_llm_instances(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setenv("LLM_PROVIDER", "groq")
+    monkeypatch.setenv("LLM_MODEL", "evicted-model")
+    monkeypatch.setenv("LLM_SHARED_HTTP_POOL", "true")
+    llmprovider.invalidate_env_cache()
+
+    with patch("providers.factory.get_llm_provider", side_effect=lambda **_: MagicMock()):
+        pooled = llmprovider.get_llm_instance()
+        await llmprovider.aclose_shared_http_pool()
+
+        assert not any("evicted-model" in key for key in llmprovider._llm_cache)
+        assert llmprovider.get_llm_instance() is not pooled
+
+    await llmprovider.aclose_shared_http_pool()
+    llmprovider.invalidate_env_cache()
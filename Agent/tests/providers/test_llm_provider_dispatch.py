@@ -0,0 +1,147 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from providers import _plugins, llmprovider
+from providers.provider_types import LLMProvider
+
+
+@pytest.mark.parametrize(
+    "alias, handler_name",
+    [
+        ("openai", "_get_openai_llm"),
+        ("  Google ", "_get_gemini_llm"),
+        ("claude", "_get_anthropic_llm"),
+        ("azure-openai", "_get_azure_openai_llm"),
+        ("bedrock", "_get_bedrock_llm"),
+    ],
+)
+def test_get_llm_provider_dispatches_aliases(monkeypatch, alias, handler_name):
+    handler = MagicMock(return_value="llm")
+    dispatch = dict(llmprovider._PROVIDER_DISPATCH)
+    for key, value in dispatch.items():
+        if value is getattr(llmprovider, handler_name):
+            dispatch[key] = handler
+    monkeypatch.setattr(llmprovider, "_PROVIDER_DISPATCH", dispatch)
+
+    assert llmprovider.get_llm_provider(alias, model="m", temperature=0.2) == "llm"
+    handler.assert_called_once_with("m", 0.2)
+
+
+@pytest.mark.parametrize("alias, key", [("togetherai", "together"), ("ollama", "ollama"), ("nvidia", "nvidia")])
+def test_openai_compatible_aliases_share_table_driven_helper(alias, key):
+    handler = llmprovider._PROVIDER_DISPATCH[LLMProvider(alias)]
+
+    assert handler.func is llmprovider._get_openai_compat_llm
+    assert handler.args == (key,)
+
+
+def test_openai_compat_local_provider_uses_placeholder_key(monkeypatch):
+    fake_llm = MagicMock()
+    monkeypatch.setitem(llmprovider._PLUGIN_CONSTRUCTORS, "openai.LLM", fake_llm)
+    monkeypatch.setenv("VLLM_BASE_URL", "http://vllm:9000/v1")
+    monkeypatch.setenv("LLM_SHARED_HTTP_POOL", "false")
+    llmprovider.invalidate_env_cache()
+
+    llmprovider.get_llm_provider("vllm", temperature=0.1)
+
+    fake_llm.assert_called_once_with(
+        model="meta-llama/Llama-3-8b-chat-hf",
+        api_key="vllm",
+        base_url="http://vllm:9000/v1",
+        temperature=0.1,
+    )
+    llmprovider.invalidate_env_cache()
+
+
+def test_openai_compat_helper_sees_patched_module_globals(monkeypatch):
+    built = MagicMock(return_value="llm")
+    builder = MagicMock(return_value=built)
+    monkeypatch.setattr(llmprovider, "_load_llm_constructor", lambda *_: "ctor")
+    monkeypatch.setattr(llmprovider, "_openai_compat_builder", builder)
+    monkeypatch.setattr(llmprovider, "_use_shared_http_pool", lambda: False)
+    monkeypatch.delenv("OLLAMA_BASE_URL", raising=False)
+    llmprovider.invalidate_env_cache()
+
+    assert llmprovider._get_openai_compat_llm("ollama", "", 0.2) == "llm"
+
+    builder.assert_called_once_with("ctor", "ollama", "http://localhost:11434/v1", False)
+    built.assert_called_once_with(model="llama3", temperature=0.2)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Azure-OpenAI", LLMProvider.AZURE_OPENAI),
+        (" aws ", LLMProvider.AWS_BEDROCK),
+        ("together_ai", LLMProvider.TOGETHER),
+        ("GROQ", LLMProvider.GROQ),
+    ],
+)
+def test_llm_provider_enum_resolves_aliases(value, expected):
+    assert LLMProvider(value) is expected
+
+
+def test_get_llm_provider_rejects_unknown_provider():
+    with pytest.raises(ValueError, match="Unsupported LLM provider"):
+        llmprovider.get_llm_provider("not-a-provider")
+
+
+def test_missing_plugin_import_is_retried(monkeypatch):
+    attempts = []
+    fake_module = object()
+
+    def fake_import(name):
+        attempts.append(name)
+        if len(attempts) < 3:
+            raise ImportError(name)
+        return fake_module
+
+    monkeypatch.setattr(_plugins.importlib, "import_module", fake_import)
+    monkeypatch.setattr(_plugins, "_PLUGIN_CACHE", {})
+
+    for _ in range(2):
+        with pytest.raises(ImportError, match="pip install livekit-plugins-fakeplugin"):
+            _plugins.load_plugin("fakeplugin", "Fake")
+
+    assert _plugins.load_plugin("fakeplugin", "Fake") is fake_module
+    assert _plugins.load_plugin("fakeplugin", "Fake") is fake_module
+    assert attempts == ["livekit.plugins.fakeplugin"] * 3
+
+
+@pytest.mark.asyncio
+async def test_openai_compatible_providers_share_http_pool(monkeypatch):
+    pytest.importorskip("livekit.plugins.openai")
+    monkeypatch.setenv("LLM_SHARED_HTTP_POOL", "true")
+    llmprovider.invalidate_env_cache()
+
+    deepseek = llmprovider.get_llm_provider("deepseek", api_key="sk-deepseek")
+    qwen = llmprovider.get_llm_provider("qwen", api_key="sk-qwen")
+
+    shared = llmprovider._shared_http_client()
+    assert deepseek._client._client is shared
+    assert qwen._client._client is shared
+    assert str(qwen._client.base_url).startswith("https://dashscope.aliyuncs.com")
+
+    await llmprovider.aclose_shared_http_pool()
+    assert shared.is_closed
+    assert llmprovider._shared_http_client() is not shared
+    await llmprovider.aclose_shared_http_pool()
+    llmprovider.invalidate_env_cache()
+
+
+def test_shared_http_pool_is_per_event_loop(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setenv("LLM_SHARED_HTTP_POOL", "true")
+    llmprovider.invalidate_env_cache()
+
+    async def pool_client():
+        client = llmprovider._shared_http_client()
+        assert llmprovider._shared_http_client() is client
+        await llmprovider.aclose_shared_http_pool()
+        return client
+
+    assert asyncio.run(pool_client()) is not asyncio.run(pool_client())
+    assert llmprovider._use_shared_http_pool() is False
+    llmprovider.invalidate_env_cache()
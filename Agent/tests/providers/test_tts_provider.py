@@ -0,0 +1,82 @@
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from providers import _plugins, ttsprovider
+
+
+def test_tts_plugins_are_imported_once(monkeypatch):
+    fake_cartesia = MagicMock(name="cartesia_plugin")
+    monkeypatch.setitem(sys.modules, "livekit.plugins.cartesia", fake_cartesia)
+    monkeypatch.setenv("CARTESIA_API_KEY", "ck-test")
+    monkeypatch.setattr(_plugins, "_PLUGIN_CACHE", {})
+    try:
+        ttsprovider._get_cartesia_tts("", "")  # pylint: disable=protected-access
+        monkeypatch.delitem(sys.modules, "livekit.plugins.cartesia")
+        ttsprovider._get_cartesia_tts("", "")  # pylint: disable=protected-access
+    finally:
+        ttsprovider.invalidate_env_cache()
+
+    assert fake_cartesia.TTS.call_count == 2
+
+
+def test_missing_tts_plugin_reports_install_hint(monkeypatch):
+    monkeypatch.setitem(sys.modules, "livekit.plugins.elevenlabs", None)
+    monkeypatch.setattr(_plugins, "_PLUGIN_CACHE", {})
+    with pytest.raises(ImportError, match="pip install livekit-plugins-elevenlabs"):
+        ttsprovider._require_plugin("elevenlabs")  # pylint: disable=protected-access
+
+
+def test_every_tts_provider_value_has_a_handler():
+    for provider in ttsprovider.TTSProvider:
+        assert provider.value in ttsprovider._TTS_DISPATCH  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("name", ["noop", "None", " text_only "])
+def test_text_only_aliases_return_no_tts(name):
+    assert ttsprovider.get_tts_provider(name) is None
+
+
+def test_unknown_tts_provider_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported TTS provider"):
+        ttsprovider.get_tts_provider("not-a-provider")
+
+
+def test_env_reads_are_cached_until_invalidated(monkeypatch):
+    ttsprovider.invalidate_env_cache()
+    monkeypatch.setenv("CARTESIA_API_KEY", "ck-first")
+    monkeypatch.setenv("PIPER_MODEL_PATH", "/models/first.onnx")
+    assert ttsprovider._validate_api_key("CARTESIA_API_KEY", "Cartesia") == "ck-first"  # pylint: disable=protected-access
+    assert ttsprovider._cached_env("PIPER_MODEL_PATH", "") == "/models/first.onnx"  # pylint: disable=protected-access
+
+    monkeypatch.setenv("CARTESIA_API_KEY", "ck-second")
+    monkeypatch.setenv("PIPER_MODEL_PATH", "/models/second.onnx")
+    assert ttsprovider._validate_api_key("CARTESIA_API_KEY", "Cartesia") == "ck-first"  # pylint: disable=protected-access
+    assert ttsprovider._cached_env("PIPER_MODEL_PATH", "") == "/models/first.onnx"  # pylint: disable=protected-access
+
+    ttsprovider.invalidate_env_cache()
+    assert ttsprovider._validate_api_key("CARTESIA_API_KEY", "Cartesia") == "ck-second"  # pylint: disable=protected-access
+    assert ttsprovider._cached_env("PIPER_MODEL_PATH", "") == "/models/second.onnx"  # pylint: disable=protected-access
+    ttsprovider.invalidate_env_cache()
+
+
+def test_provider_names_are_resolved_once():
+    ttsprovider._resolve.cache_clear()
+    first = ttsprovider._resolve(" EdgeTTS ")
+    assert ttsprovider._resolve(" EdgeTTS ") is first
+    assert first[0] is sys.intern("edgetts")
+    assert ttsprovider._resolve.cache_info().hits == 1
+
+
+def test_validated_key_is_shared_across_providers(monkeypatch):
+    ttsprovider._clear_validation_cache()  # pylint: disable=protected-access
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-first")
+    assert ttsprovider._validate_api_key("OPENAI_API_KEY", "OpenAI") == "sk-first"  # pylint: disable=protected-access
+
+    monkeypatch.delenv("OPENAI_API_KEY")
+    assert ttsprovider._validate_api_key("OPENAI_API_KEY", "Other") == "sk-first"  # pylint: disable=protected-access
+
+    ttsprovider._clear_validation_cache()  # pylint: disable=protected-access
+    with pytest.raises(ValueError, match="OPENAI_API_KEY not found"):
+        ttsprovider._validate_api_key("OPENAI_API_KEY", "OpenAI")  # pylint: disable=protected-access
@@ -34,3 +34,19 @@ async def test_api_status_includes_connector_capabilities(monkeypatch: pytest.Mo
 
     assert connectors["slack"]["available"] is False
     assert connectors["slack"]["reason"] != ""
+
+
+def test_setting_mutation_resets_cached_providers(monkeypatch: pytest.MonkeyPatch):
+    from api.handlers import _apply_config_mutation
+    from providers.factory import ProviderFactory
+
+    resets = []
+    monkeypatch.setattr(ProviderFactory, "reset_cache", classmethod(lambda cls: resets.append(cls)))
+    monkeypatch.setenv("GROQ_API_KEY", "gsk-old")
+
+    result = _apply_config_mutation(
+        target="setting", operation="set", arguments={"key": "GROQ_API_KEY", "value": "gsk-new"}
+    )
+
+    assert result["current"] == "gsk-new"
+    assert resets == [ProviderFactory]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from scripts import _bootstrap
+
+
+async def _loop_type_name() -> str:
+    return type(asyncio.get_running_loop()).__module__
+
+
+def test_run_falls_back_to_stock_loop_without_uvloop(monkeypatch) -> None:
+    monkeypatch.setattr(_bootstrap, "uvloop", None)
+
+    assert _bootstrap.run(_loop_type_name()).startswith("asyncio")
+
+
+def test_run_uses_uvloop_when_available() -> None:
+    pytest.importorskip("uvloop")
+
+    assert _bootstrap.run(_loop_type_name()).startswith("uvloop")
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+from scripts import health_check
+
+
+def test_missing_env_fails_before_importing_supabase(monkeypatch) -> None:
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    monkeypatch.delitem(sys.modules, "core.system_control.supabase_manager", raising=False)
+
+    assert asyncio.run(health_check.check_health()) is False
+    assert "core.system_control.supabase_manager" not in sys.modules
+
+
+def test_missing_env_is_rechecked_on_every_probe(monkeypatch) -> None:
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    assert health_check._missing_env() == ("SUPABASE_URL",)
+
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    assert health_check._missing_env() == ()
+
+
+def test_probes_share_one_supabase_manager(monkeypatch) -> None:
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    monkeypatch.setattr(health_check, "_manager", None)
+    built = []
+
+    class _FakeManager:
+        def __init__(self) -> None:
+            built.append(self)
+            self.client = object()
+
+    fake_module = types.ModuleType("core.system_control.supabase_manager")
+    fake_module.SupabaseManager = _FakeManager
+    monkeypatch.setitem(sys.modules, "core.system_control.supabase_manager", fake_module)
+
+    assert health_check.check_health_once() is True
+    assert health_check.check_health_once() is True
+    assert len(built) == 1
+
+
+def test_probe_rebuilds_manager_without_client(monkeypatch) -> None:
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "key")
+    monkeypatch.setattr(health_check, "_manager", None)
+    clients = [None, object()]
+
+    class _FakeManager:
+        def __init__(self) -> None:
+            self.client = clients.pop(0)
+
+    fake_module = types.ModuleType("core.system_control.supabase_manager")
+    fake_module.SupabaseManager = _FakeManager
+    monkeypatch.setitem(sys.modules, "core.system_control.supabase_manager", fake_module)
+
+    assert health_check.check_health_once() is False
+    assert health_check.check_health_once() is True
+    assert clients == []
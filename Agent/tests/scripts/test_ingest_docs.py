@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture
+def ingest_docs(monkeypatch):
+    fake_db_module = types.ModuleType("core.system_control.supabase_manager")
+    fake_db_module.SupabaseManager = lambda: types.SimpleNamespace(client=None)
+    monkeypatch.setitem(sys.modules, "core.system_control.supabase_manager", fake_db_module)
+    monkeypatch.delitem(sys.modules, "core.intelligence.rag_engine", raising=False)
+    monkeypatch.delitem(sys.modules, "scripts.ingest_docs", raising=False)
+    module = importlib.import_module("scripts.ingest_docs")
+    yield module
+    sys.modules.pop("scripts.ingest_docs", None)
+    sys.modules.pop("core.intelligence.rag_engine", None)
+
+
+async def _collect(agen) -> list:
+    return [item async for item in agen]
+
+
+def test_iter_paragraphs_splits_on_blank_lines(ingest_docs, tmp_path) -> None:
+    doc = tmp_path / "doc.md"
+    doc.write_text("first line\nstill first\n\n\nsecond\n\nthird", encoding="utf-8")
+
+    paragraphs = asyncio.run(_collect(ingest_docs.iter_paragraphs(doc)))
+
+    assert paragraphs == ["first line\nstill first", "second", "third"]
+
+
+def test_ingest_file_pushes_fixed_size_batches_in_order(ingest_docs, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(ingest_docs, "BATCH_SIZE", 2)
+    doc = tmp_path / "doc.md"
+    doc.write_text("\n\n".join(f"p{i}" for i in range(5)), encoding="utf-8")
+    calls = []
+
+    class _FakeEngine:
+        async def add_documents(self, batch):
+            calls.append([(d["content"], d["metadata"]["chunk_index"]) for d in batch])
+            return len(calls) != 2
+
+    async def run():
+        progress = asyncio.Queue()
+        summary = await ingest_docs._ingest_file(_FakeEngine(), doc, asyncio.Semaphore(1), progress)
+        reports = [progress.get_nowait() for _ in range(progress.qsize())]
+        return summary, reports
+
+    summary, reports = asyncio.run(run())
+
+    assert calls == [[("p0", 0), ("p1", 1)], [("p2", 2), ("p3", 3)], [("p4", 4)]]
+    assert summary == ("doc.md", 3, 5)
+    assert sorted(reports) == [
+        ("doc.md", 0, 2, True),
+        ("doc.md", 2, 2, False),
+        ("doc.md", 4, 1, True),
+    ]
@@ -0,0 +1,45 @@
+from telemetry.chaos_guardrails import ChaosGuardrails, GuardrailLimits, reset_chaos_guardrails
+
+
+def test_token_budget_accumulates_and_trips():
+    guardrails = ChaosGuardrails(GuardrailLimits(max_tokens_per_session=100))
+
+    assert guardrails.check_token_budget(30, 20) is True
+    assert guardrails.check_token_budget(40, 0) is True
+    assert guardrails.total_tokens_used == 90
+    assert guardrails.check_token_budget(5, 5) is False
+    assert guardrails.should_stop() is True
+
+
+def test_consecutive_failures_trip_and_success_resets():
+    guardrails = ChaosGuardrails(GuardrailLimits(max_consecutive_failures=2))
+
+    assert guardrails.record_failure() is True
+    guardrails.record_success()
+    assert guardrails.record_failure() is True
+    assert guardrails.record_failure() is False
+    assert guardrails.should_stop() is True
+
+
+def test_retry_limit_and_reset_with_new_limits():
+    guardrails = reset_chaos_guardrails(GuardrailLimits(max_retries_per_request=3))
+
+    assert guardrails.check_retry_limit(2) is True
+    assert guardrails.check_retry_limit(3) is False
+
+    fresh = reset_chaos_guardrails(GuardrailLimits(max_retries_per_request=10))
+    assert fresh.check_retry_limit(3) is True
+    assert fresh.get_status()["emergency_stop"] is False
+
+
+def test_session_duration_uses_monotonic_clock(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("telemetry.chaos_guardrails.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("telemetry.chaos_guardrails.time.time", lambda: 0.0)
+    guardrails = ChaosGuardrails(GuardrailLimits(max_session_duration_seconds=10))
+
+    clock[0] += 5
+    assert guardrails.check_session_duration() is True
+    assert guardrails.get_status()["session_duration"] == 5
+    clock[0] += 5
+    assert guardrails.check_session_duration() is False
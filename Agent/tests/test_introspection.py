@@ -0,0 +1,36 @@
+import importlib
+import importlib.util
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def livekit_llm():
+    return pytest.importorskip("livekit.agents.llm")
+
+
+@pytest.mark.parametrize(
+    "content, accepted",
+    [
+        ("hello", False),
+        (["hello"], True),
+        ([{"type": "text", "text": "hello"}], False),
+    ],
+    ids=["str", "list-str", "list-dict"],
+)
+def test_chat_message_content_forms(livekit_llm, content, accepted):
+    try:
+        msg = livekit_llm.ChatMessage(role="user", content=content)
+    except Exception:
+        assert not accepted
+    else:
+        assert accepted
+        assert msg.content == content
+
+
+@pytest.mark.parametrize("module", ["livekit.agents", "chromadb"])
+def test_livekit_and_chromadb_import_together(livekit_llm, module):
+    # livekit is loaded first by the fixture, mirroring the agent startup order
+    if importlib.util.find_spec(module) is None:
+        pytest.skip(f"{module} not installed")
+    assert importlib.import_module(module) is not None
@@ -0,0 +1,91 @@
+import concurrent.futures
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+
+class _FakeQuery:
+    def __init__(self, inserted: list) -> None:
+        self._inserted = inserted
+
+    def insert(self, rows):
+        self._inserted.append(rows)
+        return self
+
+    def execute(self):
+        return types.SimpleNamespace(data=self._inserted[-1])
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.inserted = []
+
+    def table(self, _name: str) -> _FakeQuery:
+        return _FakeQuery(self.inserted)
+
+
+@pytest.fixture
+def rag_engine(monkeypatch):
+    fake_db_module = types.ModuleType("core.system_control.supabase_manager")
+    fake_db_module.SupabaseManager = lambda: types.SimpleNamespace(client=_FakeClient())
+    monkeypatch.setitem(sys.modules, "core.system_control.supabase_manager", fake_db_module)
+    monkeypatch.delitem(sys.modules, "core.intelligence.rag_engine", raising=False)
+    module = importlib.import_module("core.intelligence.rag_engine")
+    monkeypatch.setattr(module, "HAS_SENTENCE_TRANSFORMERS", False)
+    yield module
+    sys.modules.pop("core.intelligence.rag_engine", None)
+
+
+@pytest.mark.asyncio
+async def test_add_documents_embeds_off_the_event_loop(rag_engine):
+    engine = rag_engine.RAGEngine()
+    encode_threads = []
+
+    class _FakeModel:
+        def encode(self, texts):
+            encode_threads.append(threading.get_ident())
+            return types.SimpleNamespace(tolist=lambda: [[float(len(t))] for t in texts])
+
+    engine.model = _FakeModel()
+
+    added = await engine.add_documents(
+        [{"content": "alpha", "metadata": {"source": "a.md"}}, {"content": "be"}]
+    )
+
+    assert added is True
+    assert encode_threads and encode_threads[0] != threading.get_ident()
+    assert engine.db.client.inserted == [
+        [
+            {"content": "alpha", "metadata": {"source": "a.md"}, "embedding": [5.0]},
+            {"content": "be", "metadata": {}, "embedding": [2.0]},
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_add_documents_without_client_or_documents(rag_engine):
+    engine = rag_engine.RAGEngine()
+    assert await engine.add_documents([]) is True
+
+    engine.db.client = None
+    assert await engine.add_documents([{"content": "alpha"}]) is False
+
+
+def test_get_rag_engine_builds_one_instance_across_threads(rag_engine, monkeypatch):
+    built = []
+
+    class _SlowEngine:
+        def __init__(self) -> None:
+            time.sleep(0.05)
+            built.append(self)
+
+    monkeypatch.setattr(rag_engine, "RAGEngine", _SlowEngine)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        engines = list(pool.map(lambda _: rag_engine.get_rag_engine(), range(4)))
+
+    assert len(built) == 1
+    assert all(engine is built[0] for engine in engines)
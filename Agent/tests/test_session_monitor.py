@@ -0,0 +1,306 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+from telemetry import session_monitor as sm
+from telemetry.session_monitor import PERCENTILE_EVERY, SessionMonitor
+
+
+@pytest.fixture
+def monitor():
+    return SessionMonitor()
+
+
+def _turn(monitor, **metrics):
+    monitor.start_request()
+    for name, value in metrics.items():
+        monitor.record_metric(name, value)
+    monitor.end_request()
+
+
+def test_history_is_bounded_but_turns_keep_counting(monkeypatch):
+    monkeypatch.setattr(sm, "METRICS_HISTORY_SIZE", 3)
+    monitor = SessionMonitor()
+
+    for _ in range(5):
+        _turn(monitor)
+
+    assert len(monitor.metrics_history) == 3
+    assert monitor.turn_counter == 5
+
+
+def test_recovery_turns_counted_from_degradation(monitor):
+    _turn(monitor)
+    _turn(monitor, llm_latency=6.0)
+    _turn(monitor, llm_latency=6.0)
+    for _ in range(3):
+        _turn(monitor)
+
+    assert monitor.in_recovery is False
+    assert monitor.metrics_history[-1].system_recovery_turns == 4
+
+
+def test_numeric_columns_wrap_with_the_history(monkeypatch):
+    monkeypatch.setattr(sm, "METRICS_HISTORY_SIZE", 2)
+    monitor = SessionMonitor()
+
+    for latency in (1.0, 2.0, 3.0):
+        _turn(monitor, llm_latency=latency, context_size=int(latency * 100))
+
+    assert monitor._write_idx == 3
+    assert monitor._col_llm_latency.tolist() == [3.0, 2.0]
+    assert monitor._col_context_size.tolist() == [300, 200]
+    assert not hasattr(monitor.metrics_history[-1], "__dict__")
+
+
+def test_record_metric_increments_and_ignores_unknown_names(monitor, caplog):
+    monitor.start_request()
+    monitor.record_metric("tool_calls_count", 1, increment=True)
+    monitor.record_metric("tool_calls_count", 2, increment=True)
+    monitor.record_metric("not_a_metric", 1)
+
+    assert monitor.current_metrics.tool_calls_count == 3
+    assert [(r.getMessage(), r.metric) for r in caplog.records] == [("unknown_metric", "not_a_metric")]
+
+
+def test_threshold_breach_is_logged_by_severity(monitor, caplog):
+    monitor.start_request()
+    caplog.clear()
+    monitor.record_metric("llm_latency", 6.0)
+    monitor.record_metric("stream_first_chunk_latency", 5.0)
+    monitor.record_metric("tokens_out", 10_000)
+
+    assert [(r.levelname, r.metric, r.severity) for r in caplog.records] == [
+        ("WARNING", "llm_latency", "warning"),
+        ("ERROR", "stream_first_chunk_latency", "critical"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "metric, value",
+    [
+        ("context_size", 8500),
+        ("llm_latency", 5.0),
+        ("stream_first_chunk_latency", 2.5),
+        ("retry_count", 1),
+        ("memory_retrieval_count", 2),
+    ],
+)
+def test_any_warning_breach_starts_recovery_tracking(monitor, metric, value):
+    _turn(monitor, **{metric: value})
+
+    assert monitor.in_recovery is True
+    assert monitor.consecutive_healthy_turns == 0
+
+
+def test_memory_retrieval_count_is_threshold_checked(monitor, caplog):
+    monitor.start_request()
+    caplog.clear()
+    for _ in range(5):
+        monitor.record_metric("memory_retrieval_count", 1, increment=True)
+
+    assert [r.levelname for r in caplog.records] == ["WARNING", "WARNING", "WARNING", "ERROR"]
+
+
+def test_request_elapsed_uses_monotonic_clock(monitor, monkeypatch):
+    clock = [5_000_000_000]
+    monkeypatch.setattr(sm, "_CLOCK", lambda: clock[0])
+    monitor.start_request()
+    clock[0] += 1_500_000_000
+
+    assert monitor.request_elapsed() == pytest.approx(1.5)
+
+
+@pytest.mark.asyncio
+async def test_end_request_hands_off_to_drain_task(monitor):
+    _turn(monitor, llm_latency=1.0)
+
+    assert len(monitor.metrics_history) == 0
+    await monitor.flush()
+    assert len(monitor.metrics_history) == 1
+    assert monitor.turn_counter == 1
+    assert monitor.drain_stats["writes_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_processes_backlog_inline_in_order(monitor, monkeypatch):
+    monkeypatch.setattr(sm, "DRAIN_QUEUE_SIZE", 2)
+    for latency in (1.0, 2.0, 3.0):
+        _turn(monitor, llm_latency=latency)
+
+    assert monitor.drain_stats["queue_full_total"] == 1
+    assert [m.llm_latency for m in monitor.metrics_history] == [1.0, 2.0, 3.0]
+    await monitor.flush()
+    assert monitor.turn_counter == 3
+
+
+def test_concurrent_increments_are_not_lost(monitor):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monitor.start_request()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: monitor.record_metric("tool_calls_count", 1, increment=True), range(2000)))
+
+    assert monitor.current_metrics.tool_calls_count == 2000
+
+
+def test_start_request_does_not_recycle_finished_metrics(monitor):
+    _turn(monitor, llm_latency=1.0)
+    monitor.start_request()
+    monitor.record_metric("llm_latency", 2.0)
+
+    assert monitor.metrics_history[-1].llm_latency == 1.0
+    assert monitor.current_metrics is not monitor.metrics_history[-1]
+
+
+def test_rolling_percentiles_cover_latest_window(monitor):
+    for latency in range(1, 201):
+        monitor.start_request()
+        monitor.record_metric("llm_latency", float(latency))
+        monitor._process_request(monitor.current_metrics)
+
+    p = monitor.compute_rolling_percentiles(window=100)
+
+    # last 100 requests are latencies 101..200
+    assert p["llm_latency"] == {"p95": 195.0, "p99": 199.0}
+    # refreshed automatically at turn 200 over the default window (all 200 requests)
+    assert monitor.rolling_percentiles["llm_latency"]["p99"] == 198.0
+
+
+def test_rolling_percentiles_empty_without_requests(monitor):
+    assert monitor.compute_rolling_percentiles() == {}
+
+
+def test_request_metrics_log_carries_fields_as_extra(monitor, caplog):
+    caplog.set_level("INFO", logger="telemetry.session_monitor")
+    _turn(monitor, tokens_out=42)
+
+    record = next(r for r in caplog.records if r.getMessage() == "request_metrics")
+    assert record.metrics["tokens_out"] == 42
+    assert set(record.metrics) == {f.name for f in dataclasses.fields(sm.RequestMetrics)}
+
+
+@pytest.fixture
+def telemetry_env(monkeypatch):
+    monkeypatch.delenv("MAYA_TELEMETRY_CHECKPOINT_DIR", raising=False)
+    monkeypatch.delenv("MAYA_TELEMETRY_SESSION", raising=False)
+    sm.get_session_monitor.cache_clear()
+    yield monkeypatch
+    sm.get_session_monitor().close()
+    sm.get_session_monitor.cache_clear()
+
+
+def test_get_session_monitor_is_shared_and_in_memory_by_default(telemetry_env):
+    assert sm.get_session_monitor() is sm.get_session_monitor()
+    assert SessionMonitor() is not sm.get_session_monitor()
+    assert sm.get_session_monitor()._header is None
+
+
+def test_get_session_monitor_checkpoints_when_opted_in(telemetry_env, tmp_path):
+    telemetry_env.setenv("MAYA_TELEMETRY_CHECKPOINT_DIR", str(tmp_path))
+    telemetry_env.setenv("MAYA_TELEMETRY_SESSION", "agent/1")
+
+    assert sm.get_session_monitor()._header is not None
+    assert (tmp_path / "session-agent_1.ring").exists()
+
+
+def test_checkpoint_restores_ring_and_recovery_state(tmp_path):
+    first = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+    _turn(first, llm_latency=1.0)
+    _turn(first, llm_latency=6.0)
+    _turn(first, llm_latency=2.0)
+    first.close()
+
+    resumed = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+
+    assert resumed.turn_counter == 3
+    assert resumed._write_idx == 3
+    assert resumed.in_recovery is True
+    assert resumed.recovery_start_turn == 2
+    assert resumed.consecutive_healthy_turns == 1
+    assert resumed.compute_rolling_percentiles()["llm_latency"]["p99"] == 2.0
+    resumed.close()
+
+
+def test_checkpoint_is_exclusive_to_one_monitor(tmp_path):
+    owner = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+    _turn(owner, llm_latency=6.0)
+
+    contender = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+    other_session = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s2")
+
+    assert contender._header is None
+    assert contender.turn_counter == 0 and contender.in_recovery is False
+    assert other_session._header is not None
+    assert other_session.turn_counter == 0
+    owner.close()
+    other_session.close()
+
+
+def test_checkpoint_with_other_layout_starts_fresh(tmp_path, monkeypatch):
+    first = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+    _turn(first, llm_latency=1.0)
+    first.close()
+    monkeypatch.setattr(sm, "METRICS_HISTORY_SIZE", 8)
+
+    fresh = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+
+    assert fresh.turn_counter == 0
+    assert len(fresh._col_llm_latency) == 8
+    fresh.close()
+
+
+def test_checkpoint_with_foreign_header_is_not_restored(tmp_path):
+    first = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+    _turn(first, llm_latency=6.0)
+    first.close()
+    header = sm.np.memmap(tmp_path / "session-s1.hdr", dtype=sm.np.int64, mode="r+")
+    header[0] = 0
+    header.flush()
+    del header
+
+    fresh = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+
+    assert fresh.turn_counter == 0
+    assert fresh.in_recovery is False
+    fresh.close()
+
+
+def test_reset_clears_ring_recovery_and_checkpoint_state(tmp_path):
+    monitor = SessionMonitor(checkpoint_dir=str(tmp_path), checkpoint_key="s1")
+    for _ in range(PERCENTILE_EVERY):
+        _turn(monitor, llm_latency=6.0)
+    assert monitor.in_recovery and monitor.rolling_percentiles
+
+    monitor.reset()
+
+    assert len(monitor.metrics_history) == 0
+    assert (monitor.turn_counter, monitor._write_idx, monitor.recovery_start_turn) == (0, 0, 0)
+    assert monitor.in_recovery is False and monitor.consecutive_healthy_turns == 0
+    assert monitor.rolling_percentiles == {}
+    assert not monitor._col_llm_latency.any()
+    assert monitor._header[4:].tolist() == [0, 0, 0, 0, 0]
+    monitor.close()
+
+
+@pytest.mark.asyncio
+async def test_reset_discards_queued_requests(monitor):
+    _turn(monitor, llm_latency=6.0)
+    monitor.reset()
+    await monitor.flush()
+
+    assert monitor.turn_counter == 0
+    assert monitor.in_recovery is False
+
+
+@pytest.mark.asyncio
+async def test_close_processes_backlog_and_cancels_drain_task(monitor):
+    _turn(monitor, llm_latency=1.0)
+    task = monitor._drain_task
+
+    monitor.close()
+    await asyncio.sleep(0)
+
+    assert monitor.turn_counter == 1
+    assert task.cancelled()
@@ -1,4 +1,9 @@
-from providers import sttprovider
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from providers import _plugins, sttprovider
 import agent
 
 
@@ -62,3 +67,127 @@ def test_transcript_validation_accepts_good_input():
     assert sttprovider.is_valid_voice_transcript("What is the weather in Hyderabad?")
     assert sttprovider.is_valid_voice_transcript("Open downloads folder")
     assert sttprovider.is_valid_voice_transcript("Set a reminder for 8pm")
+
+
+def test_plugin_modules_are_imported_once(monkeypatch):
+    fake_groq = object()
+    monkeypatch.setitem(sys.modules, "livekit.plugins.groq", fake_groq)
+    monkeypatch.setattr(_plugins, "_PLUGIN_CACHE", {})
+    assert sttprovider._require_plugin("groq") is fake_groq  # pylint: disable=protected-access
+    monkeypatch.delitem(sys.modules, "livekit.plugins.groq")
+    assert sttprovider._require_plugin("groq") is fake_groq  # pylint: disable=protected-access
+
+
+def test_missing_plugin_reports_install_hint(monkeypatch):
+    monkeypatch.setitem(sys.modules, "livekit.plugins.assemblyai", None)
+    monkeypatch.setattr(_plugins, "_PLUGIN_CACHE", {})
+    with pytest.raises(ImportError, match="pip install livekit-plugins-assemblyai"):
+        sttprovider._require_plugin("assemblyai")  # pylint: disable=protected-access
+
+
+def test_validate_api_key_is_memoized_until_invalidated(monkeypatch):
+    sttprovider.invalidate_env_cache()
+    monkeypatch.setenv("GROQ_API_KEY", "gsk-first")
+    assert sttprovider._validate_api_key("GROQ_API_KEY", "Groq") == "gsk-first"  # pylint: disable=protected-access
+
+    monkeypatch.setenv("GROQ_API_KEY", "gsk-second")
+    assert sttprovider._validate_api_key("GROQ_API_KEY", "Groq") == "gsk-first"  # pylint: disable=protected-access
+
+    sttprovider.invalidate_env_cache()
+    assert sttprovider._validate_api_key("GROQ_API_KEY", "Groq") == "gsk-second"  # pylint: disable=protected-access
+
+
+def test_missing_api_key_is_not_memoized(monkeypatch):
+    sttprovider.invalidate_env_cache()
+    monkeypatch.delenv("DEEPGRAM_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="DEEPGRAM_API_KEY not found"):
+        sttprovider._validate_api_key("DEEPGRAM_API_KEY", "Deepgram")  # pylint: disable=protected-access
+
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "dg-key")
+    assert sttprovider._validate_api_key("DEEPGRAM_API_KEY", "Deepgram") == "dg-key"  # pylint: disable=protected-access
+    sttprovider.invalidate_env_cache()
+
+
+def test_every_stt_provider_value_has_a_handler():
+    for provider in sttprovider.STTProvider:
+        assert provider.value in sttprovider._STT_DISPATCH  # pylint: disable=protected-access
+
+
+def test_unknown_stt_provider_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported STT provider"):
+        sttprovider.get_stt_provider("not-a-provider")
+
+
+def test_stt_provider_info_is_built_on_demand():
+    info = sttprovider.STT_PROVIDER_INFO
+    assert info is sttprovider._provider_info()  # pylint: disable=protected-access
+    assert info["groq"]["plugin"] == "livekit-plugins-groq"
+    with pytest.raises(TypeError):
+        info["groq"]["plugin"] = "other"  # type: ignore[index]
+
+
+def test_aws_transcribe_maps_and_rejects_language_codes(monkeypatch):
+    fake_aws = MagicMock()
+    monkeypatch.setattr(sttprovider, "_require_plugin", lambda name: fake_aws)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "id")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+
+    sttprovider._get_aws_transcribe_stt("pt", "")  # pylint: disable=protected-access
+    assert fake_aws.STT.call_args.kwargs["language_code"] == "pt-BR"
+
+    with pytest.raises(ValueError, match="Supported 2-letter codes: ar, da, de"):
+        sttprovider._get_aws_transcribe_stt("xx", "")  # pylint: disable=protected-access
+    sttprovider.invalidate_env_cache()
+
+
+class _Unhashable:
+    __hash__ = None
+
+
+def test_get_stt_provider_reuses_instances_per_arguments(monkeypatch):
+    sttprovider.clear_stt_cache()
+    handler = MagicMock(side_effect=lambda language, model, **kwargs: MagicMock())
+    monkeypatch.setitem(sttprovider._STT_DISPATCH, "groq", handler)  # pylint: disable=protected-access
+
+    first = sttprovider.get_stt_provider("groq", "en", "", detect_language=False)
+    second = sttprovider.get_stt_provider("Groq ", "en", "", detect_language=False)
+    other_language = sttprovider.get_stt_provider("groq", "hi", "")
+    fresh = sttprovider.get_stt_provider("groq", "en", "", use_cache=False, detect_language=False)
+    unhashable = sttprovider.get_stt_provider("groq", "en", "", callback_state=_Unhashable())
+
+    assert first is second
+    assert other_language is not first
+    assert fresh is not first
+    assert unhashable is not first
+    assert handler.call_count == 4
+    sttprovider.get_stt_provider.cache_clear()
+    assert sttprovider.get_stt_provider("groq", "en", "", detect_language=False) is not first
+
+
+def test_region_lookup_is_cached_until_invalidated(monkeypatch):
+    sttprovider.invalidate_env_cache()
+    monkeypatch.setenv("AZURE_SPEECH_REGION", "westeurope")
+    assert sttprovider._get_env("AZURE_SPEECH_REGION", "eastus") == "westeurope"  # pylint: disable=protected-access
+
+    monkeypatch.delenv("AZURE_SPEECH_REGION")
+    assert sttprovider._get_env("AZURE_SPEECH_REGION", "eastus") == "westeurope"  # pylint: disable=protected-access
+
+    sttprovider.invalidate_env_cache()
+    assert sttprovider._get_env("AZURE_SPEECH_REGION", "eastus") == "eastus"  # pylint: disable=protected-access
+
+
+def test_equivalent_stt_kwargs_share_a_cached_instance(monkeypatch):
+    sttprovider.clear_stt_cache()
+    seen = []
+    handler = MagicMock(side_effect=lambda language, model, **kwargs: seen.append(kwargs) or MagicMock())
+    monkeypatch.setitem(sttprovider._STT_DISPATCH, "deepgram", handler)  # pylint: disable=protected-access
+
+    first = sttprovider.get_stt_provider("deepgram", keywords=[("maya", 2.0)], smart_format=True)
+    second = sttprovider.get_stt_provider("deepgram", smart_format=True, keywords=[("maya", 2.0)])
+    as_tuple = sttprovider.get_stt_provider("deepgram", smart_format=True, keywords=(("maya", 2.0),))
+
+    assert first is second
+    assert as_tuple is not first
+    assert handler.call_count == 2
+    assert seen[0]["keywords"] == [("maya", 2.0)]
+    sttprovider.clear_stt_cache()
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from core.observability.structured_logging import StructuredFormatter
 from core.observability.trace_context import (
     clear_trace_context,
     current_trace_id,
@@ -54,6 +55,23 @@ def test_enable_trace_logging_injects_trace_fields_on_records():
     assert record.user_id == "u1"
 
 
+def test_structured_formatter_appends_extra_fields_only():
+    logger = logging.getLogger("trace_test")
+    record = logger.makeRecord(
+        "trace_test", logging.INFO, __file__, 1, "worker_event", (), None,
+        extra={"task_id": "t1", "metrics": {"tokens_out": 3}},
+    )
+    formatter = StructuredFormatter("%(levelname)s:%(message)s")
+
+    line = formatter.format(record)
+    text, payload = line.split(" ", 1)
+    assert text == "INFO:worker_event"
+    assert json.loads(payload) == {"metrics": {"tokens_out": 3}}
+
+    plain = logger.makeRecord("trace_test", logging.INFO, __file__, 1, "plain", (), None)
+    assert formatter.format(plain) == "INFO:plain"
+
+
 @pytest.mark.asyncio
 async def test_sqlite_taskstore_create_includes_trace_id(tmp_path: Path):
     clear_trace_context()